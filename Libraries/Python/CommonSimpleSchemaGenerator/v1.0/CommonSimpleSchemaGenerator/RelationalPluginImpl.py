@@ -17,7 +17,6 @@
 
 import inspect
 import os
-import pickle
 
 from collections import namedtuple
 
@@ -43,6 +42,8 @@ from CommonEnvironment.TypeInfo.FundamentalTypes.StringTypeInfo import StringTyp
 from SimpleSchemaGenerator.Schema.Attributes import Attribute
 from SimpleSchemaGenerator.Schema.Elements import CompoundElement, ExtensionElement, FundamentalElement, ListElement, ReferenceElement
 from SimpleSchemaGenerator.Schema.Exceptions import SimpleSchemaException
+from SimpleSchemaGenerator.Schema.Impl.Fingerprint import CalculateFingerprint
+from SimpleSchemaGenerator.Schema.Parse import ParseFiles
 from SimpleSchemaGenerator.Plugin import Plugin as PluginBase, ParseFlag, Extension
 
 # ----------------------------------------------------------------------
@@ -544,7 +545,23 @@ class RelationalPluginImpl(PluginBase):
         # Augment all elements with their corresponding relational elements
         all_objects = []
 
-        all_elements = pickle.loads(context["pickled_elements"])
+        # The elements are augmented in place; they are the same elements passed to Generate.
+        all_elements = cls.GetContextElements(context)
+        if all_elements is None:
+            # The elements are no longer available (this will happen if the context was
+            # created by a different process); parse them again.
+            all_elements = ParseFiles(
+                context["inputs"],
+                cls,
+                context["filter_unsupported_extensions"],
+                context["filter_unsupported_attributes"],
+            )
+
+            if CalculateFingerprint(all_elements) != context["elements_fingerprint"]:
+                raise Exception("The input has changed since the context was created")
+
+            # Make the elements available when the context is invoked
+            cls.SetContextElements(context, all_elements)
 
         # Pass 1: Create objects
         for element in _EnumCompoundElements(all_elements):
@@ -0,0 +1,142 @@
+# ----------------------------------------------------------------------
+# |
+# |  MsgpackSerialization.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-02 09:14:27
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the MsgpackSerialization object"""
+
+import datetime
+import os
+import struct
+import uuid
+
+import six
+
+try:
+    import msgpack
+except ImportError:
+    raise ImportError("MsgpackSerialization requires the 'msgpack' package, which is not installed")
+
+import CommonEnvironment
+from CommonEnvironment.TypeInfo.FundamentalTypes.All import BoolTypeInfo, \
+                                                            DateTimeTypeInfo, \
+                                                            DurationTypeInfo, \
+                                                            FloatTypeInfo, \
+                                                            GuidTypeInfo, \
+                                                            IntTypeInfo
+
+from CommonEnvironment.TypeInfo.FundamentalTypes.Serialization.StringSerialization import StringSerialization
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class MsgpackSerialization(StringSerialization):
+    """\
+    Serialization of MessagePack types.
+
+    Datetimes, durations, and guids are serialized as python objects that are
+    packed as MessagePack extension types (see `ToExtType` and `FromExtType`)
+    rather than as strings.
+    """
+
+    NATIVE_TYPES                            = (
+        BoolTypeInfo,
+        DateTimeTypeInfo,
+        DurationTypeInfo,
+        FloatTypeInfo,
+        GuidTypeInfo,
+        IntTypeInfo,
+    )
+
+    # Application-specific extension types; datetimes with time zone information
+    # use the MessagePack timestamp extension type (-1).
+    NAIVE_DATETIME_EXT_TYPE                 = 1
+    DURATION_EXT_TYPE                       = 2
+    GUID_EXT_TYPE                           = 3
+
+    _EPOCH                                  = datetime.datetime(1970, 1, 1)
+    _UTC_EPOCH                              = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def ToExtType(cls, item):
+        """\
+        Returns the MessagePack extension type for a datetime, duration, or guid; returns
+        None for all other items.
+        """
+
+        if isinstance(item, datetime.datetime):
+            # Calculate the timestamp with integer arithmetic, as float timestamps can't
+            # represent microseconds accurately.
+            if item.tzinfo is None:
+                delta = item - cls._EPOCH
+            else:
+                delta = item - cls._UTC_EPOCH
+
+            timestamp = msgpack.Timestamp(delta.days * 86400 + delta.seconds, delta.microseconds * 1000)
+
+            if item.tzinfo is None:
+                return msgpack.ExtType(cls.NAIVE_DATETIME_EXT_TYPE, timestamp.to_bytes())
+
+            return timestamp
+
+        if isinstance(item, datetime.timedelta):
+            return msgpack.ExtType(
+                cls.DURATION_EXT_TYPE,
+                struct.pack(">q", (item.days * 86400 + item.seconds) * 1000000 + item.microseconds),
+            )
+
+        if isinstance(item, uuid.UUID):
+            return msgpack.ExtType(cls.GUID_EXT_TYPE, item.bytes)
+
+        return None
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromExtType(cls, code, data):
+        """Converts a MessagePack extension type created by `ToExtType` back into the original item"""
+
+        if code == cls.NAIVE_DATETIME_EXT_TYPE:
+            timestamp = msgpack.Timestamp.from_bytes(data)
+            return cls._EPOCH + datetime.timedelta(seconds=timestamp.seconds, microseconds=timestamp.nanoseconds // 1000)
+
+        if code == cls.DURATION_EXT_TYPE:
+            return datetime.timedelta(microseconds=struct.unpack(">q", data)[0])
+
+        if code == cls.GUID_EXT_TYPE:
+            return uuid.UUID(bytes=data)
+
+        return msgpack.ExtType(code, data)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _SerializeItemImpl(cls, type_info, item, **custom_kwargs):
+        # No need to convert those types that MessagePack supports natively
+        if not isinstance(item, six.string_types) and isinstance(type_info, cls.NATIVE_TYPES):
+            return item
+
+        return super(MsgpackSerialization, cls)._SerializeItemImpl(type_info, item, **custom_kwargs)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _DeserializeItemImpl(cls, type_info, item, **custom_kwargs):
+        # No need to convert those types that MessagePack supports natively
+        if not isinstance(item, six.string_types) and isinstance(type_info, cls.NATIVE_TYPES):
+            return item
+
+        return super(MsgpackSerialization, cls)._DeserializeItemImpl(type_info, item, **custom_kwargs)
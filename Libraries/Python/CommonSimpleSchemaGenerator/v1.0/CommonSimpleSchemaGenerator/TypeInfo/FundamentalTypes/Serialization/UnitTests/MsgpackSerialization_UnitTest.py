@@ -0,0 +1,128 @@
+# ----------------------------------------------------------------------
+# |
+# |  MsgpackSerialization_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-02 10:02:51
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for MsgpackSerialization"""
+
+import datetime
+import os
+import sys
+import unittest
+import uuid
+
+import msgpack
+
+import CommonEnvironment
+from CommonEnvironment.TypeInfo.FundamentalTypes.All import *
+
+from CommonSimpleSchemaGenerator.TypeInfo.FundamentalTypes.Serialization.MsgpackSerialization import *
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_Native(self):
+        for type_info, item in [
+            (BoolTypeInfo(), True),
+            (DateTimeTypeInfo(), datetime.datetime(2019, 2, 11, 17, 0, 0)),
+            (DurationTypeInfo(), datetime.timedelta(1, 82862, 3)),
+            (FloatTypeInfo(), 100.1),
+            (GuidTypeInfo(), uuid.UUID("f638e451-c276-479a-aaa0-c699e35196fb")),
+            (IntTypeInfo(), -10),
+        ]:
+            self.assertTrue(MsgpackSerialization.SerializeItem(type_info, item) is item)
+            self.assertTrue(MsgpackSerialization.DeserializeItem(type_info, item) is item)
+
+    # ----------------------------------------------------------------------
+    def test_Strings(self):
+        self.assertEqual(MsgpackSerialization.SerializeItem(DateTypeInfo(), datetime.date(2019, 2, 11)), "2019-02-11")
+        self.assertEqual(MsgpackSerialization.SerializeItem(TimeTypeInfo(), datetime.time(10, 11, 12)), "10:11:12")
+
+        self.assertEqual(MsgpackSerialization.DeserializeItem(DateTimeTypeInfo(), "2019-02-11T17:00:00"), datetime.datetime(2019, 2, 11, 17, 0, 0))
+        self.assertEqual(MsgpackSerialization.DeserializeItem(GuidTypeInfo(), "f638e451-c276-479a-aaa0-c699e35196fb"), uuid.UUID("f638e451-c276-479a-aaa0-c699e35196fb"))
+        self.assertEqual(MsgpackSerialization.DeserializeItem(IntTypeInfo(), "10"), 10)
+
+
+# ----------------------------------------------------------------------
+class ExtTypeSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_DateTime(self):
+        self.assertEqual(self._RoundTrip(datetime.datetime(2019, 2, 11, 10, 11, 12, 131415)), datetime.datetime(2019, 2, 11, 10, 11, 12, 131415))
+        self.assertEqual(self._RoundTrip(datetime.datetime(1900, 1, 1)), datetime.datetime(1900, 1, 1))
+        self.assertEqual(self._RoundTrip(datetime.datetime(9999, 12, 31, 23, 59, 59, 999999)), datetime.datetime(9999, 12, 31, 23, 59, 59, 999999))
+
+        # Naive datetimes remain naive
+        self.assertTrue(self._RoundTrip(datetime.datetime(2019, 2, 11)).tzinfo is None)
+
+    # ----------------------------------------------------------------------
+    def test_DateTimeWithTimeZone(self):
+        item = datetime.datetime(2019, 2, 11, 10, 11, 12, 131415, tzinfo=datetime.timezone(datetime.timedelta(hours=-8)))
+
+        self.assertTrue(isinstance(MsgpackSerialization.ToExtType(item), msgpack.Timestamp))
+
+        result = self._RoundTrip(item)
+
+        self.assertEqual(result, item)
+        self.assertEqual(result.tzinfo, datetime.timezone.utc)
+
+    # ----------------------------------------------------------------------
+    def test_Duration(self):
+        for item in [
+            datetime.timedelta(1, 82862, 3),
+            datetime.timedelta(0),
+            -datetime.timedelta(days=2, microseconds=1),
+        ]:
+            self.assertEqual(self._RoundTrip(item), item)
+
+    # ----------------------------------------------------------------------
+    def test_Guid(self):
+        item = uuid.UUID("f638e451-c276-479a-aaa0-c699e35196fb")
+
+        self.assertEqual(MsgpackSerialization.ToExtType(item), msgpack.ExtType(MsgpackSerialization.GUID_EXT_TYPE, item.bytes))
+        self.assertEqual(self._RoundTrip(item), item)
+
+    # ----------------------------------------------------------------------
+    def test_Other(self):
+        self.assertEqual(MsgpackSerialization.ToExtType("string"), None)
+        self.assertEqual(MsgpackSerialization.ToExtType(datetime.date(2019, 2, 11)), None)
+
+        self.assertEqual(MsgpackSerialization.FromExtType(100, b"data"), msgpack.ExtType(100, b"data"))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _RoundTrip(item):
+        return msgpack.unpackb(
+            msgpack.packb(item, default=MsgpackSerialization.ToExtType),
+            ext_hook=MsgpackSerialization.FromExtType,
+            timestamp=3,
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -120,5 +120,9 @@ def GetCustomActions(debug, verbose, explicit_configurations):
         CurrentShell.Commands.SymbolicLink(
             os.path.join(_script_dir, "Scripts", "SimpleSchemaGenerator.py"),
             os.path.join(_script_dir, "src", "SimpleSchemaGenerator", "SimpleSchemaGenerator.py"),
-        )
+        ),
+        CurrentShell.Commands.SymbolicLink(
+            os.path.join(_script_dir, "Scripts", "SimpleSchemaGeneratorClient.py"),
+            os.path.join(_script_dir, "src", "SimpleSchemaGenerator", "SimpleSchemaGeneratorClient.py"),
+        ),
     ]
@@ -15,6 +15,9 @@
 """Contains the Plugin object"""
 
 import os
+import threading
+import uuid
+import weakref
 
 from collections import OrderedDict
 
@@ -32,6 +35,12 @@ _script_fullpath                            = CommonEnvironment.ThisFullpath()
 _script_dir, _script_name                   = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
+# The elements associated with contexts that haven't been invoked yet, keyed by the
+# token stored in the context (see `Plugin.SetContextElements`). Entries are released
+# when the context is invoked or discarded.
+_context_elements                           = weakref.WeakKeyDictionary()
+_context_elements_lock                      = threading.Lock()
+
 # ----------------------------------------------------------------------
 class ParseFlag(BitFlagEnum):
     """Flags that communicate the capabilities of a parser"""
@@ -166,6 +175,52 @@ class Plugin(PluginBase):
     ):
         raise Exception("Abstract method")
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def SetContextElements(cls, context, elements):
+        """\
+        Associates the elements with a context created by SimpleSchemaGenerator. The
+        context only contains a fingerprint of the elements (which is used to detect changes);
+        the elements themselves are made available via `GetContextElements`.
+
+        The elements are released when they are removed by `GetContextElements` or when the
+        context is discarded without being invoked.
+        """
+
+        # The token's name begins with an underscore so that it isn't considered when
+        # comparing contexts to detect changes.
+        token = _ContextElementsToken(uuid.uuid4().hex)
+        context["_elements_token"] = token
+
+        with _context_elements_lock:
+            _context_elements[token] = (context["elements_fingerprint"], elements)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def GetContextElements(cls, context, remove=False):
+        """\
+        Returns the elements associated with the context or None if they are no longer available
+        (for example, when the context was created in a different process). Set `remove` when the
+        elements are consumed for the last time.
+        """
+
+        token = context.get("_elements_token", None)
+
+        # The token is a standard string when the context has been copied or persisted
+        if not isinstance(token, _ContextElementsToken):
+            return None
+
+        with _context_elements_lock:
+            if remove:
+                fingerprint, elements = _context_elements.pop(token, (None, None))
+            else:
+                fingerprint, elements = _context_elements.get(token, (None, None))
+
+        if fingerprint != context["elements_fingerprint"]:
+            return None
+
+        return elements
+
     # ----------------------------------------------------------------------
     # |
     # |  Protected Methods
@@ -282,3 +337,19 @@ class Plugin(PluginBase):
             Impl(element, cls.IncludeMapType.Standard)
 
         return include_map
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _ContextElementsToken(str):
+    """\
+    Identifies the elements associated with a context. `_context_elements` only holds weak
+    references to tokens, so the elements are released when the context is discarded.
+    The context is persisted after it is invoked, so tokens are pickled (and copied) as
+    standard strings.
+    """
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        return (str, (str(self),))
@@ -0,0 +1,461 @@
+# ----------------------------------------------------------------------
+# |
+# |  FastPathElementVisitor.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-29 08:41:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the FastPathElementVisitor object"""
+
+import os
+
+import CommonEnvironment
+from CommonEnvironment import Interface
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ....Schema import Elements
+
+    from ..ElementVisitors import ElementVisitor, GetNumpyDataType, IsNumericCollection, ToPythonName
+    from ..Templates import Dedent, LeftJustify
+
+# ----------------------------------------------------------------------
+class FastPathElementVisitor(ElementVisitor):
+    """\
+    Generates module-level functions that are specialized for a schema and its python
+    objects/dicts; these functions are an alternative to the Serializer/Deserializer
+    class methods.
+
+    Child values are accessed directly, arity checks are written in terms of constants,
+    and children are not individually wrapped in try/except blocks. Any error raises
+    `_FastPathException` (or the exception raised by a TypeInfo object) without context;
+    the generated top-level methods catch these exceptions and invoke the standard
+    implementation, which produces errors that are decorated with the location of the
+    problem.
+
+    Elements that aren't fundamental or compound (variants, lists, any, simple, and
+    dictionaries) are delegated to the standard implementation.
+
+    Collections of fundamental values are converted inline: the collection is validated as
+    a whole (see `_AreValidFundamentalItems`) and the items are converted with an
+    unconstrained TypeInfo object. SerializeItem and DeserializeItem still validate the type
+    of each item, so the benefit is greatest for compounds with many fundamental children
+    and for constrained collections; collections of unconstrained values gain little.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self, type_info_serialization_name, custom_serialize_item_args, source_writer, dest_writer, output_stream, enumerate_children_func, is_serializer, numpy_arrays=False):
+        self._type_info_serialization_name  = type_info_serialization_name
+        self._custom_serialize_item_args    = custom_serialize_item_args
+        self._source_writer                 = source_writer
+        self._dest_writer                   = dest_writer
+        self._output_stream                 = output_stream
+        self._enumerate_children_func       = enumerate_children_func
+        self._is_serializer                 = is_serializer
+        self._numpy_arrays                  = numpy_arrays
+        self._method_prefix                 = "Serialize" if is_serializer else "Deserialize"
+
+        self.IncludeValidateKeys            = False
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def GetFunctionName(cls, element, is_serializer):
+        """Returns the name of the fast-path function for the element or None if the element is delegated to the standard implementation"""
+
+        while type(element) == Elements.ReferenceElement:   # <Use isinstance> pylint: disable = C0123
+            element = element.Reference
+
+        if not cls._IsSupported(element):
+            return None
+
+        return "_Fast{}_{}".format("Serialize" if is_serializer else "Deserialize", ToPythonName(element))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnCompound_VisitingChildren(element):
+        return False
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnSimple_VisitingChildren(element):
+        return False
+
+    # ----------------------------------------------------------------------
+    @Interface.override
+    def OnFundamental(self, element):
+        # ----------------------------------------------------------------------
+        def CreateItemStatement(var_name, type_info_name=None):
+            statement = "{type_info}.{method_prefix}Item({type_info_name}, {item_statement}, **{serialize_args})".format(
+                type_info=self._type_info_serialization_name,
+                method_prefix=self._method_prefix,
+                type_info_name=type_info_name or "{}_TypeInfo".format(ToPythonName(element)),
+                item_statement=self._source_writer.GetFundamental(var_name, element),
+                serialize_args=self._custom_serialize_item_args,
+            )
+
+            if not element.IsAttribute:
+                statement = self._dest_writer.CreateFundamentalElement(element, statement)
+
+            return statement
+
+        # ----------------------------------------------------------------------
+
+        self._WriteArityFunction(element, CreateItemStatement)
+
+    # ----------------------------------------------------------------------
+    @Interface.override
+    def OnCompound(self, element):
+        if not self._IsSupported(element):
+            return
+
+        python_name = ToPythonName(element)
+
+        attribute_names = []
+        numpy_array_names = []
+        statements = []
+
+        for child in self._enumerate_children_func(
+            element,
+            include_definitions=False,
+        ):
+            attribute_names.append(child.Name)
+
+            if self._numpy_arrays and IsNumericCollection(child):
+                numpy_array_names.append(child.Name)
+
+            if child.TypeInfo.Arity.Min == 0:
+                if child.TypeInfo.Arity.Max == 1 and hasattr(child, "default"):
+                    empty_statement = Dedent(
+                        """\
+                        else:
+                            {}
+                        """,
+                    ).format(
+                        self._dest_writer.AppendChild(
+                            child,
+                            "result",
+                            'StringSerialization.DeserializeItem({}_TypeInfo, "{}")'.format(ToPythonName(child.Resolve()), child.default),
+                        ),
+                    )
+                else:
+                    empty_statement = Dedent(
+                        """\
+                        elif always_include_optional:
+                            {}
+                        """,
+                    ).format(self._dest_writer.AppendChild(child, "result", None))
+
+                statement = Dedent(
+                    """\
+                    # {name}
+                    value = source.get({statement_name}, DoesNotExist)
+                    if value is not DoesNotExist:
+                        value = {invoke}
+                    if value is not DoesNotExist:
+                        {append}
+                    {empty}
+                    """,
+                ).format(
+                    name=child.Name,
+                    statement_name=self._source_writer.GetElementStatementName(child),
+                    invoke=self._CreateInvokeStatement(child, "value"),
+                    append=self._dest_writer.AppendChild(child, "result", "value"),
+                    empty=empty_statement.strip(),
+                )
+
+            else:
+                statement = Dedent(
+                    """\
+                    # {name}
+                    value = source.get({statement_name}, DoesNotExist)
+                    if value is DoesNotExist:
+                        raise _FastPathException()
+
+                    {append}
+                    """,
+                ).format(
+                    name=child.Name,
+                    statement_name=self._source_writer.GetElementStatementName(child),
+                    append=self._dest_writer.AppendChild(child, "result", self._CreateInvokeStatement(child, "value")),
+                )
+
+            statements.append(statement)
+
+        validation_statement_template = "{}_TypeInfo.ValidateItem({{}}, recurse=False, require_exact_match=True{})\n".format(
+            python_name,
+            ", exclude=[{}]".format(", ".join(['"{}"'.format(name) for name in numpy_array_names])) if numpy_array_names else "",
+        )
+
+        if self._is_serializer:
+            prefix = "{}\n    ".format(LeftJustify(validation_statement_template.format("item"), 4))
+            suffix = ""
+        else:
+            prefix = ""
+            suffix = Dedent(
+                """\
+                for k in source:
+                    if not k.startswith("_") and k not in [{attribute_names}]:
+                        raise _FastPathException()
+
+                {validation_statement}
+                """,
+            ).format(
+                attribute_names=", ".join(['"{}"'.format(attribute_name) for attribute_name in attribute_names]),
+                validation_statement=validation_statement_template.format("result"),
+            )
+
+        self._output_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                def _Fast{method_prefix}_{python_name}_Item(item, always_include_optional):
+                    {prefix}source = item if isinstance(item, dict) else getattr(item, "__dict__", {{}})
+
+                    result = {create_compound}
+
+                    {statements}
+
+                    {suffix}return result
+
+
+                """,
+            ).format(
+                method_prefix=self._method_prefix,
+                python_name=python_name,
+                prefix=prefix,
+                create_compound=LeftJustify(self._dest_writer.CreateCompoundElement(element, None), 4).strip(),
+                statements=LeftJustify("\n".join(statements), 4).strip(),
+                suffix="{}\n\n    ".format(LeftJustify(suffix.strip(), 4)) if suffix else "",
+            ),
+        )
+
+        self._WriteArityFunction(
+            element,
+            lambda var_name: "_Fast{}_{}_Item({}, always_include_optional)".format(self._method_prefix, python_name, var_name),
+        )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnSimple(element):
+        # Delegated to the standard implementation
+        pass
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnVariant(element):
+        # Delegated to the standard implementation
+        pass
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnReference(element):
+        # Nothing to do here, as invocations are made in terms of the referenced element
+        pass
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnList(element):
+        # Delegated to the standard implementation
+        pass
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnAny(element):
+        # Delegated to the standard implementation
+        pass
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _IsSupported(element):
+        if isinstance(element, Elements.FundamentalElement):
+            return True
+
+        if isinstance(element, Elements.CompoundElement):
+            return not getattr(element, "as_dictionary", False) and not any(getattr(child, "IsAttribute", False) for child in element.Children)
+
+        return False
+
+    # ----------------------------------------------------------------------
+    def _CreateInvokeStatement(self, element, var_name):
+        is_compound_like = isinstance(element.Resolve(), (Elements.CompoundElement, Elements.SimpleElement))
+
+        function_name = self.GetFunctionName(element, self._is_serializer)
+        if function_name is None:
+            return "{method_prefix}r.{python_name}({var_name}{extra_args})".format(
+                method_prefix=self._method_prefix,
+                python_name=ToPythonName(element),
+                var_name=var_name,
+                extra_args=", always_include_optional, False" if is_compound_like else "",
+            )
+
+        return "{function_name}({var_name}{extra_args})".format(
+            function_name=function_name,
+            var_name=var_name,
+            extra_args=", always_include_optional" if is_compound_like else "",
+        )
+
+    # ----------------------------------------------------------------------
+    def _WriteArityFunction(self, element, create_item_statement_func):
+        python_name = ToPythonName(element)
+        arity = element.TypeInfo.Arity
+
+        is_compound_like = isinstance(element, Elements.CompoundElement)
+
+        if arity.IsCollection:
+            arg_name = "items"
+            does_not_exist_items = "DoesNotExist, None, []"
+
+            conditions = []
+
+            if arity.Min != 0:
+                conditions.append("len({{}}) < {}".format(arity.Min))
+            if arity.Max is not None:
+                conditions.append("len({{}}) > {}".format(arity.Max))
+
+            if hasattr(element, "key"):
+                self.IncludeValidateKeys = True
+                validate_keys_statement = '_ValidateKeys("{}", {{}})\n\n'.format(element.key)
+            else:
+                validate_keys_statement = ""
+
+            if isinstance(element, Elements.FundamentalElement):
+                # Validate the collection as a whole and convert the items without their
+                # constraints. Values are validated before they are serialized and after they
+                # are deserialized, so validation is always applied to python values.
+                validate_items_statement = Dedent(
+                    """\
+                    if not _AreValidFundamentalItems({python_name}_TypeInfo, {{}}):
+                        raise _FastPathException()
+                    """,
+                ).format(
+                    python_name=python_name,
+                )
+
+                convert_statement = Dedent(
+                    """\
+                    {validate_items}unconstrained_type_info = _GetUnconstrainedTypeInfo({python_name}_TypeInfo)
+                    results = [{statement} for this_item in items]
+                    {validated_results}
+                    """,
+                ).format(
+                    validate_items="{}\n".format(validate_items_statement.format("items")) if self._is_serializer else Dedent(
+                        """\
+                        if not isinstance(items, (list, tuple)):
+                            raise _FastPathException()
+
+                        """,
+                    ),
+                    python_name=python_name,
+                    statement=create_item_statement_func("this_item", type_info_name="unconstrained_type_info"),
+                    validated_results="" if self._is_serializer else "\n{}".format(validate_items_statement.format("results")),
+                )
+            else:
+                convert_statement = "results = [{} for this_item in items]\n".format(create_item_statement_func("this_item"))
+
+            if self._is_serializer:
+                content = Dedent(
+                    """\
+                    if {conditions}:
+                        raise _FastPathException()
+
+                    {validate_keys}{convert}
+                    return {collection}
+                    """,
+                ).format(
+                    conditions=" or ".join(["not isinstance(items, (list, tuple))"] + [condition.format("items") for condition in conditions]),
+                    validate_keys=validate_keys_statement.format("items"),
+                    convert=convert_statement.rstrip(),
+                    collection=self._dest_writer.CreateCollection(element, "results"),
+                )
+            else:
+                if conditions:
+                    validate_arity_statement = Dedent(
+                        """\
+                        if {}:
+                            raise _FastPathException()
+
+                        """,
+                    ).format(" or ".join([condition.format("results") for condition in conditions]))
+                else:
+                    validate_arity_statement = ""
+
+                result_statement = self._dest_writer.CreateCollection(element, "results")
+
+                if self._numpy_arrays and IsNumericCollection(element):
+                    result_statement = "_ToNumpyArray({}, {})".format(result_statement, GetNumpyDataType(element))
+
+                content = Dedent(
+                    """\
+                    {convert}
+
+                    {validate_arity}{validate_keys}return {result}
+                    """,
+                ).format(
+                    convert=convert_statement.rstrip(),
+                    validate_arity=validate_arity_statement,
+                    validate_keys=validate_keys_statement.format("results"),
+                    result=result_statement,
+                )
+
+        else:
+            arg_name = "item"
+            does_not_exist_items = "DoesNotExist, None"
+
+            if self._is_serializer:
+                content = Dedent(
+                    """\
+                    if isinstance(item, (list, tuple)):
+                        raise _FastPathException()
+
+                    return {}
+                    """,
+                ).format(create_item_statement_func("item"))
+            else:
+                content = "return {}\n".format(create_item_statement_func("item"))
+
+        self._output_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                def _Fast{method_prefix}_{python_name}({arg_name}{extra_params}):
+                    {numpy_conversion}if {arg_name} in [{does_not_exist_items}]:
+                        {does_not_exist_statement}
+
+                    {content}
+
+
+                """,
+            ).format(
+                method_prefix=self._method_prefix,
+                python_name=python_name,
+                arg_name=arg_name,
+                extra_params=", always_include_optional" if is_compound_like else "",
+                numpy_conversion="items = _FromNumpyArray(items)\n\n    " if self._is_serializer and self._numpy_arrays and IsNumericCollection(element) else "",
+                does_not_exist_items=does_not_exist_items,
+                does_not_exist_statement="return DoesNotExist" if arity.Min == 0 else "raise _FastPathException()",
+                content=LeftJustify(content, 4).strip(),
+            ),
+        )
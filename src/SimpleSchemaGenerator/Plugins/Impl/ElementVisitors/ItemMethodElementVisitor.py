@@ -16,11 +16,9 @@
 """Contains the ItemMethodElementVisitor object"""
 
 import os
-import textwrap
 
 import CommonEnvironment
 from CommonEnvironment import Interface
-from CommonEnvironment import StringHelpers
 
 from CommonEnvironmentEx.Package import InitRelativeImports
 
@@ -32,12 +30,13 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 with InitRelativeImports():
     from ....Schema import Elements
 
-    from ..ElementVisitors import ElementVisitor, ToPythonName
+    from ..ElementVisitors import ElementVisitor, IsNumericCollection, ToPythonName
+    from ..Templates import Dedent, LeftJustify
 
 # ----------------------------------------------------------------------
 class ItemMethodElementVisitor(ElementVisitor):
     # ----------------------------------------------------------------------
-    def __init__(self, type_info_serialization_name, custom_serialize_item_args, source_writer, dest_writer, output_stream, enumerate_children_func, is_serializer):
+    def __init__(self, type_info_serialization_name, custom_serialize_item_args, source_writer, dest_writer, output_stream, enumerate_children_func, is_serializer, numpy_arrays=False):
         self._type_info_serialization_name  = type_info_serialization_name
         self._custom_serialize_item_args    = custom_serialize_item_args
         self._source_writer                 = source_writer
@@ -45,6 +44,7 @@ class ItemMethodElementVisitor(ElementVisitor):
         self._output_stream                 = output_stream
         self._enumerate_children_func       = enumerate_children_func
         self._is_serializer                 = is_serializer
+        self._numpy_arrays                  = numpy_arrays
         self._method_prefix                 = "Serialize" if is_serializer else "Deserialize"
 
         self.IncludeApplyOptionalChild      = False
@@ -68,19 +68,16 @@ class ItemMethodElementVisitor(ElementVisitor):
     def OnFundamental(self, element):
         python_name = ToPythonName(element)
 
-        statement = "{type_info}.{method_prefix}Item({python_name}_TypeInfo, {item_statement}, **{serialize_args})".format(
-            type_info=self._type_info_serialization_name,
-            method_prefix=self._method_prefix,
-            python_name=python_name,
-            item_statement=self._source_writer.GetFundamental("item", element),
-            serialize_args=self._custom_serialize_item_args,
+        statement = self._CreateFundamentalStatement(
+            "{}_TypeInfo".format(python_name),
+            self._source_writer.GetFundamental("item", element),
         )
 
         if not element.IsAttribute:
             statement = self._dest_writer.CreateFundamentalElement(element, statement)
 
         self._output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 @classmethod
@@ -90,10 +87,46 @@ class ItemMethodElementVisitor(ElementVisitor):
                 """,
             ).format(
                 python_name=python_name,
-                statement=StringHelpers.LeftJustify(statement, 4).strip(),
+                statement=LeftJustify(statement, 4).strip(),
             ),
         )
 
+        if element.TypeInfo.Arity.IsCollection:
+            # Converting all of the items at once is much faster than converting them individually
+            # (see _ConvertFundamentalItems). Values are validated before they are serialized and
+            # after they are deserialized, so validation is always applied to python values and the
+            # items are converted without their constraints.
+            convert_statement = "{type_info}.{method_prefix}Item(unconstrained_type_info, {item_statement}, **{serialize_args})".format(
+                type_info=self._type_info_serialization_name,
+                method_prefix=self._method_prefix,
+                item_statement=self._source_writer.GetFundamental("item", element),
+                serialize_args=self._custom_serialize_item_args,
+            )
+
+            self._output_stream.write(
+                Dedent(
+                    """\
+                    # ----------------------------------------------------------------------
+                    @classmethod
+                    def _{python_name}_Items(cls, items):
+                        unconstrained_type_info = _GetUnconstrainedTypeInfo({python_name}_TypeInfo)
+
+                        return _ConvertFundamentalItems(
+                            {python_name}_TypeInfo,
+                            items,
+                            lambda item: {statement},
+                            cls._validate_items,
+                            validate_converted_items={validate_converted_items},
+                        )
+
+                    """,
+                ).format(
+                    python_name=python_name,
+                    statement=LeftJustify(self._dest_writer.CreateFundamentalElement(element, convert_statement), 8).strip(),
+                    validate_converted_items=not self._is_serializer,
+                ),
+            )
+
     # ----------------------------------------------------------------------
     @Interface.override
     def OnCompound(self, element):
@@ -107,41 +140,110 @@ class ItemMethodElementVisitor(ElementVisitor):
     # ----------------------------------------------------------------------
     @Interface.override
     def OnVariant(self, element):
-        statements = []
+        # Variations are attempted in order until one succeeds. Attempts are expensive (as
+        # failures raise exceptions), so eliminate the variations that can't possibly match
+        # the item when the source writer is able to provide information about its children.
+        child_names_statement = self._source_writer.GetChildNames("item")
+
+        # ----------------------------------------------------------------------
+        def CreateCondition(resolved_element):
+            if child_names_statement is None:
+                return "True"
+
+            if isinstance(resolved_element, Elements.FundamentalElement):
+                return "child_names is None or child_names is DoesNotExist"
+
+            if not isinstance(resolved_element, (Elements.CompoundElement, Elements.SimpleElement)):
+                return "True"
+
+            required_names = [
+                child.Name
+                for child in self._enumerate_children_func(
+                    resolved_element,
+                    include_definitions=False,
+                )
+                if child.TypeInfo.Arity.Min != 0
+            ]
+
+            if isinstance(resolved_element, Elements.SimpleElement):
+                required_names.insert(0, resolved_element.FundamentalAttributeName)
+
+            if not required_names:
+                return "True"
+
+            return "child_names is None or (child_names is not DoesNotExist and {})".format(
+                " and ".join(['"{}" in child_names'.format(required_name) for required_name in required_names]),
+            )
+
+        # ----------------------------------------------------------------------
+
+        method_infos = []
         new_types = []
+        has_class_names = False
 
         for variation in element.Variations:
             if isinstance(variation, Elements.ReferenceElement):
                 statement = "cls._{}_Item".format(ToPythonName(variation.Reference))
+                class_name = "None"
 
                 resolved_element = variation.Reference.Resolve()
 
                 if isinstance(resolved_element, (Elements.CompoundElement, Elements.SimpleElement)):
-                    statement = '((lambda item: {}(item, process_additional_data=False, always_include_optional=False)), "{}")'.format(statement, resolved_element.DottedName)
+                    statement = "(lambda item: {}(item, process_additional_data=False, always_include_optional=False))".format(statement)
+                    class_name = '"{}"'.format(resolved_element.DottedName)
+                    has_class_names = True
 
-                statements.append(statement)
             else:
                 assert not isinstance(variation, (Elements.CompoundElement, Elements.SimpleElement)), variation
 
                 new_types.append(variation)
-                statements.append("cls._{}_Item".format(ToPythonName(variation)))
+
+                statement = "cls._{}_Item".format(ToPythonName(variation))
+                class_name = "None"
+                resolved_element = variation
+
+            method_infos.append("({}, {}, {}),".format(statement, class_name, CreateCondition(resolved_element)))
 
         python_name = ToPythonName(element)
 
+        if child_names_statement is None:
+            prefix = ""
+            suffix = ""
+        else:
+            prefix = "child_names = {}\n\n    ".format(child_names_statement)
+
+            if has_class_names:
+                suffix = Dedent(
+                    """\
+
+                    # Attempt the variation that was used to create the item first
+                    variant_type = child_names.get("{variant_class_type}", None) if child_names not in [None, DoesNotExist] else None
+                    if variant_type is not None:
+                        method_infos.sort(key=lambda method_info: method_info[1] != variant_type)
+                    """,
+                ).format(
+                    variant_class_type=self._dest_writer.VARIANT_CLASS_TYPE_ATTRIBUTE_NAME,
+                )
+            else:
+                suffix = ""
+
         self._output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 @classmethod
                 def _{python_name}_Item(cls, item):
-                    for method_info in [
-                        {statements}
-                    ]:
-                        if isinstance(method_info, tuple):
-                            potential_method, class_name = method_info
-                        else:
-                            potential_method = method_info
-                            class_name = None
+                    # Variations are selected based on validation results
+                    if not cls._validate_items:
+                        cls = cls._full_validation_class
+
+                    {prefix}method_infos = [
+                        {method_infos}
+                    ]
+                    {suffix}
+                    for potential_method, class_name, is_candidate in method_infos:
+                        if not is_candidate:
+                            continue
 
                         try:
                             result = potential_method(item)
@@ -158,8 +260,10 @@ class ItemMethodElementVisitor(ElementVisitor):
                 """,
             ).format(
                 python_name=python_name,
-                statements=StringHelpers.LeftJustify("\n".join(["{},".format(statement) for statement in statements]), 8).rstrip(),
-                apply_class_name_statement=StringHelpers.LeftJustify(
+                prefix=prefix,
+                method_infos=LeftJustify("\n".join(method_infos), 8).rstrip(),
+                suffix=LeftJustify(suffix, 4),
+                apply_class_name_statement=LeftJustify(
                     self._dest_writer.AppendChild(
                         self._dest_writer.CreateTemporaryElement('"{}"'.format(self._dest_writer.VARIANT_CLASS_TYPE_ATTRIBUTE_NAME), "1"),
                         "result",
@@ -183,7 +287,7 @@ class ItemMethodElementVisitor(ElementVisitor):
     @Interface.override
     def OnList(self, element):
         self._output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 @classmethod
@@ -205,7 +309,7 @@ class ItemMethodElementVisitor(ElementVisitor):
     @Interface.override
     def OnAny(self, element):
         self._output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 @classmethod
@@ -230,6 +334,8 @@ class ItemMethodElementVisitor(ElementVisitor):
         statements = []
 
         attribute_names = []
+        has_lazy_children = False
+        numpy_array_names = []
 
         for child in self._enumerate_children_func(
             element,
@@ -242,6 +348,9 @@ class ItemMethodElementVisitor(ElementVisitor):
 
             is_compound_like = isinstance(child.Resolve(), (Elements.CompoundElement, Elements.SimpleElement))
 
+            if self._numpy_arrays and IsNumericCollection(child):
+                numpy_array_names.append(child.Name)
+
             # Note that we have to use getattr here, as Compound- and SimpleElements don't support IsAttribute
             if getattr(child, "IsAttribute", False):
                 is_attribute = True
@@ -257,7 +366,7 @@ class ItemMethodElementVisitor(ElementVisitor):
                     self.IncludeApplyOptionalAttribute = True
                     statement_template = 'cls._ApplyOptionalAttribute(item, "{{name}}", attributes, cls.{{python_name}}, always_include_optional{})'.format(default_value)
                 else:
-                    statement_template = textwrap.dedent(
+                    statement_template = Dedent(
                         """\
                         attributes["{name}"] = cls.{python_name}(
                             {get_child_statement},
@@ -268,7 +377,7 @@ class ItemMethodElementVisitor(ElementVisitor):
                 statement = statement_template.format(
                     name=child.Name,
                     python_name=child_python_name,
-                    get_child_statement=StringHelpers.LeftJustify(self._source_writer.GetChild("item", child), 4).strip(),
+                    get_child_statement=LeftJustify(self._source_writer.GetChild("item", child), 4).strip(),
                 )
 
             else:
@@ -302,8 +411,8 @@ class ItemMethodElementVisitor(ElementVisitor):
 
                 else:
                     if is_compound_like:
-                        extra_params = StringHelpers.LeftJustify(
-                            textwrap.dedent(
+                        extra_params = LeftJustify(
+                            Dedent(
                                 """\
 
                                 always_include_optional,
@@ -319,7 +428,7 @@ class ItemMethodElementVisitor(ElementVisitor):
                     statement = self._dest_writer.AppendChild(
                         child,
                         "result",
-                        textwrap.dedent(
+                        Dedent(
                             """\
                             cls.{python_name}(
                                 {get_child},{extra_params}
@@ -327,14 +436,49 @@ class ItemMethodElementVisitor(ElementVisitor):
                             """,
                         ).format(
                             python_name=ToPythonName(child),
-                            get_child=StringHelpers.LeftJustify(self._source_writer.GetChild("item", child), 4).strip(),
+                            get_child=LeftJustify(self._source_writer.GetChild("item", child), 4).strip(),
                             name=child.Name,
                             extra_params=extra_params,
                         ),
                     )
 
+                lazy_statement = None
+
+                if not self._is_serializer:
+                    lazy_statement = self._dest_writer.AppendLazyChild(
+                        element,
+                        child,
+                        "result",
+                        "functools.partial(cls.{}, value{})".format(
+                            child_python_name,
+                            ", always_include_optional, process_additional_data" if is_compound_like else "",
+                        ),
+                    )
+
+                if lazy_statement is not None:
+                    has_lazy_children = True
+
+                    # Values that don't exist are processed immediately, as there isn't anything to create
+                    statement = Dedent(
+                        """\
+                        if cls._lazy:
+                            value = {get_child}
+                        else:
+                            value = DoesNotExist
+
+                        if value is not DoesNotExist and value not in [None, [], {{}}]:
+                            {lazy_statement}
+                        else:
+                            {statement}
+                        """,
+                    ).format(
+                        get_child=LeftJustify(self._source_writer.GetChild("item", child), 4).strip(),
+                        lazy_statement=LeftJustify(lazy_statement, 4).strip(),
+                        statement=LeftJustify(statement, 4).strip(),
+                    )
+
             (attributes if is_attribute else statements).append(
-                textwrap.dedent(
+                Dedent(
                     """\
                     # {name}
                     try:
@@ -345,14 +489,14 @@ class ItemMethodElementVisitor(ElementVisitor):
                     """,
                 ).format(
                     name=child.Name,
-                    statement=StringHelpers.LeftJustify(statement, 4).strip(),
+                    statement=LeftJustify(statement, 4).strip(),
                 ),
             )
 
         if isinstance(element, Elements.SimpleElement):
             attribute_names.append(element.FundamentalAttributeName)
 
-            statement = textwrap.dedent(
+            statement = Dedent(
                 """\
                 # <fundamental value>
                 try:
@@ -365,17 +509,14 @@ class ItemMethodElementVisitor(ElementVisitor):
                 {}
                 """,
             ).format(
-                StringHelpers.LeftJustify(
-                    "{type_info}.{method_prefix}Item({python_name}__value__TypeInfo, {value}, **{serialize_args})".format(
-                        type_info=self._type_info_serialization_name,
-                        method_prefix=self._method_prefix,
-                        python_name=ToPythonName(element),
-                        value=self._source_writer.GetChild(
+                LeftJustify(
+                    self._CreateFundamentalStatement(
+                        "{}__value__TypeInfo".format(ToPythonName(element)),
+                        self._source_writer.GetChild(
                             "item",
                             self._source_writer.CreateTemporaryElement('"{}"'.format(element.FundamentalAttributeName), "1"),
                             is_simple_schema_fundamental=True,
                         ),
-                        serialize_args=self._custom_serialize_item_args,
                     ),
                     4,
                 ),
@@ -384,7 +525,7 @@ class ItemMethodElementVisitor(ElementVisitor):
             )
 
         else:
-            statement = textwrap.dedent(
+            statement = Dedent(
                 """\
                 result = {}
 
@@ -394,38 +535,59 @@ class ItemMethodElementVisitor(ElementVisitor):
 
         python_name = ToPythonName(element)
 
-        validation_statement_template = textwrap.dedent(
+        # The arity of numpy arrays is validated by the child's method, as TypeInfo objects
+        # only recognize lists as collections.
+        exclude_statement = "[{}]".format(", ".join(['"{}"'.format(name) for name in numpy_array_names])) if numpy_array_names else None
+
+        if has_lazy_children:
+            # Children that haven't been created yet are validated when they are created
+            lazy_exclude_statement = self._dest_writer.GetLazyChildNames("{0}")
+
+            if exclude_statement is not None:
+                lazy_exclude_statement = "{} + list({} or [])".format(exclude_statement, lazy_exclude_statement)
+
+            exclude_statement = "{} if cls._lazy else {}".format(lazy_exclude_statement, exclude_statement)
+
+        if exclude_statement is not None:
+            exclude_arg = "\n    exclude={},".format(exclude_statement)
+        else:
+            exclude_arg = ""
+
+        validation_statement_template = Dedent(
             """\
             {}_TypeInfo.ValidateItem(
-                {{}},
+                {{0}},
                 recurse=False,
-                require_exact_match=not process_additional_data,
+                require_exact_match=not process_additional_data,{}
             )
             """,
-        ).format(python_name)
+        ).format(python_name, exclude_arg)
 
         if self._is_serializer:
-            prefix = validation_statement_template.format("item")
+            prefix = "if cls._validate_structure:\n{}".format(
+                LeftJustify(validation_statement_template.format("item"), 4, skip_first_line=False),
+            )
             suffix = ""
         else:
             prefix = ""
-            suffix = textwrap.dedent(
+            suffix = Dedent(
                 """\
-                else:
+                elif cls._validate_structure:
                     cls._RejectAdditionalData(
                         item,
                         exclude_names=[{attribute_names}],
                     )
 
-                {validation_statement}
+                if cls._validate_structure:
+                    {validation_statement}
                 """,
             ).format(
                 attribute_names=", ".join(['"{}"'.format(attribute_name) for attribute_name in attribute_names]),
-                validation_statement=validation_statement_template.format("result"),
+                validation_statement=LeftJustify(validation_statement_template.format("result"), 4).strip(),
             )
 
         self._output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 @classmethod
@@ -445,16 +607,27 @@ class ItemMethodElementVisitor(ElementVisitor):
                 """,
             ).format(
                 python_name=python_name,
-                prefix=StringHelpers.LeftJustify("{}\n\n".format(prefix.strip()) if prefix else prefix, 4),
+                prefix=LeftJustify("{}\n\n".format(prefix.strip()) if prefix else prefix, 4),
                 prefix_whitespace="    " if prefix else "",
-                suffix=StringHelpers.LeftJustify("\n{}\n".format(suffix.strip()) if suffix else suffix, 4),
+                suffix=LeftJustify("\n{}\n".format(suffix.strip()) if suffix else suffix, 4),
                 attributes_decl="" if not attributes else "attributes = OrderedDict()\n\n    ",
-                attributes="" if not attributes else "{}\n\n    ".format(StringHelpers.LeftJustify("".join(attributes), 4).strip()),
-                statement=StringHelpers.LeftJustify(statement, 4).strip(),
+                attributes="" if not attributes else "{}\n\n    ".format(LeftJustify("".join(attributes), 4).strip()),
+                statement=LeftJustify(statement, 4).strip(),
                 attribute_names=", ".join(['"{}"'.format(attribute_name) for attribute_name in attribute_names]),
             ),
         )
 
+    # ----------------------------------------------------------------------
+    def _CreateFundamentalStatement(self, type_info_statement, value_statement):
+        # Constraints are only checked when the items are validated
+        return "{type_info}.{method_prefix}Item({type_info_statement} if cls._validate_items else _GetUnconstrainedTypeInfo({type_info_statement}), {value}, **{serialize_args})".format(
+            type_info=self._type_info_serialization_name,
+            method_prefix=self._method_prefix,
+            type_info_statement=type_info_statement,
+            value=value_statement,
+            serialize_args=self._custom_serialize_item_args,
+        )
+
     # ----------------------------------------------------------------------
     def _GenerateDictionary(self, element):
         key_element = None
@@ -492,7 +665,7 @@ class ItemMethodElementVisitor(ElementVisitor):
             default_value = None
 
         self._output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 @classmethod
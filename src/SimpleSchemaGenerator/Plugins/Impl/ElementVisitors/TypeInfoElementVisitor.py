@@ -79,6 +79,24 @@ class TypeInfoElementVisitor(ElementVisitor):
     def OnAny(self, element):
         return self._python_code_visitor.Accept(element.TypeInfo)
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def UpdateCachedChildrenStatements(cls, element, cached_children_statements):
+        """\
+        Adds the children statement for a compound or simple element to the cache (if it
+        doesn't already exist) and returns the name of the cached statement.
+
+        Names are based on the first element associated with a statement, so the cache
+        can be populated in advance when elements are processed out of order.
+        """
+
+        children_statement = cls._CreateChildrenStatement(element)
+
+        if children_statement not in cached_children_statements:
+            cached_children_statements[children_statement] = "_{}_TypeInfo_Contents".format(ToPythonName(element))
+
+        return cached_children_statements[children_statement]
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -99,7 +117,14 @@ class TypeInfoElementVisitor(ElementVisitor):
         # that can process classes or dictionaries. Also, handle the processing of
         # recursive data structure by creating a TypeInfo object that only parses one
         # level deep.
+        return "AnyOfTypeInfo([ClassTypeInfo({children}, require_exact_match=False), DictTypeInfo({children}, require_exact_match=False)]{arity})".format(
+            children=self.UpdateCachedChildrenStatements(element, self._cached_children_statements),
+            arity=self._ToArityString(element.TypeInfo.Arity),
+        )
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CreateChildrenStatement(cls, element):
         # ----------------------------------------------------------------------
         def GenerateChildren(element):
             queue = [element]
@@ -119,12 +144,12 @@ class TypeInfoElementVisitor(ElementVisitor):
 
         # ----------------------------------------------------------------------
 
-        children_statement = "OrderedDict([{}])".format(
+        return "OrderedDict([{}])".format(
             ", ".join(
                 [
                     '("{}", GenericTypeInfo({}))'.format(
                         k,
-                        self._ToArityString(
+                        cls._ToArityString(
                             v.Arity,
                             comma_prefix=False,
                         ),
@@ -133,11 +158,3 @@ class TypeInfoElementVisitor(ElementVisitor):
                 ],
             ),
         )
-
-        if children_statement not in self._cached_children_statements:
-            self._cached_children_statements[children_statement] = "_{}_TypeInfo_Contents".format(ToPythonName(element))
-
-        return "AnyOfTypeInfo([ClassTypeInfo({children}, require_exact_match=False), DictTypeInfo({children}, require_exact_match=False)]{arity})".format(
-            children=self._cached_children_statements[children_statement],
-            arity=self._ToArityString(element.TypeInfo.Arity),
-        )
@@ -20,6 +20,9 @@ import os
 import CommonEnvironment
 from CommonEnvironment import Interface
 
+from CommonEnvironment.TypeInfo.FundamentalTypes.FloatTypeInfo import FloatTypeInfo
+from CommonEnvironment.TypeInfo.FundamentalTypes.IntTypeInfo import IntTypeInfo
+
 from CommonEnvironmentEx.Package import InitRelativeImports
 
 # ----------------------------------------------------------------------
@@ -55,3 +58,31 @@ def ToPythonName(element):
         name = name.replace(char, "_")
 
     return name
+
+
+# ----------------------------------------------------------------------
+def IsNumericCollection(element):
+    """Returns True if the element is a collection of int or number values"""
+
+    element = element.Resolve()
+
+    return (
+        isinstance(element, Elements.FundamentalElement)
+        and element.TypeInfo.Arity.IsCollection
+        and isinstance(element.TypeInfo, (IntTypeInfo, FloatTypeInfo))
+    )
+
+
+# ----------------------------------------------------------------------
+def GetNumpyDataType(element):
+    """Returns a statement for the numpy data type used to store the values of a numeric collection"""
+
+    type_info = element.Resolve().TypeInfo
+
+    if isinstance(type_info, FloatTypeInfo):
+        return "numpy.float64"
+
+    if type_info.Bytes is None:
+        return "numpy.int64"
+
+    return "numpy.{}int{}".format("u" if type_info.Unsigned else "", type_info.Bytes * 8)
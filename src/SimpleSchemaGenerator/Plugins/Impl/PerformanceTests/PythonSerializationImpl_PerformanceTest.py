@@ -0,0 +1,661 @@
+# ----------------------------------------------------------------------
+# |
+# |  PythonSerializationImpl_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-30 08:51:27
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Compares the performance of code generated with different settings"""
+
+import datetime
+import importlib.util
+import os
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+import uuid
+
+import six
+
+import CommonEnvironment
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ...PythonJsonPlugin import Plugin as PythonJsonPlugin
+    from ...PythonMsgpackPlugin import Plugin as PythonMsgpackPlugin
+    from ...PythonYamlPlugin import Plugin as PythonYamlPlugin
+
+    from ....Schema.Parse import ParseStrings
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_PythonJson(self):
+        self._Execute(PythonJsonPlugin())
+
+    # ----------------------------------------------------------------------
+    def test_PythonYaml(self):
+        self._Execute(PythonYamlPlugin())
+
+    # ----------------------------------------------------------------------
+    def _Execute(self, plugin, num_items=2000, num_iterations=5):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            standard_module = _Generate(plugin, temp_directory, "Standard", fast_path=False)
+            fast_path_module = _Generate(plugin, temp_directory, "FastPath", fast_path=True)
+
+            items = [_CreateItem(index) for index in range(num_items)]
+
+            sys.stdout.write("\n{}:\n".format(plugin.Name))
+
+            results = []
+
+            for module in [standard_module, fast_path_module]:
+                serialize_time = None
+                deserialize_time = None
+
+                # Use the best time to reduce the impact of other activity on the machine
+                for _ in range(num_iterations):
+                    start = time.perf_counter()
+                    serialized = module.Serialize_people(items)
+                    this_time = time.perf_counter() - start
+
+                    if serialize_time is None or this_time < serialize_time:
+                        serialize_time = this_time
+
+                    start = time.perf_counter()
+                    deserialized = module.Deserialize_people(serialized)
+                    this_time = time.perf_counter() - start
+
+                    if deserialize_time is None or this_time < deserialize_time:
+                        deserialize_time = this_time
+
+                sys.stdout.write(
+                    "    {:<10} Serialize {:.3f}s, Deserialize {:.3f}s\n".format(
+                        module.__name__,
+                        serialize_time,
+                        deserialize_time,
+                    ),
+                )
+
+                results.append((_ToDict(serialized), _ToDict(deserialized)))
+
+            self.assertEqual(results[0], results[1])
+
+
+# ----------------------------------------------------------------------
+class JsonBackendSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Throughput(self):
+        num_items = 10000
+
+        plugin = PythonJsonPlugin()
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            modules = [
+                _Generate(plugin, temp_directory, "Backend_{}".format(json_backend), fast_path=True, json_backend=json_backend)
+                for json_backend in ["json", "orjson", "ujson"]
+                # Packages for the backends must be installed when the code is generated
+                if json_backend == "json" or importlib.util.find_spec(json_backend) is not None
+            ]
+
+            items = [_CreateItem(index) for index in range(num_items)]
+
+            sys.stdout.write("\n{} items:\n".format(num_items))
+
+            results = []
+
+            for module in modules:
+                serialize_time, content = _BestTime(lambda: module.Serialize_people(items, to_string=True))
+                deserialize_time, deserialized = _BestTime(lambda: module.Deserialize_people(content))
+
+                # Measure the backend on its own, as the times above include validation
+                serialized = module.Serialize_people(items)
+
+                encode_time, _ = _BestTime(lambda: module._JsonDumps(serialized))
+                decode_time, _ = _BestTime(lambda: module._JsonLoads(content))
+
+                megabytes = len(content) / (1024.0 * 1024.0)
+
+                sys.stdout.write(
+                    textwrap.dedent(
+                        """\
+                            {} ({}, {:.1f} MB):
+                                Serialize       {:.3f}s
+                                Deserialize     {:.3f}s
+                                Encode          {:.3f}s ({:.1f} MB/s)
+                                Decode          {:.3f}s ({:.1f} MB/s)
+                        """,
+                    ).format(
+                        module.__name__,
+                        module._json_backend_name,
+                        megabytes,
+                        serialize_time,
+                        deserialize_time,
+                        encode_time,
+                        megabytes / encode_time,
+                        decode_time,
+                        megabytes / decode_time,
+                    ),
+                )
+
+                results.append(_ToDict(deserialized))
+
+            for result in results[1:]:
+                self.assertEqual(result, results[0])
+
+
+# ----------------------------------------------------------------------
+class YamlBackendSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Throughput(self):
+        num_items = 12000
+
+        plugin = PythonYamlPlugin()
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            modules = [
+                _Generate(plugin, temp_directory, "Backend_{}".format(yaml_backend), fast_path=True, yaml_backend=yaml_backend)
+                for yaml_backend in ["rtyaml", "libyaml"]
+            ]
+
+            items = [_CreateItem(index) for index in range(num_items)]
+
+            sys.stdout.write("\n{} items:\n".format(num_items))
+
+            results = []
+
+            for module in modules:
+                serialize_time, content = _BestTime(lambda: module.Serialize_people(items, to_string=True))
+                deserialize_time, deserialized = _BestTime(lambda: module.Deserialize_people(content))
+
+                # Measure the backend on its own, as the times above include validation
+                serialized = module.Serialize_people(items)
+
+                dump_time, _ = _BestTime(lambda: module._YamlDump(serialized))
+                load_time, _ = _BestTime(lambda: module._YamlLoad(content))
+
+                megabytes = len(content) / (1024.0 * 1024.0)
+
+                sys.stdout.write(
+                    textwrap.dedent(
+                        """\
+                            {} ({}, {:.1f} MB):
+                                Serialize       {:.3f}s
+                                Deserialize     {:.3f}s
+                                Dump            {:.3f}s ({:.1f} MB/s)
+                                Load            {:.3f}s ({:.1f} MB/s)
+                        """,
+                    ).format(
+                        module.__name__,
+                        module._yaml_backend_name,
+                        megabytes,
+                        serialize_time,
+                        deserialize_time,
+                        dump_time,
+                        megabytes / dump_time,
+                        load_time,
+                        megabytes / load_time,
+                    ),
+                )
+
+                results.append(_ToDict(deserialized))
+
+            for result in results[1:]:
+                self.assertEqual(result, results[0])
+
+
+# ----------------------------------------------------------------------
+class FormatSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_SizeAndThroughput(self):
+        num_items = 20000
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            modules = [
+                _Generate(PythonJsonPlugin(), temp_directory, "Format_json", schema=_RECORD_SCHEMA, fast_path=True),
+                _Generate(PythonYamlPlugin(), temp_directory, "Format_yaml", schema=_RECORD_SCHEMA, fast_path=True, yaml_backend="libyaml"),
+                _Generate(PythonMsgpackPlugin(), temp_directory, "Format_msgpack", schema=_RECORD_SCHEMA, fast_path=True),
+            ]
+
+            items = [
+                _Object(
+                    id=uuid.UUID(int=index),
+                    created=datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=index, microseconds=index),
+                    elapsed=datetime.timedelta(milliseconds=index),
+                    name="Record {}".format(index),
+                    value=index / 3.0,
+                    count=index,
+                )
+                for index in range(num_items)
+            ]
+
+            sys.stdout.write("\n{} items:\n".format(num_items))
+
+            results = []
+
+            for module in modules:
+                serialize_time, content = _BestTime(lambda: module.Serialize_records(items, to_string=True))
+                deserialize_time, deserialized = _BestTime(lambda: module.Deserialize_records(content))
+
+                megabytes = len(content) / (1024.0 * 1024.0)
+
+                sys.stdout.write(
+                    "    {:<16} {:>6.2f} MB, Serialize {:.3f}s, Deserialize {:.3f}s\n".format(
+                        module.__name__,
+                        megabytes,
+                        serialize_time,
+                        deserialize_time,
+                    ),
+                )
+
+                results.append(_ToDict(deserialized))
+
+            for result in results[1:]:
+                self.assertEqual(result, results[0])
+
+
+# ----------------------------------------------------------------------
+class LazySuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_ReadFewFields(self):
+        num_items = 10000
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            module = _Generate(PythonJsonPlugin(), temp_directory, "Lazy")
+
+            serialized = module.Serialize_people([_CreateItem(index) for index in range(num_items)])
+
+            eager_time, eager = _BestTime(lambda: [item.name for item in module.Deserialize_people(serialized)])
+            lazy_time, lazy = _BestTime(lambda: [item.name for item in module.Deserialize_people(serialized, lazy=True)])
+
+            sys.stdout.write(
+                "\n{} items (reading 'name'): Eager {:.3f}s, Lazy {:.3f}s\n".format(
+                    num_items,
+                    eager_time,
+                    lazy_time,
+                ),
+            )
+
+            self.assertEqual(lazy, eager)
+
+            self.assertEqual(
+                _ToDict(module.ValidateAll(module.Deserialize_people(serialized, lazy=True))),
+                _ToDict(module.Deserialize_people(serialized)),
+            )
+
+
+# ----------------------------------------------------------------------
+class ValidationLevelSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_PythonJson(self):
+        self._Execute(PythonJsonPlugin())
+
+    # ----------------------------------------------------------------------
+    def test_PythonYaml(self):
+        self._Execute(PythonYamlPlugin())
+
+    # ----------------------------------------------------------------------
+    def _Execute(self, plugin, num_items=2000):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            module = _Generate(plugin, temp_directory, "ValidationLevel")
+
+            items = [_CreateItem(index) for index in range(num_items)]
+
+            sys.stdout.write("\n{} ({} items):\n".format(plugin.Name, num_items))
+
+            results = []
+
+            for validation_level in ["full", "structure", "none"]:
+                serialize_time, serialized = _BestTime(lambda: module.Serialize_people(items, validation_level=validation_level))
+                deserialize_time, deserialized = _BestTime(lambda: module.Deserialize_people(serialized, validation_level=validation_level))
+
+                sys.stdout.write(
+                    "    {:<10} Serialize {:.3f}s, Deserialize {:.3f}s\n".format(
+                        validation_level,
+                        serialize_time,
+                        deserialize_time,
+                    ),
+                )
+
+                results.append((_ToDict(serialized), _ToDict(deserialized)))
+
+            for result in results[1:]:
+                self.assertEqual(result, results[0])
+
+
+# ----------------------------------------------------------------------
+class FundamentalCollectionSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_PythonJson(self):
+        self._Execute(PythonJsonPlugin())
+
+    # ----------------------------------------------------------------------
+    def test_PythonYaml(self):
+        self._Execute(PythonYamlPlugin())
+
+    # ----------------------------------------------------------------------
+    def _Execute(self, plugin, num_items=50, num_values=5000):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            module = _Generate(plugin, temp_directory, "Collections", schema=_NUMERIC_SCHEMA)
+
+            items = [
+                _Object(
+                    name="Series {}".format(index),
+                    values=[float(value_index % 2000 - 1000) / 2 for value_index in range(num_values)],
+                    counts=[value_index % 1000 for value_index in range(num_values)],
+                )
+                for index in range(num_items)
+            ]
+
+            sys.stdout.write("\n{} ({} items, {} values each):\n".format(plugin.Name, num_items, num_values))
+
+            # ----------------------------------------------------------------------
+            def Measure(desc, module):
+                serialize_time, serialized = _BestTime(lambda: module.Serialize_all_series(items))
+                deserialize_time, deserialized = _BestTime(lambda: module.Deserialize_all_series(serialized))
+
+                sys.stdout.write(
+                    "    {:<10} Serialize {:.3f}s, Deserialize {:.3f}s\n".format(
+                        desc,
+                        serialize_time,
+                        deserialize_time,
+                    ),
+                )
+
+                return _ToDict(serialized), _ToDict(deserialized)
+
+            # ----------------------------------------------------------------------
+
+            # Convert the items individually
+            convert_fundamental_items = module._ConvertFundamentalItems
+            module._ConvertFundamentalItems = lambda *args, **kwargs: None
+
+            try:
+                per_item_results = Measure("Per-item", module)
+            finally:
+                module._ConvertFundamentalItems = convert_fundamental_items
+
+            self.assertEqual(Measure("Batched", module), per_item_results)
+
+            try:
+                import numpy
+            except ImportError:
+                sys.stdout.write("    numpy is not available\n")
+                return
+
+            numpy_module = _Generate(plugin, temp_directory, "NumpyCollections", schema=_NUMERIC_SCHEMA, numpy_arrays=True)
+
+            serialized, deserialized = Measure("numpy", numpy_module)
+
+            self.assertEqual(serialized, per_item_results[0])
+            self.assertTrue(all(isinstance(item["values"], numpy.ndarray) for item in deserialized))
+
+
+# ----------------------------------------------------------------------
+class GenerationSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_PythonJson(self):
+        self._Execute(PythonJsonPlugin())
+
+    # ----------------------------------------------------------------------
+    def _Execute(self, plugin, num_compounds=1000):
+        # Each compound contributes itself and 4 children, so the default
+        # schema contains 5,000 elements.
+        schema = "".join(
+            textwrap.dedent(
+                """\
+                <item{index}>:
+                    <name string>
+                    <value number *>
+                    <count int min=0 ?>
+                    <flag bool ?>
+
+                """,
+            ).format(
+                index=index,
+            )
+            for index in range(num_compounds)
+        )
+
+        start = time.perf_counter()
+        elements = _Parse(plugin, "Generation", schema)
+        parse_time = time.perf_counter() - start
+
+        sys.stdout.write("\n{} ({} elements, parsed in {:.3f}s):\n".format(plugin.Name, num_compounds * 5, parse_time))
+
+        # Always use multiple workers, so that the generated content is compared even when
+        # the machine only has a single core.
+        max_workers = max(2, os.cpu_count() or 1)
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            for fast_path in [False, True]:
+                results = []
+
+                for this_max_workers in [1, max_workers]:
+                    generate_time, output_filename = _BestTime(
+                        lambda: _GenerateFile(
+                            plugin,
+                            elements,
+                            temp_directory,
+                            "Generation",
+                            fast_path=fast_path,
+                            max_workers=this_max_workers,
+                        ),
+                    )
+
+                    sys.stdout.write(
+                        "    fast_path={:<6} max_workers={:<3} Generate {:.3f}s ({:,} bytes)\n".format(
+                            str(fast_path),
+                            this_max_workers,
+                            generate_time,
+                            os.path.getsize(output_filename),
+                        ),
+                    )
+
+                    with open(output_filename) as f:
+                        results.append(f.read())
+
+                # The content is the same regardless of the number of workers
+                self.assertEqual(results[1], results[0])
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_SCHEMA                                     = textwrap.dedent(
+    """\
+    <address>:
+        <street string>
+        <city string>
+        <postal_code string validation_expression="\\d{5}">
+        <unit int min=1 ?>
+
+    <person>:
+        <name string>
+        <age int min=0 max=150>
+        <email string ?>
+        <active bool default=true ?>
+        <addresses address+>
+        <tags string*>
+
+    <people person*>
+    """,
+)
+
+_NUMERIC_SCHEMA                             = textwrap.dedent(
+    """\
+    <series>:
+        <name string>
+        <values number min=-1000.0 max=1000.0 *>
+        <counts int min=0 *>
+
+    <all_series series*>
+    """,
+)
+
+_RECORD_SCHEMA                              = textwrap.dedent(
+    """\
+    <record>:
+        <id guid>
+        <created datetime>
+        <elapsed duration>
+        <name string>
+        <value number>
+        <count int min=0>
+
+    <records record*>
+    """,
+)
+
+
+# ----------------------------------------------------------------------
+def _Generate(plugin, output_dir, output_name, schema=_SCHEMA, **settings):
+    output_filename = _GenerateFile(
+        plugin,
+        _Parse(plugin, output_name, schema),
+        output_dir,
+        output_name,
+        **settings
+    )
+
+    spec = importlib.util.spec_from_file_location(output_name, output_filename)
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+# ----------------------------------------------------------------------
+def _Parse(plugin, output_name, schema):
+    return ParseStrings(
+        {output_name: schema},
+        plugin,
+        False,
+        False,
+    )
+
+
+# ----------------------------------------------------------------------
+def _GenerateFile(plugin, elements, output_dir, output_name, **settings):
+    kwargs = dict(plugin.GenerateCustomSettingsAndDefaults())
+    kwargs.update(settings)
+
+    output_filenames = list(plugin.GenerateOutputFilenames({"output_dir": output_dir, "output_name": output_name}))
+    assert len(output_filenames) == 1, output_filenames
+
+    result = plugin.Generate(
+        None,
+        None,
+        [],
+        output_filenames,
+        output_name,
+        elements,
+        range(len(elements)),
+        StreamDecorator(None),
+        StreamDecorator(None),
+        False,
+        **kwargs
+    )
+    assert not result, result
+
+    return output_filenames[0]
+
+
+# ----------------------------------------------------------------------
+def _BestTime(func, num_iterations=3):
+    # Use the best time to reduce the impact of other activity on the machine
+    best_time = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        result = func()
+        this_time = time.perf_counter() - start
+
+        if best_time is None or this_time < best_time:
+            best_time = this_time
+
+    return best_time, result
+
+
+# ----------------------------------------------------------------------
+class _Object(object):
+    # ----------------------------------------------------------------------
+    def __init__(self, **kwargs):
+        for k, v in six.iteritems(kwargs):
+            setattr(self, k, v)
+
+
+# ----------------------------------------------------------------------
+def _CreateItem(index):
+    address = _Object(
+        street="{} Main Street".format(index),
+        city="City {}".format(index % 50),
+        postal_code="{:05}".format(index),
+    )
+
+    result = _Object(
+        name="Person {}".format(index),
+        age=index % 100,
+        addresses=[address],
+        tags=["tag{}".format(tag_index) for tag_index in range(index % 4)],
+    )
+
+    if index % 2:
+        result.email = "person{}@example.com".format(index)
+        address.unit = index % 10 + 1
+
+    if index % 3:
+        result.active = False
+
+    return result
+
+
+# ----------------------------------------------------------------------
+def _ToDict(item):
+    if isinstance(item, list):
+        return [_ToDict(i) for i in item]
+
+    if hasattr(item, "__dict__"):
+        return {k: _ToDict(v) for k, v in six.iteritems(item.__dict__) if not k.startswith("_")}
+
+    return item
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -15,8 +15,11 @@
 # ----------------------------------------------------------------------
 """Contains the PythonSerializationImpl object"""
 
+import importlib.util
+import multiprocessing
 import os
-import textwrap
+import pickle
+import sys
 
 from collections import OrderedDict
 
@@ -26,7 +29,6 @@ import CommonEnvironment
 from CommonEnvironment.CallOnExit import CallOnExit
 from CommonEnvironment import Interface
 from CommonEnvironment.StreamDecorator import StreamDecorator
-from CommonEnvironment import StringHelpers
 
 from CommonEnvironment.TypeInfo.AnyOfTypeInfo import AnyOfTypeInfo
 from CommonEnvironment.TypeInfo.ClassTypeInfo import ClassTypeInfo
@@ -46,7 +48,8 @@ with InitRelativeImports():
     from ...Schema import Attributes
     from ...Schema import Elements
 
-    from .ElementVisitors import ToPythonName
+    from .ElementVisitors import GetNumpyDataType, IsNumericCollection, ToPythonName
+    from .ElementVisitors.FastPathElementVisitor import FastPathElementVisitor
     from .ElementVisitors.ItemMethodElementVisitor import ItemMethodElementVisitor
     from .ElementVisitors.TypeInfoElementVisitor import TypeInfoElementVisitor
 
@@ -54,6 +57,8 @@ with InitRelativeImports():
     from .StatementWriters.PythonDestinationStatementWriter import PythonDestinationStatementWriter
     from .StatementWriters.PythonSourceStatementWriter import PythonSourceStatementWriter
 
+    from .Templates import Dedent, IndentedStream, LeftJustify
+
 # ----------------------------------------------------------------------
 class PythonSerializationImpl(PluginBase):
     """\
@@ -98,6 +103,7 @@ class PythonSerializationImpl(PluginBase):
     def GetAdditionalGeneratorItems(cls, context):
         return [
             _script_fullpath,
+            FastPathElementVisitor,
             ItemMethodElementVisitor,
             TypeInfoElementVisitor,
             PythonDestinationStatementWriter,
@@ -112,6 +118,13 @@ class PythonSerializationImpl(PluginBase):
         yield "no_deserialization", False
         yield "custom_serialize_item_args", "{}"
         yield "custom_deserialize_item_args", "{}"
+        # Generates functions specialized for the schema that are used at the "full" validation
+        # level. They help most with compounds that have many fundamental children and with
+        # constrained fundamental collections (which are validated as a whole); collections of
+        # unconstrained values gain little, as each item is still converted via its TypeInfo.
+        yield "fast_path", False
+        yield "numpy_arrays", False
+        yield "max_workers", 1
 
     # ----------------------------------------------------------------------
     @staticmethod
@@ -165,15 +178,32 @@ class PythonSerializationImpl(PluginBase):
         no_deserialization,
         custom_serialize_item_args,
         custom_deserialize_item_args,
+        fast_path,
+        numpy_arrays,
+        max_workers,
+        **plugin_settings
     ):
         assert len(output_filenames) == 1, output_filenames
         output_filename = output_filenames[0]
 
+        if fast_path and not (
+            issubclass(cls._SourceStatementWriter, PythonSourceStatementWriter)
+            and issubclass(cls._DestinationStatementWriter, PythonDestinationStatementWriter)
+        ):
+            raise Exception("The '{}' plugin does not support the 'fast_path' setting".format(cls.Name))
+
+        if numpy_arrays:
+            cls._ValidatePackage("numpy", "The 'numpy_arrays' setting")
+
+        # Plugins may be invoked multiple times within the same process (for example, by
+        # the server or when watching files), so reset any state from a previous invocation.
+        cls._include_validate_keys = False
+
         status_stream.write("Creating '{}'...".format(output_filename))
         with status_stream.DoneManager() as dm:
             include_map = cls._GenerateIncludeMap(elements, include_indexes)
 
-            with open(output_filename, "w") as f:
+            with open(output_filename, "w") as f, _ElementEmitter(cls, max_workers) as emitter:
                 f.write(
                     cls._GenerateFileHeader(
                         prefix="# ",
@@ -182,12 +212,15 @@ class PythonSerializationImpl(PluginBase):
                 )
 
                 f.write(
-                    textwrap.dedent(
+                    Dedent(
                         """\
                         import copy
+                        import functools
+                        import itertools
                         import sys
 
                         from collections import OrderedDict
+                        from concurrent.futures import ProcessPoolExecutor
 
                         import six
 
@@ -208,15 +241,19 @@ class PythonSerializationImpl(PluginBase):
 
                         # <Standard import should be placed before...> pylint: disable = C0411
 
-                        # ----------------------------------------------------------------------
                         """,
                     ),
                 )
 
-                cls._WriteFileHeader(f)
+                if numpy_arrays:
+                    f.write("import numpy\n\n")
+
+                f.write("# ----------------------------------------------------------------------\n")
+
+                cls._WriteFileHeader(f, **plugin_settings)
                 with CallOnExit(lambda: cls._WriteFileFooter(f)):
                     f.write(
-                        textwrap.dedent(
+                        Dedent(
                             """\
                             # ----------------------------------------------------------------------
                             # <Method name "..." doesn't conform to PascalCase naming style> pylint: disable = C0103
@@ -285,13 +322,36 @@ class PythonSerializationImpl(PluginBase):
 
                     # Global methods
                     f.write(
-                        textwrap.dedent(
-                            """\
+                        Dedent(
+                            '''\
                             # ----------------------------------------------------------------------
                             # |
                             # |  Utility Methods
                             # |
-                            """,
+                            # ----------------------------------------------------------------------
+                            def SetValidationLevel(validation_level):
+                                """\\
+                                Sets the validation level used by the Serialize and Deserialize methods when
+                                a level isn't explicitly provided.
+
+                                    "full":         Values are completely validated (default).
+                                    "structure":    The number of items and the children of compound items are
+                                                    validated; fundamental values are converted but constraints
+                                                    (such as min, max, or validation expressions) aren't checked.
+                                    "none":         Values are converted without validation; this should only be
+                                                    used with trusted content (such as content created by this
+                                                    module).
+                                """
+
+                                global _validation_level
+
+                                if validation_level not in _VALIDATION_LEVELS:
+                                    raise Exception("'{}' is not a valid validation level".format(validation_level))
+
+                                _validation_level = validation_level
+
+
+                            ''',
                         ),
                     )
 
@@ -321,6 +381,7 @@ class PythonSerializationImpl(PluginBase):
                             serialize_source_writer,
                             serialize_dest_writer,
                             is_serialize=True,
+                            fast_path=fast_path,
                         )
 
                     if not no_deserialization:
@@ -330,20 +391,76 @@ class PythonSerializationImpl(PluginBase):
                             deserialize_source_writer,
                             deserialize_dest_writer,
                             is_serialize=False,
+                            fast_path=fast_path,
                         )
 
                     # Type Infos
-                    cls._WriteTypeInfos(top_level_elements, elements, f)
+                    cls._WriteTypeInfos(top_level_elements, elements, f, emitter)
 
                     # Serializer/Deserializer methods
+                    global_utility_methods = set()
+
                     if not no_serialization:
-                        cls._WriteSerializer(elements, f, serialize_source_writer, serialize_dest_writer, custom_serialize_item_args)
+                        cls._WriteSerializer(elements, f, serialize_source_writer, serialize_dest_writer, custom_serialize_item_args, global_utility_methods, numpy_arrays, emitter)
 
                     if not no_deserialization:
-                        cls._WriteDeserializer(elements, f, deserialize_source_writer, deserialize_dest_writer, custom_deserialize_item_args)
+                        cls._WriteDeserializer(elements, f, deserialize_source_writer, deserialize_dest_writer, custom_deserialize_item_args, global_utility_methods, numpy_arrays, emitter)
+
+                    # Object types
+                    if not no_deserialization or issubclass(cls._DestinationStatementWriter, PythonDestinationStatementWriter):
+                        cls._WriteObjectTypes(elements, f)
+
+                    # Fast path methods
+                    if fast_path:
+                        if not no_serialization:
+                            cls._WriteFastPath(elements, f, serialize_source_writer, serialize_dest_writer, custom_serialize_item_args, numpy_arrays, is_serializer=True)
+
+                        if not no_deserialization:
+                            cls._WriteFastPath(elements, f, deserialize_source_writer, deserialize_dest_writer, custom_deserialize_item_args, numpy_arrays, is_serializer=False)
+
+                        f.write(
+                            Dedent(
+                                """\
+                                # ----------------------------------------------------------------------
+                                # Raised when an item can't be processed by the fast path; the standard
+                                # implementation is invoked to produce detailed error information.
+                                class _FastPathException(Exception):
+                                    pass
+
+
+                                """,
+                            ),
+                        )
+
+                    if numpy_arrays:
+                        f.write(
+                            Dedent(
+                                """\
+                                # ----------------------------------------------------------------------
+                                # Collections of int and number values are deserialized as numpy arrays
+                                # (when 'numpy_arrays' is set) and can be serialized from numpy arrays.
+                                def _ToNumpyArray(items, dtype):
+                                    try:
+                                        return numpy.array(items, dtype=dtype)
+                                    except OverflowError:
+                                        # The integers are too large for a fixed-size type
+                                        return numpy.array(items, dtype=object)
+
+
+                                # ----------------------------------------------------------------------
+                                def _FromNumpyArray(items):
+                                    if isinstance(items, numpy.ndarray):
+                                        return items.tolist()
+
+                                    return items
+
+
+                                """,
+                            ),
+                        )
 
                     f.write(
-                        textwrap.dedent(
+                        Dedent(
                             """\
                             # ----------------------------------------------------------------------
                             # ----------------------------------------------------------------------
@@ -358,13 +475,198 @@ class PythonSerializationImpl(PluginBase):
 
                                 # <The raise statement is not inside an except clause> pylint: disable = E0704
                                 raise
+
+
+                            # ----------------------------------------------------------------------
+                            _VALIDATION_LEVELS = ["full", "structure", "none"]
+
+                            _validation_level = "full"
+
+                            _impl_classes = {}
+
+
+                            # ----------------------------------------------------------------------
+                            def _GetImplClass(base_class, validation_level, lazy=False):
+                                # Returns a class derived from Serializer or Deserializer with the specified settings
+                                if validation_level is None:
+                                    validation_level = _validation_level
+
+                                key = (base_class, validation_level, lazy)
+
+                                impl_class = _impl_classes.get(key, None)
+                                if impl_class is None:
+                                    if validation_level not in _VALIDATION_LEVELS:
+                                        raise Exception("'{}' is not a valid validation level".format(validation_level))
+
+                                    if validation_level == "full" and not lazy:
+                                        impl_class = base_class
+                                    else:
+                                        impl_class = type(
+                                            base_class.__name__,
+                                            (base_class,),
+                                            {
+                                                "_lazy": lazy,
+                                                "_validate_structure": validation_level != "none",
+                                                "_validate_items": validation_level == "full",
+                                            },
+                                        )
+
+                                    # Variations are selected by attempting to convert an item, which relies on validation
+                                    impl_class._full_validation_class = impl_class if validation_level == "full" else _GetImplClass(base_class, "full", lazy)
+
+                                    _impl_classes[key] = impl_class
+
+                                return impl_class
+
+
+                            # ----------------------------------------------------------------------
+                            _unconstrained_type_infos = {}
+
+
+                            # ----------------------------------------------------------------------
+                            def _GetUnconstrainedTypeInfo(type_info):
+                                # Returns a TypeInfo object of the same type, but without any constraints. Items
+                                # that aren't validated are converted with this object, as SerializeItem and
+                                # DeserializeItem validate items with the TypeInfo object that they are provided.
+                                entry = _unconstrained_type_infos.get(id(type_info), None)
+                                if entry is None:
+                                    if isinstance(type_info, EnumTypeInfo):
+                                        result = EnumTypeInfo(
+                                            type_info.Values,
+                                            friendly_values=type_info.FriendlyValues,
+                                            arity=type_info.Arity,
+                                        )
+                                    elif isinstance(type_info, StringTypeInfo):
+                                        result = StringTypeInfo(
+                                            min_length=0,
+                                            arity=type_info.Arity,
+                                        )
+                                    elif isinstance(type_info, (DirectoryTypeInfo, FilenameTypeInfo)):
+                                        result = type(type_info)(
+                                            ensure_exists=False,
+                                            arity=type_info.Arity,
+                                        )
+                                    else:
+                                        result = type(type_info)(
+                                            arity=type_info.Arity,
+                                        )
+
+                                    # The original object is stored as well so that its id isn't reused
+                                    entry = (type_info, result)
+                                    _unconstrained_type_infos[id(type_info)] = entry
+
+                                return entry[1]
+
+
+                            # ----------------------------------------------------------------------
+                            def _ConvertFundamentalItems(type_info, items, convert_item_func, validate_items, validate_converted_items):
+                                # Converts the items in a collection of fundamental values at once and validates the
+                                # collection as a whole. Returns None if the items can't be converted this way or if
+                                # any of them are invalid; the caller should convert the items individually in that
+                                # case, which provides detailed information about errors.
+                                if not isinstance(items, (list, tuple)):
+                                    return None
+
+                                try:
+                                    if validate_items and not validate_converted_items and not _AreValidFundamentalItems(type_info, items):
+                                        return None
+
+                                    results = [convert_item_func(item) for item in items]
+
+                                    if validate_items and validate_converted_items and not _AreValidFundamentalItems(type_info, results):
+                                        return None
+
+                                    return results
+
+                                except Exception:
+                                    return None
+
+
+                            # ----------------------------------------------------------------------
+                            def _AreValidFundamentalItems(type_info, items):
+                                if items and type_info.ValidationFunc is None and isinstance(type_info, (IntTypeInfo, FloatTypeInfo)):
+                                    # Numeric values can be validated with min and max, which are much faster than
+                                    # validating the items individually.
+                                    if set(map(type, items)).issubset([int] if isinstance(type_info, IntTypeInfo) else [int, float]):
+                                        # NaN values fail these comparisons, in which case the items are converted individually
+                                        return (
+                                            (type_info.Min is None or min(items) >= type_info.Min)
+                                            and (type_info.Max is None or max(items) <= type_info.Max)
+                                        )
+
+                                for item in items:
+                                    if type_info.ValidateItemNoThrow(item) is not None:
+                                        return False
+
+                                return True
+
+
+                            # ----------------------------------------------------------------------
+                            def _InvokeMany(func, items, max_workers, chunk_size):
+                                if max_workers is None:
+                                    return [func(index, item) for index, item in enumerate(items)]
+
+                                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                                    return list(executor.map(func, itertools.count(), items, chunksize=chunk_size))
+
+
+                            # ----------------------------------------------------------------------
+                            def _IterDeserialize(items, name, type_info, deserialize_item_func, key_attribute_name, validate_arity):
+                                keys = set()
+                                num_items = 0
+
+                                while True:
+                                    try:
+                                        try:
+                                            try:
+                                                try:
+                                                    item = next(items)
+                                                except StopIteration:
+                                                    break
+
+                                                item = deserialize_item_func(item)
+
+                                                if key_attribute_name is not None:
+                                                    key = getattr(item, key_attribute_name)
+
+                                                    if key in keys:
+                                                        raise KeySerializationException("The key '{}' is not unique: '{}'".format(key_attribute_name, key))
+
+                                                    keys.add(key)
+
+                                                if validate_arity and type_info.Arity.Max is not None and num_items == type_info.Arity.Max:
+                                                    type_info.ValidateArity([item] * (num_items + 1))
+                                            except:
+                                                _DecorateActiveException("Index {}".format(num_items))
+                                        except:
+                                            _DecorateActiveException(name)
+                                    except SerializationException:
+                                        raise
+                                    except Exception as ex:
+                                        raise DeserializeException(ex)
+
+                                    num_items += 1
+                                    yield item
+
+                                try:
+                                    try:
+                                        if num_items == 0:
+                                            type_info.ValidateArity(None)
+                                        elif validate_arity and num_items < type_info.Arity.Min:
+                                            type_info.ValidateArity([None] * num_items)
+                                    except:
+                                        _DecorateActiveException(name)
+                                except SerializationException:
+                                    raise
+                                except Exception as ex:
+                                    raise DeserializeException(ex)
                             """,
                         ),
                     )
 
                     if cls._include_validate_keys:
                         f.write(
-                            textwrap.dedent(
+                            Dedent(
                                 """\
 
                                 # ----------------------------------------------------------------------
@@ -456,7 +758,10 @@ class PythonSerializationImpl(PluginBase):
     @staticmethod
     @Interface.abstractmethod
     def _WriteFileHeader(output_stream):
-        """Writes a file header for the generated code"""
+        """\
+        Writes a file header for the generated code; settings specific to the derived
+        plugin are provided as keyword arguments.
+        """
         raise Exception("Abstract method")
 
     # ----------------------------------------------------------------------
@@ -466,6 +771,17 @@ class PythonSerializationImpl(PluginBase):
         """Writes a file footer for the generated code"""
         raise Exception("Abstract method")
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _ValidatePackage(package_name, desc):
+        """\
+        Raises an exception if an optional package imported by the generated code
+        isn't installed; 'desc' describes the setting or plugin that requires it.
+        """
+
+        if importlib.util.find_spec(package_name) is None:
+            raise Exception("{} requires the '{}' package, which is not installed".format(desc, package_name))
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -499,26 +815,26 @@ class PythonSerializationImpl(PluginBase):
 
             to_string_statements = dest_writer.SerializeToString("result")
 
-            extra_args = textwrap.dedent(
+            extra_args = Dedent(
                 """
                 to_string=False,
                 """,
             )
 
             if "pretty_print" in to_string_statements:
-                extra_args += textwrap.dedent(
+                extra_args += Dedent(
                     """\
                     pretty_print=False,
                     """,
                 )
 
-            suffix = textwrap.dedent(
+            suffix = Dedent(
                 """\
                 if to_string:
                     result = {}
 
                 """,
-            ).format(StringHelpers.LeftJustify(to_string_statements, 4).strip())
+            ).format(LeftJustify(to_string_statements, 4).strip())
         else:
             method_name = "Deserialize"
             extra_args = ""
@@ -531,28 +847,32 @@ class PythonSerializationImpl(PluginBase):
             args = ""
 
             if has_compound:
-                args += textwrap.dedent(
+                args += Dedent(
                     """
                     process_additional_data=process_additional_data,
                     always_include_optional=always_include_optional,
                     """,
                 )
+            else:
+                args += "\n"
+
+            args += "validation_level=validation_level,\n"
 
             if extra_args:
-                args += textwrap.dedent(
+                args += Dedent(
                     """\
                     to_string=to_string,
                     """,
                 )
 
                 if "pretty_print" in extra_args:
-                    args += textwrap.dedent(
+                    args += Dedent(
                         """\
                         pretty_print=pretty_print,
                         """,
                     )
 
-            method_body = textwrap.dedent(
+            method_body = Dedent(
                 """\
                 return {method_name}_{name}(
                     root,
@@ -562,7 +882,7 @@ class PythonSerializationImpl(PluginBase):
             ).format(
                 method_name=method_name,
                 name=ToPythonName(elements[0]),
-                args=StringHelpers.LeftJustify(args, 4).rstrip(),
+                args=LeftJustify(args, 4).rstrip(),
             )
 
         else:
@@ -574,17 +894,19 @@ class PythonSerializationImpl(PluginBase):
                 if isinstance(element.Resolve(), (Elements.CompoundElement, Elements.SimpleElement)):
                     has_compound = True
 
-                    compound_args = textwrap.dedent(
+                    compound_args = Dedent(
                         """
                         process_additional_data=process_additional_data,
                         always_include_optional=always_include_optional,
                         """,
                     )
                 else:
-                    compound_args = ""
+                    compound_args = "\n"
+
+                compound_args += "validation_level=validation_level,\n"
 
                 statements.append(
-                    textwrap.dedent(
+                    Dedent(
                         """\
                         this_result = {method_name}_{name}(
                             root,
@@ -599,13 +921,13 @@ class PythonSerializationImpl(PluginBase):
                     ).format(
                         method_name=method_name,
                         name=ToPythonName(element),
-                        compound_args=StringHelpers.LeftJustify(compound_args, 4),
-                        append_statement=StringHelpers.LeftJustify(dest_writer.AppendChild(element, "result", "this_result"), 4).strip(),
-                        append_empty_statement=StringHelpers.LeftJustify(dest_writer.AppendChild(element, "result", None), 4).strip(),
+                        compound_args=LeftJustify(compound_args, 4),
+                        append_statement=LeftJustify(dest_writer.AppendChild(element, "result", "this_result"), 4).strip(),
+                        append_empty_statement=LeftJustify(dest_writer.AppendChild(element, "result", None), 4).strip(),
                     ),
                 )
 
-            method_body = textwrap.dedent(
+            method_body = Dedent(
                 '''\
                 """Convenience method that {method_name_lower}s all top-level elements"""
 
@@ -626,17 +948,19 @@ class PythonSerializationImpl(PluginBase):
             )
 
         if has_compound:
-            compound_args = textwrap.dedent(
+            compound_args = Dedent(
                 """
                 process_additional_data=False,
                 always_include_optional=False,
                 """,
             )
         else:
-            compound_args = ""
+            compound_args = "\n"
+
+        compound_args += "validation_level=None,\n"
 
         output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 def {method_name}(
@@ -648,15 +972,15 @@ class PythonSerializationImpl(PluginBase):
                 """,
             ).format(
                 method_name=method_name,
-                method_body=StringHelpers.LeftJustify(method_body, 4).strip(),
-                compound_args=StringHelpers.LeftJustify(compound_args, 4).rstrip(),
-                extra_args=StringHelpers.LeftJustify(extra_args, 4).rstrip(),
+                method_body=LeftJustify(method_body, 4).strip(),
+                compound_args=LeftJustify(compound_args, 4).rstrip(),
+                extra_args=LeftJustify(extra_args, 4).rstrip(),
             ),
         )
 
     # ----------------------------------------------------------------------
     @classmethod
-    def _WriteTopLevelMethods(cls, elements, output_stream, source_writer, dest_writer, is_serialize):
+    def _WriteTopLevelMethods(cls, elements, output_stream, source_writer, dest_writer, is_serialize, fast_path):
         if is_serialize:
             method_name = "Serialize"
         else:
@@ -664,30 +988,55 @@ class PythonSerializationImpl(PluginBase):
 
         for element in elements:
             if isinstance(element.Resolve(), (Elements.CompoundElement, Elements.SimpleElement)):
-                compound_params = textwrap.dedent(
+                compound_params = Dedent(
                     """
                     process_additional_data=False,
                     always_include_optional=False,
                     """,
                 )
 
-                compound_args = textwrap.dedent(
+                compound_args = Dedent(
                     """
                     process_additional_data=process_additional_data,
                     always_include_optional=always_include_optional,
                     """,
                 )
+
+                use_standard_path = "process_additional_data"
+                fast_path_args = ", always_include_optional"
+
+                many_arg_names = ["process_additional_data", "always_include_optional"]
+
+                if not is_serialize:
+                    compound_params += "lazy=False,\n"
+                    many_arg_names.append("lazy")
             else:
-                compound_params = ""
+                compound_params = "\n"
                 compound_args = ""
 
+                use_standard_path = None
+                fast_path_args = ""
+
+                many_arg_names = []
+
+            compound_params += "validation_level=None,\n"
+            many_arg_names.append("validation_level")
+
+            class_name = "{}r".format(method_name)
+
+            # The fast path always validates completely and creates all of the children
+            use_standard_path = "{}impl_class is not {}".format(
+                "{} or ".format(use_standard_path) if use_standard_path else "",
+                class_name,
+            )
+
             optional_collection_clause = ""
 
             if element.TypeInfo.Arity.IsCollection:
                 var_name = "items"
 
                 if element.TypeInfo.Arity.Min == 0:
-                    optional_collection_clause = textwrap.dedent(
+                    optional_collection_clause = Dedent(
                         """
 
                         if {var_name} is DoesNotExist:
@@ -707,14 +1056,14 @@ class PythonSerializationImpl(PluginBase):
                 to_string_statements = dest_writer.SerializeToString(var_name)
 
                 if to_string_statements:
-                    extra_args = textwrap.dedent(
+                    extra_args = Dedent(
                         """
                         to_string=False,
                         pretty_print=False,
                         """,
                     )
 
-                    suffix = textwrap.dedent(
+                    suffix = Dedent(
                         """\
 
                         if to_string and {var_name} not in [DoesNotExist, None]:
@@ -722,9 +1071,15 @@ class PythonSerializationImpl(PluginBase):
                         """,
                     ).format(
                         var_name=var_name,
-                        statement=StringHelpers.LeftJustify(to_string_statements, 4).strip(),
+                        statement=LeftJustify(to_string_statements, 4).strip(),
                     )
 
+                    many_arg_names += ["to_string", "pretty_print"]
+
+            # Values provided to the Many methods are not converted or looked up, so
+            # 'is_root' isn't needed there.
+            many_extra_args = extra_args
+
             convenience_conversions = source_writer.ConvenienceConversions(var_name, element)
             if "is_root" in convenience_conversions:
                 if not extra_args:
@@ -732,8 +1087,52 @@ class PythonSerializationImpl(PluginBase):
 
                 extra_args += "is_root=False,\n"
 
+            impl_class_statement = "impl_class = _GetImplClass({}, validation_level{})\n\n".format(
+                class_name,
+                ", lazy" if not is_serialize and compound_args else "",
+            )
+
+            invoke_statement = Dedent(
+                """\
+                {var_name} = impl_class().{resolved_name}(
+                    {var_name},{compound_args}
+                )
+                """,
+            ).format(
+                var_name=var_name,
+                resolved_name=ToPythonName(element.Resolve()),
+                compound_args=LeftJustify(compound_args, 4).rstrip(),
+            )
+
+            fast_path_function_name = FastPathElementVisitor.GetFunctionName(element, is_serialize) if fast_path else None
+            if fast_path_function_name is not None:
+                invoke_statement = Dedent(
+                    """\
+                    use_standard_path = {use_standard_path}
+
+                    if not use_standard_path:
+                        try:
+                            {var_name} = {fast_path_function_name}({var_name}{fast_path_args})
+                        except Exception:
+                            # The standard implementation provides detailed information
+                            # about where the error occurred.
+                            use_standard_path = True
+
+                    if use_standard_path:
+                        {invoke_statement}
+                    """,
+                ).format(
+                    use_standard_path=use_standard_path,
+                    var_name=var_name,
+                    fast_path_function_name=fast_path_function_name,
+                    fast_path_args=fast_path_args,
+                    invoke_statement=LeftJustify(invoke_statement, 4).strip(),
+                )
+
+            invoke_statement = impl_class_statement + invoke_statement
+
             output_stream.write(
-                textwrap.dedent(
+                Dedent(
                     '''\
                     # ----------------------------------------------------------------------
                     def {method_name}_{name}(
@@ -745,9 +1144,7 @@ class PythonSerializationImpl(PluginBase):
 
                         try:
                             try:
-                                {var_name} = {method_name}r().{resolved_name}(
-                                    {var_name},{compound_args}
-                                ){optional_collection_clause}
+                                {invoke_statement}{optional_collection_clause}
                             except:
                                 _DecorateActiveException("{name}")
                         except SerializationException:
@@ -762,24 +1159,168 @@ class PythonSerializationImpl(PluginBase):
                 ).format(
                     name=ToPythonName(element),
                     method_name=method_name,
-                    resolved_name=ToPythonName(element.Resolve()),
                     var_name=var_name,
-                    compound_params=StringHelpers.LeftJustify(compound_params, 4).rstrip(),
-                    compound_args=StringHelpers.LeftJustify(compound_args, 16).rstrip(),
-                    optional_collection_clause=StringHelpers.LeftJustify(optional_collection_clause, 12).rstrip(),
-                    extra_args=StringHelpers.LeftJustify(extra_args, 4).rstrip(),
+                    compound_params=LeftJustify(compound_params, 4).rstrip(),
+                    invoke_statement=LeftJustify(invoke_statement, 12).strip(),
+                    optional_collection_clause=LeftJustify(optional_collection_clause, 12).rstrip(),
+                    extra_args=LeftJustify(extra_args, 4).rstrip(),
+                    source_type=source_writer.ObjectTypeDesc,
+                    dest_type=dest_writer.ObjectTypeDesc,
+                    convenience=LeftJustify(convenience_conversions or "# No convenience conversions", 4).strip(),
+                    suffix=LeftJustify(suffix, 4),
+                ),
+            )
+
+            output_stream.write(
+                Dedent(
+                    '''\
+                    # ----------------------------------------------------------------------
+                    def {method_name}Many_{name}(
+                        {var_name}_iterable,{compound_params}{extra_args}
+                        max_workers=None,
+                        chunk_size=100,
+                    ):
+                        """\\
+                        {method_name}s a sequence of '{name}' values from {source_type} to {dest_type}.
+
+                        The values are processed in a process pool when 'max_workers' is provided.
+                        Unlike {method_name}_{name}, strings and filenames are not converted and the
+                        values are not looked up by name.
+                        """
+
+                        return _InvokeMany(
+                            functools.partial(
+                                _{method_name}ManyItem_{name},{partial_args}
+                            ),
+                            {var_name}_iterable,
+                            max_workers,
+                            chunk_size,
+                        )
+
+
+                    # ----------------------------------------------------------------------
+                    def _{method_name}ManyItem_{name}(
+                        index,
+                        {var_name},{compound_params}{extra_args}
+                    ):
+                        try:
+                            try:
+                                try:
+                                    {invoke_statement}{optional_collection_clause}
+                                except:
+                                    _DecorateActiveException("{name}")
+                            except:
+                                _DecorateActiveException("Index {{}}".format(index))
+                        except SerializationException:
+                            raise
+                        except Exception as ex:
+                            raise {method_name}Exception(ex)
+                        {suffix}
+                        return {var_name}
+
+
+                    ''',
+                ).format(
+                    name=ToPythonName(element),
+                    method_name=method_name,
+                    var_name=var_name,
+                    compound_params=LeftJustify(compound_params, 4).rstrip(),
+                    extra_args=LeftJustify(many_extra_args, 4).rstrip(),
+                    partial_args=LeftJustify(
+                        "".join("\n{0}={0},".format(arg_name) for arg_name in many_arg_names),
+                        12,
+                    ).rstrip(),
+                    invoke_statement=LeftJustify(invoke_statement, 16).strip(),
+                    optional_collection_clause=LeftJustify(optional_collection_clause, 16).rstrip(),
                     source_type=source_writer.ObjectTypeDesc,
                     dest_type=dest_writer.ObjectTypeDesc,
-                    convenience=StringHelpers.LeftJustify(convenience_conversions or "# No convenience conversions", 4).strip(),
-                    suffix=StringHelpers.LeftJustify(suffix, 4),
+                    suffix=LeftJustify(suffix, 4),
                 ),
             )
 
+            if not is_serialize:
+                cls._WriteIterDeserializeMethod(element, output_stream, source_writer, dest_writer)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _WriteIterDeserializeMethod(element, output_stream, source_writer, dest_writer):
+        resolved_element = element.Resolve()
+
+        if not resolved_element.TypeInfo.Arity.IsCollection or getattr(resolved_element, "as_dictionary", False):
+            return
+
+        # The name matches the name used by the Deserialize method for collections
+        iter_items_statement = source_writer.IterItems("items", element)
+        if iter_items_statement is None:
+            return
+
+        resolved_name = ToPythonName(resolved_element)
+
+        if isinstance(resolved_element, (Elements.CompoundElement, Elements.SimpleElement)):
+            compound_params = Dedent(
+                """
+                process_additional_data=False,
+                always_include_optional=False,
+                """,
+            )
+
+            item_args = ", always_include_optional, process_additional_data"
+            validate_arity = "impl_class._validate_structure and not process_additional_data"
+        else:
+            compound_params = "\n"
+
+            item_args = ""
+            validate_arity = "impl_class._validate_structure"
+
+        compound_params += "validation_level=None,\n"
+
+        key = getattr(resolved_element, "key", None)
+
+        output_stream.write(
+            Dedent(
+                '''\
+                # ----------------------------------------------------------------------
+                def IterDeserialize_{name}(
+                    items,{compound_params}
+                ):
+                    """\\
+                    Deserializes '{name}' items one at a time from {source_type} to {dest_type}.
+
+                    'items' is a filename, a file-like object, or the serialized content. The
+                    items are read incrementally, so only the current item is held in memory.
+                    """
+
+                    impl_class = _GetImplClass(Deserializer, validation_level)
+
+                    return _IterDeserialize(
+                        {iter_items},
+                        "{name}",
+                        {resolved_name}_TypeInfo,
+                        lambda item: impl_class._{resolved_name}_Item(item{item_args}),
+                        {key},
+                        {validate_arity},
+                    )
+
+
+                ''',
+            ).format(
+                name=ToPythonName(element),
+                compound_params=LeftJustify(compound_params, 4).rstrip(),
+                source_type=source_writer.ObjectTypeDesc,
+                dest_type=dest_writer.ObjectTypeDesc,
+                iter_items=iter_items_statement,
+                resolved_name=resolved_name,
+                item_args=item_args,
+                key='"{}"'.format(key) if key is not None else "None",
+                validate_arity=validate_arity,
+            ),
+        )
+
     # ----------------------------------------------------------------------
     @classmethod
-    def _WriteTypeInfos(cls, top_level_elements, elements, output_stream):
+    def _WriteTypeInfos(cls, top_level_elements, elements, output_stream, emitter):
         output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 # |
@@ -790,13 +1331,50 @@ class PythonSerializationImpl(PluginBase):
             ),
         )
 
-        python_code_visitor = PythonCodeVisitor()
-
         type_info_template = "{0:<75} = {1}\n"
 
-        type_infos = OrderedDict()
+        # Children statements are named after the first element that uses them; populate
+        # the cache before the type infos are created so that each element can be processed
+        # independently.
         cached_children_statements = OrderedDict()
 
+        # ----------------------------------------------------------------------
+        def OnClassElement(element):
+            TypeInfoElementVisitor.UpdateCachedChildrenStatements(element, cached_children_statements)
+
+        # ----------------------------------------------------------------------
+
+        Elements.CreateElementVisitor(
+            on_compound_func=OnClassElement,
+            on_simple_func=OnClassElement,
+        ).Accept(elements)
+
+        type_infos = OrderedDict()
+
+        for results in emitter.Emit(elements, "_EmitTypeInfos", cached_children_statements):
+            for k, v in results:
+                type_infos[k] = v
+
+        if cached_children_statements:
+            for k, v in six.iteritems(cached_children_statements):
+                output_stream.write(type_info_template.format(v, k))
+
+            output_stream.write("\n")
+
+        for k, v in six.iteritems(type_infos):
+            output_stream.write(type_info_template.format(k, v))
+
+        output_stream.write("\n")
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _EmitTypeInfos(cls, elements, cached_children_statements):
+        """Returns a list of (name, type info statement) for the elements"""
+
+        python_code_visitor = PythonCodeVisitor()
+
+        type_infos = []
+
         type_info_visitor = TypeInfoElementVisitor(python_code_visitor, cached_children_statements)
 
         # ----------------------------------------------------------------------
@@ -805,10 +1383,10 @@ class PythonSerializationImpl(PluginBase):
             if type_info_value is not None:
                 python_name = ToPythonName(element)
 
-                type_infos["{}_TypeInfo".format(python_name)] = type_info_value
+                type_infos.append(("{}_TypeInfo".format(python_name), type_info_value))
 
                 if isinstance(element, Elements.SimpleElement):
-                    type_infos["{}__value__TypeInfo".format(python_name)] = python_code_visitor.Accept(element.TypeInfo.Items[element.FundamentalAttributeName])
+                    type_infos.append(("{}__value__TypeInfo".format(python_name), python_code_visitor.Accept(element.TypeInfo.Items[element.FundamentalAttributeName])))
 
             if isinstance(element, Elements.VariantElement):
                 for variation in element.Variations:
@@ -819,28 +1397,19 @@ class PythonSerializationImpl(PluginBase):
                     type_info_value = type_info_visitor.Accept(variation)
 
                     if type_info_value is not None:
-                        type_infos["{}_TypeInfo".format(ToPythonName(variation))] = type_info_value
+                        type_infos.append(("{}_TypeInfo".format(ToPythonName(variation)), type_info_value))
 
         # ----------------------------------------------------------------------
 
         cls._VisitElements(elements, OnElement)
 
-        if cached_children_statements:
-            for k, v in six.iteritems(cached_children_statements):
-                output_stream.write(type_info_template.format(v, k))
-
-            output_stream.write("\n")
-
-        for k, v in six.iteritems(type_infos):
-            output_stream.write(type_info_template.format(k, v))
-
-        output_stream.write("\n")
+        return type_infos
 
     # ----------------------------------------------------------------------
     @classmethod
-    def _WriteSerializer(cls, elements, output_stream, source_writer, dest_writer, custom_serialize_item_args):
+    def _WriteSerializer(cls, elements, output_stream, source_writer, dest_writer, custom_serialize_item_args, global_utility_methods, numpy_arrays, emitter):
         output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 # |
@@ -848,6 +1417,9 @@ class PythonSerializationImpl(PluginBase):
                 # |
                 # ----------------------------------------------------------------------
                 class Serializer(object):
+                    # Classes with different settings are created by _GetImplClass
+                    _validate_structure = True
+                    _validate_items = True
 
                 """,
             ),
@@ -859,6 +1431,9 @@ class PythonSerializationImpl(PluginBase):
             custom_serialize_item_args,
             source_writer,
             dest_writer,
+            global_utility_methods,
+            numpy_arrays,
+            emitter,
             is_serializer=True,
         )
 
@@ -869,9 +1444,9 @@ class PythonSerializationImpl(PluginBase):
 
     # ----------------------------------------------------------------------
     @classmethod
-    def _WriteDeserializer(cls, elements, output_stream, source_writer, dest_writer, custom_deserialize_item_args):
+    def _WriteDeserializer(cls, elements, output_stream, source_writer, dest_writer, custom_deserialize_item_args, global_utility_methods, numpy_arrays, emitter):
         output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
                 # |
@@ -879,6 +1454,10 @@ class PythonSerializationImpl(PluginBase):
                 # |
                 # ----------------------------------------------------------------------
                 class Deserializer(object):
+                    # Classes with different settings are created by _GetImplClass
+                    _lazy = False                           # Compound children are created when they are first accessed
+                    _validate_structure = True
+                    _validate_items = True
 
                 """,
             ),
@@ -890,23 +1469,332 @@ class PythonSerializationImpl(PluginBase):
             custom_deserialize_item_args,
             source_writer,
             dest_writer,
+            global_utility_methods,
+            numpy_arrays,
+            emitter,
             is_serializer=False,
         )
 
     # ----------------------------------------------------------------------
     @classmethod
-    def _WriteImpl(cls, elements, output_stream, custom_serialize_item_args, source_writer, dest_writer, is_serializer):
-        indented_stream = StreamDecorator(
-            output_stream,
-            line_prefix="    ",
-        )
-
-        content_stream = StreamDecorator(
-            indented_stream,
-            line_prefix="    ",
-        )
-
-        # Write the arity-based methods
+    def _WriteObjectTypes(cls, elements, output_stream):
+        output_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                # |
+                # |  Object Types
+                # |
+                # ----------------------------------------------------------------------
+                """,
+            ),
+        )
+
+        # ----------------------------------------------------------------------
+        def OnElement(element):
+            if not isinstance(element, (Elements.CompoundElement, Elements.SimpleElement)):
+                return
+
+            output_stream.write(
+                "{}\n".format(
+                    PythonDestinationStatementWriter.CreateObjectType(
+                        element,
+                        cls._EnumerateChildren(
+                            element,
+                            include_definitions=False,
+                        ),
+                    ),
+                ),
+            )
+
+        # ----------------------------------------------------------------------
+
+        cls._VisitElements(elements, OnElement)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _WriteImpl(
+        cls,
+        elements,
+        output_stream,
+        custom_serialize_item_args,
+        source_writer,
+        dest_writer,
+        global_utility_methods,             # Global content already written to the output stream
+        numpy_arrays,
+        emitter,
+        is_serializer,
+    ):
+        indented_stream = IndentedStream(output_stream, "    ")
+
+        arity_contents = []
+        item_contents = []
+
+        include_apply_optional_child = False
+        include_apply_optional_children = False
+        include_apply_optional_attribute = False
+
+        for arity_content, item_content, include_flags in emitter.Emit(
+            elements,
+            "_EmitImpl",
+            custom_serialize_item_args,
+            source_writer,
+            dest_writer,
+            numpy_arrays,
+            is_serializer,
+        ):
+            arity_contents.append(arity_content)
+            item_contents.append(item_content)
+
+            include_validate_keys, include_child, include_children, include_attribute = include_flags
+
+            if include_validate_keys:
+                cls._include_validate_keys = True
+
+            include_apply_optional_child = include_apply_optional_child or include_child
+            include_apply_optional_children = include_apply_optional_children or include_children
+            include_apply_optional_attribute = include_apply_optional_attribute or include_attribute
+
+        # Write the arity-based methods
+        indented_stream.write("".join(arity_contents))
+
+        indented_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                # ----------------------------------------------------------------------
+                """,
+            ),
+        )
+
+        # Item_ methods
+        indented_stream.write("".join(item_contents))
+
+        indented_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                # ----------------------------------------------------------------------
+                """,
+            ),
+        )
+
+        # _ApplyOptionalChild/_ApplyOptionalChildren/_ApplyOptionalAttribute
+        content_template = Dedent(
+            """\
+            # ----------------------------------------------------------------------
+            @classmethod
+            def {method_name}(cls, {var_name}, attribute_name, dest, apply_func, always_include_optional{default_value_param}):
+                value = {get_statement}
+
+                if value is not DoesNotExist:
+                    value = apply_func(value)
+                    if value is not DoesNotExist:
+                        {add_child}
+                        return
+
+                {default_value_statement}
+
+                if always_include_optional:
+                    {add_child_empty}
+
+            """,
+        )
+
+        if include_apply_optional_child:
+            optional_child_empty_element = source_writer.CreateTemporaryElement("attribute_name", "?")
+
+            indented_stream.write(
+                content_template.format(
+                    method_name="_ApplyOptionalChild",
+                    var_name="item",
+                    get_statement=LeftJustify(source_writer.GetChild("item", optional_child_empty_element), 4).strip(),
+                    add_child=LeftJustify(dest_writer.AppendChild(optional_child_empty_element, "dest", "value"), 12).strip(),
+                    add_child_empty=LeftJustify(dest_writer.AppendChild(optional_child_empty_element, "dest", None), 8).strip(),
+                    default_value_param=", default_value_func=None",
+                    default_value_statement=LeftJustify(
+                        Dedent(
+                            """\
+                            if default_value_func:
+                                {}
+                                return
+
+                            """,
+                        ).format(LeftJustify(dest_writer.AppendChild(optional_child_empty_element, "dest", "default_value_func()"), 4).strip()),
+                        4,
+                    ).strip(),
+                ),
+            )
+
+        if include_apply_optional_children:
+            optional_children_empty_element = dest_writer.CreateTemporaryElement("attribute_name", "*")
+
+            indented_stream.write(
+                content_template.format(
+                    method_name="_ApplyOptionalChildren",
+                    var_name="items",
+                    get_statement=LeftJustify(source_writer.GetChild("items", optional_children_empty_element), 4).strip(),
+                    add_child=LeftJustify(dest_writer.AppendChild(optional_children_empty_element, "dest", "value"), 12).strip(),
+                    add_child_empty=LeftJustify(dest_writer.AppendChild(optional_children_empty_element, "dest", None), 8).strip(),
+                    default_value_param="",
+                    default_value_statement="# No default statement",
+                ),
+            )
+
+        if include_apply_optional_attribute:
+            optional_attribute_empty_element = dest_writer.CreateTemporaryElement(
+                "attribute_name",
+                "?",
+                is_attribute=True,
+            )
+
+            indented_stream.write(
+                content_template.format(
+                    method_name="_ApplyOptionalAttribute",
+                    var_name="item",
+                    get_statement=LeftJustify(source_writer.GetChild("item", optional_attribute_empty_element), 4).strip(),
+                    add_child=LeftJustify(dest_writer.AppendChild(optional_attribute_empty_element, "dest", "value"), 12).strip(),
+                    add_child_empty=LeftJustify(dest_writer.AppendChild(optional_attribute_empty_element, "dest", None), 8),
+                    default_value_param=", default_value_func=None",
+                    default_value_statement=LeftJustify(
+                        Dedent(
+                            """\
+                            if default_value_func:
+                                {}
+                                return
+
+                            """,
+                        ).format(LeftJustify(dest_writer.AppendChild(optional_attribute_empty_element, "dest", "default_value_func()"), 4).strip()),
+                        4,
+                    ).strip(),
+                ),
+            )
+
+        # _ApplyAdditionalData
+        temporary_children_element = source_writer.CreateTemporaryElement("name", "+")
+
+        indented_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                @classmethod
+                def _ApplyAdditionalData(
+                    cls,
+                    source,
+                    dest,
+                    exclude_names,
+                ):
+                    for name, child in {get_additional_children}:
+                        try:
+                            if isinstance(child, list):
+                                children = []
+
+                                for index, item in enumerate(child):
+                                    item_name = "Index {{}}".format(index)
+
+                                    try:
+                                        children.append(cls._CreateAdditionalDataItem(item_name, item))
+                                    except:
+                                        _DecorateActiveException(item_name)
+
+                                {append_children}
+                            else:
+                                {append}
+                        except:
+                            _DecorateActiveException(name)
+
+                """,
+            ).format(
+                get_additional_children=LeftJustify(source_writer.GetAdditionalDataChildren(), 4).strip(),
+                append=LeftJustify(
+                    dest_writer.AppendChild(source_writer.CreateTemporaryElement("name", "1"), "dest", "cls._CreateAdditionalDataItem(name, child)"),
+                    12,
+                ).strip(),
+                append_children=LeftJustify(
+                    dest_writer.AppendChild(temporary_children_element, "dest", dest_writer.CreateCollection(temporary_children_element, "children")),
+                    12,
+                ).strip(),
+            ),
+        )
+
+        # _RejectAdditionalData
+        indented_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                @classmethod
+                def _RejectAdditionalData(cls, source, exclude_names):
+                    errors = []
+
+                    for name, child in {get_additional_children}:
+                        errors.append(name)
+
+                    if errors:
+                        raise Exception("The item contains unexpected children: {{}}".format(", ".join(['"{{}}"'.format(error) for error in errors])))
+
+                """,
+            ).format(
+                get_additional_children=LeftJustify(source_writer.GetAdditionalDataChildren(), 4).strip(),
+            ),
+        )
+
+        # _CreateAdditionalDataItem
+        indented_stream.write(
+            Dedent(
+                """\
+                # ----------------------------------------------------------------------
+                @classmethod
+                def _CreateAdditionalDataItem(cls, name, source):
+                    {statements}
+
+                """,
+            ).format(
+                statements=LeftJustify(source_writer.CreateAdditionalDataItem(dest_writer, "name", "source"), 4).strip(),
+            ),
+        )
+
+        # Write the utility funcs
+        result = dest_writer.GetClassUtilityMethods(source_writer)
+        if result is not None:
+            indented_stream.write("{}\n\n".format(result.strip()))
+
+        result = source_writer.GetClassUtilityMethods(dest_writer)
+        if result is not None:
+            indented_stream.write("{}\n\n".format(result.strip()))
+
+        output_stream.write("\n")
+
+        # Global methods may be provided by both the source and dest statement writers
+        # for both the Serializer and Deserializer; make sure that they are only written
+        # once.
+        for result in [
+            source_writer.GetGlobalUtilityMethods(dest_writer),
+            dest_writer.GetGlobalUtilityMethods(source_writer),
+        ]:
+            if result is None:
+                continue
+
+            result = result.strip()
+            if result in global_utility_methods:
+                continue
+
+            output_stream.write("{}\n\n\n".format(result))
+            global_utility_methods.add(result)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _EmitImpl(cls, elements, custom_serialize_item_args, source_writer, dest_writer, numpy_arrays, is_serializer):
+        """\
+        Returns the arity-based methods and Item_ methods for the elements, along with flags
+        that indicate if keys are validated and which _ApplyOptional methods are required.
+        """
+
+        arity_stream = six.moves.StringIO()
+        content_stream = IndentedStream(arity_stream, "    ")
+
+        nonlocals = CommonEnvironment.Nonlocals(
+            include_validate_keys=False,
+        )
 
         # ----------------------------------------------------------------------
         def OnElement(element):
@@ -924,9 +1812,9 @@ class PythonSerializationImpl(PluginBase):
                     unique_statement = None
 
                     if hasattr(resolved_element, "key"):
-                        cls._include_validate_keys = True
+                        nonlocals.include_validate_keys = True
 
-                        unique_statement = '_ValidateKeys("{key}", {arg_name})\n\n'.format(
+                        unique_statement = 'if cls._validate_structure:\n    _ValidateKeys("{key}", {arg_name})\n\n'.format(
                             key=resolved_element.key,
                             arg_name=arg_name if is_serializer else result_name,
                         )
@@ -934,24 +1822,41 @@ class PythonSerializationImpl(PluginBase):
                     if unique_statement and is_serializer:
                         content_stream.write(unique_statement)
 
-                    content_stream.write(
-                        textwrap.dedent(
+                    content = Dedent(
+                        """\
+                        {result_name} = []
+
+                        for this_index, {item_name} in enumerate({arg_name} or []):
+                            try:
+                                {result_name}.append({statement})
+                            except:
+                                _DecorateActiveException("Index {{}}".format(this_index))
+                        """,
+                    ).format(
+                        result_name=result_name,
+                        arg_name=arg_name,
+                        item_name=item_name,
+                        statement=statement,
+                    )
+
+                    if isinstance(resolved_element, Elements.FundamentalElement):
+                        # Items are converted individually when they can't be converted all at
+                        # once, as this provides detailed information about errors.
+                        content = Dedent(
                             """\
-                            {result_name} = []
+                            {result_name} = cls._{python_name}_Items({arg_name})
 
-                            for this_index, {item_name} in enumerate({arg_name} or []):
-                                try:
-                                    {result_name}.append({statement})
-                                except:
-                                    _DecorateActiveException("Index {{}}".format(this_index))
+                            if {result_name} is None:
+                                {content}
                             """,
                         ).format(
                             result_name=result_name,
+                            python_name=python_name,
                             arg_name=arg_name,
-                            item_name=item_name,
-                            statement=statement,
-                        ),
-                    )
+                            content=LeftJustify(content, 4).strip(),
+                        )
+
+                    content_stream.write(content)
 
                     if unique_statement and not is_serializer:
                         content_stream.write("\n")
@@ -967,7 +1872,7 @@ class PythonSerializationImpl(PluginBase):
                 # ----------------------------------------------------------------------
                 def ApplyContent(statement):
                     content_stream.write(
-                        textwrap.dedent(
+                        Dedent(
                             """\
                             {result_name} = {statement}
                             """,
@@ -987,8 +1892,8 @@ class PythonSerializationImpl(PluginBase):
                 extra_params = ""
 
             # Write the header
-            indented_stream.write(
-                textwrap.dedent(
+            arity_stream.write(
+                Dedent(
                     """\
                     # ----------------------------------------------------------------------
                     @classmethod
@@ -1004,7 +1909,7 @@ class PythonSerializationImpl(PluginBase):
             # Reference content...
             if isinstance(element, Elements.ReferenceElement):
                 content_stream.write(
-                    textwrap.dedent(
+                    Dedent(
                         """\
                         return cls.{reference_python_name}({arg_name}{extra_params})
 
@@ -1018,6 +1923,11 @@ class PythonSerializationImpl(PluginBase):
                 return
 
             # Standard content...
+            is_numpy_array = numpy_arrays and IsNumericCollection(element)
+
+            if is_numpy_array and is_serializer:
+                content_stream.write("{0} = _FromNumpyArray({0})\n\n".format(arg_name))
+
             does_not_exist_items = ["DoesNotExist", "None"]
 
             if element.TypeInfo.Arity.IsCollection:
@@ -1027,10 +1937,11 @@ class PythonSerializationImpl(PluginBase):
                     does_not_exist_items.append("[]")
 
             content_stream.write(
-                textwrap.dedent(
+                Dedent(
                     """\
                     if {arg_name} in [{does_not_exist_items}]:
-                        {python_name}_TypeInfo.ValidateArity(None)
+                        if cls._validate_structure:
+                            {python_name}_TypeInfo.ValidateArity(None)
                         return DoesNotExist
 
                     """,
@@ -1043,18 +1954,19 @@ class PythonSerializationImpl(PluginBase):
 
             if is_serializer:
                 if is_compound_like:
-                    validate_arity_template = textwrap.dedent(
+                    validate_arity_template = Dedent(
                         """\
-                        if not process_additional_data:
+                        if cls._validate_structure and not process_additional_data:
                             {python_name}_TypeInfo.ValidateArity({arg_name})
 
                         """,
 
                     )
                 else:
-                    validate_arity_template = textwrap.dedent(
+                    validate_arity_template = Dedent(
                         """\
-                        {python_name}_TypeInfo.ValidateArity({arg_name})
+                        if cls._validate_structure:
+                            {python_name}_TypeInfo.ValidateArity({arg_name})
 
                         """,
                     )
@@ -1076,18 +1988,19 @@ class PythonSerializationImpl(PluginBase):
 
             if not is_serializer:
                 if is_compound_like:
-                    validate_arity_template = textwrap.dedent(
+                    validate_arity_template = Dedent(
                         """\
 
-                        if not process_additional_data:
+                        if cls._validate_structure and not process_additional_data:
                             {python_name}_TypeInfo.ValidateArity({result_name})
                         """,
                     )
                 else:
-                    validate_arity_template = textwrap.dedent(
+                    validate_arity_template = Dedent(
                         """\
 
-                        {python_name}_TypeInfo.ValidateArity({result_name})
+                        if cls._validate_structure:
+                            {python_name}_TypeInfo.ValidateArity({result_name})
                         """,
                     )
 
@@ -1100,11 +2013,14 @@ class PythonSerializationImpl(PluginBase):
 
             if element.TypeInfo.Arity.IsCollection:
                 return_statement = dest_writer.CreateCollection(element, result_name)
+
+                if is_numpy_array and not is_serializer:
+                    return_statement = "_ToNumpyArray({}, {})".format(return_statement, GetNumpyDataType(element))
             else:
                 return_statement = result_name
 
             content_stream.write(
-                textwrap.dedent(
+                Dedent(
                     """\
 
                     return {return_statement}
@@ -1117,235 +2033,207 @@ class PythonSerializationImpl(PluginBase):
 
         cls._VisitElements(elements, OnElement)
 
-        indented_stream.write(
-            textwrap.dedent(
-                """\
-                # ----------------------------------------------------------------------
-                # ----------------------------------------------------------------------
-                """,
-            ),
-        )
+        item_stream = six.moves.StringIO()
 
-        # Item_ methods
         item_method_element_visitor = ItemMethodElementVisitor(
             cls._TypeInfoSerializationName,
             custom_serialize_item_args,
             source_writer,
             dest_writer,
-            indented_stream,
+            item_stream,
             cls._EnumerateChildren,
             is_serializer,
+            numpy_arrays=numpy_arrays,
         )
 
         item_method_element_visitor.Accept(elements)
 
-        indented_stream.write(
-            textwrap.dedent(
+        return (
+            arity_stream.getvalue(),
+            item_stream.getvalue(),
+            (
+                nonlocals.include_validate_keys,
+                item_method_element_visitor.IncludeApplyOptionalChild,
+                item_method_element_visitor.IncludeApplyOptionalChildren,
+                item_method_element_visitor.IncludeApplyOptionalAttribute,
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _WriteFastPath(cls, elements, output_stream, source_writer, dest_writer, custom_serialize_item_args, numpy_arrays, is_serializer):
+        output_stream.write(
+            Dedent(
                 """\
                 # ----------------------------------------------------------------------
+                # |
+                # |  Fast Path {}
+                # |
                 # ----------------------------------------------------------------------
                 """,
-            ),
+            ).format("Serializer" if is_serializer else "Deserializer"),
         )
 
-        # _ApplyOptionalChild/_ApplyOptionalChildren/_ApplyOptionalAttribute
-        content_template = textwrap.dedent(
-            """\
-            # ----------------------------------------------------------------------
-            @classmethod
-            def {method_name}(cls, {var_name}, attribute_name, dest, apply_func, always_include_optional{default_value_param}):
-                value = {get_statement}
+        fast_path_element_visitor = FastPathElementVisitor(
+            cls._TypeInfoSerializationName,
+            custom_serialize_item_args,
+            source_writer,
+            dest_writer,
+            output_stream,
+            cls._EnumerateChildren,
+            is_serializer,
+            numpy_arrays=numpy_arrays,
+        )
 
-                if value is not DoesNotExist:
-                    value = apply_func(value)
-                    if value is not DoesNotExist:
-                        {add_child}
-                        return
+        fast_path_element_visitor.Accept(elements)
 
-                {default_value_statement}
+        if fast_path_element_visitor.IncludeValidateKeys:
+            cls._include_validate_keys = True
 
-                if always_include_optional:
-                    {add_child_empty}
+        output_stream.write("\n")
 
-            """,
-        )
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _VisitElements(elements, on_element_func, *args, **kwargs):
+        Elements.CreateElementVisitor(
+            on_entering_element=on_element_func,
+            on_compound_visiting_children_func=lambda element: False,
+            on_simple_visiting_children_func=lambda element: False,
+        ).Accept(elements, *args, **kwargs)
 
-        if item_method_element_visitor.IncludeApplyOptionalChild:
-            optional_child_empty_element = source_writer.CreateTemporaryElement("attribute_name", "?")
 
-            indented_stream.write(
-                content_template.format(
-                    method_name="_ApplyOptionalChild",
-                    var_name="item",
-                    get_statement=StringHelpers.LeftJustify(source_writer.GetChild("item", optional_child_empty_element), 4).strip(),
-                    add_child=StringHelpers.LeftJustify(dest_writer.AppendChild(optional_child_empty_element, "dest", "value"), 12).strip(),
-                    add_child_empty=StringHelpers.LeftJustify(dest_writer.AppendChild(optional_child_empty_element, "dest", None), 8).strip(),
-                    default_value_param=", default_value_func=None",
-                    default_value_statement=StringHelpers.LeftJustify(
-                        textwrap.dedent(
-                            """\
-                            if default_value_func:
-                                {}
-                                return
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _ElementEmitter(object):
+    """\
+    Invokes PythonSerializationImpl methods that generate content for a list of elements.
 
-                            """,
-                        ).format(StringHelpers.LeftJustify(dest_writer.AppendChild(optional_child_empty_element, "dest", "default_value_func()"), 4).strip()),
-                        4,
-                    ).strip(),
-                ),
-            )
+    Content for each element is independent of the content generated for other elements,
+    so the elements are divided into chunks that are processed in a pool of worker processes
+    when max_workers > 1. Results are always returned in the original element order,
+    so the generated content is the same regardless of the number of workers.
+    """
 
-        if item_method_element_visitor.IncludeApplyOptionalChildren:
-            optional_children_empty_element = dest_writer.CreateTemporaryElement("attribute_name", "*")
+    # ----------------------------------------------------------------------
+    def __init__(self, plugin_class, max_workers):
+        self._plugin_class                  = plugin_class
+        self._max_workers                   = max_workers
 
-            indented_stream.write(
-                content_template.format(
-                    method_name="_ApplyOptionalChildren",
-                    var_name="items",
-                    get_statement=StringHelpers.LeftJustify(source_writer.GetChild("items", optional_children_empty_element), 4).strip(),
-                    add_child=StringHelpers.LeftJustify(dest_writer.AppendChild(optional_children_empty_element, "dest", "value"), 12).strip(),
-                    add_child_empty=StringHelpers.LeftJustify(dest_writer.AppendChild(optional_children_empty_element, "dest", None), 8).strip(),
-                    default_value_param="",
-                    default_value_statement="# No default statement",
-                ),
-            )
+        self._elements                      = None
+        self._pool                          = None
 
-        if item_method_element_visitor.IncludeApplyOptionalAttribute:
-            optional_attribute_empty_element = dest_writer.CreateTemporaryElement(
-                "attribute_name",
-                "?",
-                is_attribute=True,
-            )
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
 
-            indented_stream.write(
-                content_template.format(
-                    method_name="_ApplyOptionalAttribute",
-                    var_name="item",
-                    get_statement=StringHelpers.LeftJustify(source_writer.GetChild("item", optional_attribute_empty_element), 4).strip(),
-                    add_child=StringHelpers.LeftJustify(dest_writer.AppendChild(optional_attribute_empty_element, "dest", "value"), 12).strip(),
-                    add_child_empty=StringHelpers.LeftJustify(dest_writer.AppendChild(optional_attribute_empty_element, "dest", None), 8),
-                    default_value_param=", default_value_func=None",
-                    default_value_statement=StringHelpers.LeftJustify(
-                        textwrap.dedent(
-                            """\
-                            if default_value_func:
-                                {}
-                                return
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        global _emit_worker_elements
 
-                            """,
-                        ).format(StringHelpers.LeftJustify(dest_writer.AppendChild(optional_attribute_empty_element, "dest", "default_value_func()"), 4).strip()),
-                        4,
-                    ).strip(),
-                ),
-            )
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
 
-        # _ApplyAdditionalData
-        temporary_children_element = source_writer.CreateTemporaryElement("name", "+")
+        _emit_worker_elements = None
 
-        indented_stream.write(
-            textwrap.dedent(
-                """\
-                # ----------------------------------------------------------------------
-                @classmethod
-                def _ApplyAdditionalData(
-                    cls,
-                    source,
-                    dest,
-                    exclude_names,
-                ):
-                    for name, child in {get_additional_children}:
-                        try:
-                            if isinstance(child, list):
-                                children = []
+    # ----------------------------------------------------------------------
+    def Emit(self, elements, method_name, *args):
+        """Returns the result of invoking the method with consecutive chunks of elements"""
 
-                                for index, item in enumerate(child):
-                                    item_name = "Index {{}}".format(index)
+        global _emit_worker_elements
 
-                                    try:
-                                        children.append(cls._CreateAdditionalDataItem(item_name, item))
-                                    except:
-                                        _DecorateActiveException(item_name)
+        method = getattr(self._plugin_class, method_name)
 
-                                {append_children}
-                            else:
-                                {append}
-                        except:
-                            _DecorateActiveException(name)
+        if not self._max_workers or self._max_workers <= 1 or len(elements) < 2:
+            return [method(elements, *args)]
 
-                """,
-            ).format(
-                get_additional_children=StringHelpers.LeftJustify(source_writer.GetAdditionalDataChildren(), 4).strip(),
-                append=StringHelpers.LeftJustify(
-                    dest_writer.AppendChild(source_writer.CreateTemporaryElement("name", "1"), "dest", "cls._CreateAdditionalDataItem(name, child)"),
-                    12,
-                ).strip(),
-                append_children=StringHelpers.LeftJustify(
-                    dest_writer.AppendChild(temporary_children_element, "dest", dest_writer.CreateCollection(temporary_children_element, "children")),
-                    12,
-                ).strip(),
-            ),
-        )
+        if self._pool is None:
+            if multiprocessing.get_start_method() == "fork":
+                # Forked workers inherit the module's globals, so the elements don't need
+                # to be transferred.
+                _emit_worker_elements = elements
+                pickled_elements = None
+            else:
+                try:
+                    pickled_elements = pickle.dumps(elements, pickle.HIGHEST_PROTOCOL)
+                except Exception:
+                    # The elements can't be transferred to worker processes; process them locally
+                    self._max_workers = None
+                    return [method(elements, *args)]
+
+            self._elements = elements
+            self._pool = multiprocessing.Pool(
+                self._max_workers,
+                initializer=_InitializeEmitWorker,
+                initargs=(pickled_elements,),
+            )
 
-        # _RejectAdditionalData
-        indented_stream.write(
-            textwrap.dedent(
-                """\
-                # ----------------------------------------------------------------------
-                @classmethod
-                def _RejectAdditionalData(cls, source, exclude_names):
-                    errors = []
+        # Workers index into the elements that they were initialized with
+        assert elements is self._elements
 
-                    for name, child in {get_additional_children}:
-                        errors.append(name)
+        # Create more chunks than workers so that the work is balanced when some elements
+        # generate more content than others.
+        num_chunks = min(len(elements), self._max_workers * 4)
+        chunk_size = (len(elements) + num_chunks - 1) // num_chunks
 
-                    if errors:
-                        raise Exception("The item contains unexpected children: {{}}".format(", ".join(['"{{}}"'.format(error) for error in errors])))
+        ranges = [(start, min(start + chunk_size, len(elements))) for start in range(0, len(elements), chunk_size)]
 
-                """,
-            ).format(
-                get_additional_children=StringHelpers.LeftJustify(source_writer.GetAdditionalDataChildren(), 4).strip(),
-            ),
-        )
+        # Pickling requires a fully qualified name, which is the root of this package
+        sys.path.insert(0, os.path.join(_script_dir, "..", "..", ".."))
+        with CallOnExit(lambda: sys.path.pop(0)):
+            async_results = [
+                self._pool.apply_async(_EmitWorker, (self._plugin_class, method_name, start, end, args))
+                for start, end in ranges
+            ]
 
-        # _CreateAdditionalDataItem
-        indented_stream.write(
-            textwrap.dedent(
-                """\
-                # ----------------------------------------------------------------------
-                @classmethod
-                def _CreateAdditionalDataItem(cls, name, source):
-                    {statements}
+        results = []
 
-                """,
-            ).format(
-                statements=StringHelpers.LeftJustify(source_writer.CreateAdditionalDataItem(dest_writer, "name", "source"), 4).strip(),
-            ),
-        )
+        for async_result, (start, end) in zip(async_results, ranges):
+            try:
+                result = async_result.get()
+            except Exception:
+                # The result couldn't be transferred from the worker; process the chunk locally
+                result = None
 
-        # Write the utility funcs
-        result = dest_writer.GetClassUtilityMethods(source_writer)
-        if result is not None:
-            indented_stream.write("{}\n\n".format(result.strip()))
+            if result is None:
+                # Errors are reproduced by processing the chunk again in this process, so that
+                # the exception is the same exception raised when processing serially.
+                result = method(elements[start:end], *args)
 
-        result = source_writer.GetClassUtilityMethods(dest_writer)
-        if result is not None:
-            indented_stream.write("{}\n\n".format(result.strip()))
+            results.append(result)
 
-        output_stream.write("\n")
+        return results
 
-        result = source_writer.GetGlobalUtilityMethods(dest_writer)
-        if result is not None:
-            output_stream.write("{}\n\n\n".format(result.strip()))
 
-        result = dest_writer.GetGlobalUtilityMethods(source_writer)
-        if result is not None:
-            output_stream.write("{}\n\n\n".format(result.strip()))
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+_emit_worker_elements                       = None
 
-    # ----------------------------------------------------------------------
-    @staticmethod
-    def _VisitElements(elements, on_element_func, *args, **kwargs):
-        Elements.CreateElementVisitor(
-            on_entering_element=on_element_func,
-            on_compound_visiting_children_func=lambda element: False,
-            on_simple_visiting_children_func=lambda element: False,
-        ).Accept(elements, *args, **kwargs)
+
+# ----------------------------------------------------------------------
+def _InitializeEmitWorker(pickled_elements):
+    """Restores the elements within a process pool worker (forked workers already have them)"""
+
+    global _emit_worker_elements
+
+    if pickled_elements is not None:
+        _emit_worker_elements = pickle.loads(pickled_elements)
+
+
+# ----------------------------------------------------------------------
+def _EmitWorker(plugin_class, method_name, start, end, args):
+    """Invokes an _ElementEmitter method within a process pool worker; returns None on error"""
+
+    try:
+        return getattr(plugin_class, method_name)(_emit_worker_elements[start:end], *args)
+    except Exception:
+        # Exceptions aren't guaranteed to survive the trip across process boundaries;
+        # the chunk will be processed again in the main process to produce the error.
+        return None
@@ -16,7 +16,6 @@
 """Contains the PythonDestinationStatementWriter object"""
 
 import os
-import textwrap
 
 import CommonEnvironment
 from CommonEnvironment import Interface
@@ -29,9 +28,13 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
 with InitRelativeImports():
+    from ..ElementVisitors import ToPythonName
     from ..StatementWriters import DestinationStatementWriter
+    from ..Templates import Dedent
     from .PythonStatementWriterMixin import PythonStatementWriterMixin
 
+    from ....Schema import Elements
+
 # ----------------------------------------------------------------------
 @Interface.staticderived
 class PythonDestinationStatementWriter(DestinationStatementWriter):
@@ -41,15 +44,106 @@ class PythonDestinationStatementWriter(DestinationStatementWriter):
 
     # ----------------------------------------------------------------------
     @staticmethod
+    def GetObjectTypeName(element):
+        """Returns the name of the python class used to represent instances of the element"""
+
+        # Temporary elements (used for additional data) don't have a class of their own
+        if not isinstance(element, (Elements.CompoundElement, Elements.SimpleElement)):
+            return "Object"
+
+        return "_{}_Object".format(ToPythonName(element))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetLazyObjectTypeName(element):
+        """Returns the name of the python class used for instances of the element with children that haven't been created yet"""
+        return "_{}_LazyObject".format(ToPythonName(element))
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def CreateObjectType(cls, element, children):
+        """\
+        Returns the definition of the python class used to represent instances of the
+        element. Known children are stored in slots; anything else (such as additional
+        data) is stored in the object's fallback dict.
+        """
+
+        attribute_names = []
+        names = []
+        has_lazy_children = False
+
+        for child in children:
+            if getattr(child, "IsAttribute", False):
+                attribute_names.append(child.Name)
+            else:
+                names.append(child.Name)
+
+            if _IsLazyChild(child):
+                has_lazy_children = True
+
+        # Order the slots as the values are assigned when an object is created so that
+        # the object's __dict__ is consistent with the order that values were assigned.
+        if isinstance(element, Elements.SimpleElement):
+            names.insert(0, cls.SIMPLE_ELEMENT_FUNDAMENTAL_ATTRIBUTE_NAME)
+            names.insert(0, getattr(element, "FundamentalAttributeName", "simple_value"))
+
+        slot_names = []
+
+        for name in attribute_names + names:
+            # Slot names must be identifiers and names with leading double underscores are mangled
+            if name in slot_names or not name.isidentifier() or name.startswith("__"):
+                continue
+
+            slot_names.append(name)
+
+        result = Dedent(
+            """\
+            # ----------------------------------------------------------------------
+            class {name}(Object):
+                __slots__ = ({slot_names})
+
+                _slot_names = Object._slot_names + __slots__
+
+            """,
+        ).format(
+            name=cls.GetObjectTypeName(element),
+            slot_names="{}{}".format(
+                ", ".join(['"{}"'.format(slot_name) for slot_name in slot_names]),
+                "," if len(slot_names) == 1 else "",
+            ),
+        )
+
+        if has_lazy_children:
+            # Objects are converted to this type when a child is appended lazily; the
+            # layout is the same, so only the behavior changes.
+            result += Dedent(
+                """\
+
+                # ----------------------------------------------------------------------
+                class {lazy_name}(_LazyObject, {name}):
+                    __slots__ = ()
+
+                """,
+            ).format(
+                lazy_name=cls.GetLazyObjectTypeName(element),
+                name=cls.GetObjectTypeName(element),
+            )
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @classmethod
     @Interface.override
-    def CreateCompoundElement(element, attributes_var_or_none):
-        return textwrap.dedent(
+    def CreateCompoundElement(cls, element, attributes_var_or_none):
+        return Dedent(
             """\
             _CreatePythonObject(
+                {object_type},
                 attributes={attributes},
             )
             """,
         ).format(
+            object_type=cls.GetObjectTypeName(element),
             attributes=attributes_var_or_none or "None",
         )
 
@@ -57,14 +151,16 @@ class PythonDestinationStatementWriter(DestinationStatementWriter):
     @classmethod
     @Interface.override
     def CreateSimpleElement(cls, element, attributes_var_or_none, fundamental_statement):
-        return textwrap.dedent(
+        return Dedent(
             """\
             _CreatePythonObject(
+                {object_type},
                 attributes={attributes},
                 **{{"{value_name}": {fundamental}, "{simple_element_fundamental}": "{value_name}"}},
             )
             """,
         ).format(
+            object_type=cls.GetObjectTypeName(element),
             attributes=attributes_var_or_none or "None",
             value_name=getattr(element, "FundamentalAttributeName", "simple_value"),
             fundamental=fundamental_statement,
@@ -95,6 +191,26 @@ class PythonDestinationStatementWriter(DestinationStatementWriter):
 
         return "setattr({}, {}, {})".format(parent_var_name, cls.GetElementStatementName(child_element), var_name_or_none)
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    @Interface.override
+    def AppendLazyChild(cls, element, child_element, parent_var_name, func_statement):
+        if not _IsLazyChild(child_element):
+            return None
+
+        return "_AppendLazyChild({}, {}, {}, {})".format(
+            parent_var_name,
+            cls.GetLazyObjectTypeName(element),
+            cls.GetElementStatementName(child_element),
+            func_statement,
+        )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def GetLazyChildNames(var_name):
+        return "_GetLazyChildNames({})".format(var_name)
+
     # ----------------------------------------------------------------------
     @staticmethod
     @Interface.override
@@ -106,3 +222,11 @@ class PythonDestinationStatementWriter(DestinationStatementWriter):
     @Interface.override
     def GetGlobalUtilityMethods(cls, source_writer):
         return PythonStatementWriterMixin.GetGlobalUtilityMethods(cls.ATTRIBUTES_ATTRIBUTE_NAME)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _IsLazyChild(child_element):
+    # Fundamental values are inexpensive to create, so only compound-like children are created lazily
+    return not getattr(child_element, "IsAttribute", False) and isinstance(child_element.Resolve(), (Elements.CompoundElement, Elements.SimpleElement))
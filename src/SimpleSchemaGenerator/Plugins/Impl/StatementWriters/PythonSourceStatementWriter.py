@@ -16,11 +16,9 @@
 """Contains the PythonSourceStatementWriter object"""
 
 import os
-import textwrap
 
 import CommonEnvironment
 from CommonEnvironment import Interface
-from CommonEnvironment import StringHelpers
 
 from CommonEnvironmentEx.Package import InitRelativeImports
 
@@ -31,6 +29,7 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 
 with InitRelativeImports():
     from ..StatementWriters import SourceStatementWriter
+    from ..Templates import Dedent, LeftJustify
     from .PythonStatementWriterMixin import PythonStatementWriterMixin
 
 # ----------------------------------------------------------------------
@@ -45,7 +44,7 @@ class PythonSourceStatementWriter(SourceStatementWriter):
         if element_or_none is None:
             return ""
 
-        return textwrap.dedent(
+        return Dedent(
             """\
             if not isinstance({var_name}, list):
                 if isinstance({var_name}, dict) and "{name}" in {var_name}:
@@ -74,7 +73,7 @@ class PythonSourceStatementWriter(SourceStatementWriter):
         else:
             is_optional = child_element.TypeInfo.Arity.Min == 0
 
-        return textwrap.dedent(
+        return Dedent(
             """\
             cls._GetPythonAttribute(
                 {var_name},
@@ -94,6 +93,12 @@ class PythonSourceStatementWriter(SourceStatementWriter):
     def GetFundamental(var_name, child_element):
         return var_name
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def GetChildNames(var_name):
+        return "cls._GetPythonChildNames({})".format(var_name)
+
     # ----------------------------------------------------------------------
     @staticmethod
     @Interface.override
@@ -107,7 +112,7 @@ class PythonSourceStatementWriter(SourceStatementWriter):
         temporary_element = cls.CreateTemporaryElement(name_var_name, "1")
         temporary_children_element = cls.CreateTemporaryElement("k", "+")
 
-        return textwrap.dedent(
+        return Dedent(
             """\
             # The following types should be returned directly without additional conversion
             if isinstance({source_var_name}, (int, float, str, bool)):
@@ -163,7 +168,7 @@ class PythonSourceStatementWriter(SourceStatementWriter):
             source_var_name=source_var_name,
             attribute_names=cls.ATTRIBUTES_ATTRIBUTE_NAME,
             fundamental_name=cls.SIMPLE_ELEMENT_FUNDAMENTAL_ATTRIBUTE_NAME,
-            simple_statement=StringHelpers.LeftJustify(
+            simple_statement=LeftJustify(
                 dest_writer.CreateSimpleElement(
                     temporary_element,
                     "attributes",
@@ -172,11 +177,11 @@ class PythonSourceStatementWriter(SourceStatementWriter):
                 4,
             ).strip(),
             compound_statement=dest_writer.CreateCompoundElement(temporary_element, "attributes").strip(),
-            append_children=StringHelpers.LeftJustify(
+            append_children=LeftJustify(
                 dest_writer.AppendChild(temporary_children_element, "result", dest_writer.CreateCollection(temporary_children_element, "new_items")),
                 12,
             ).strip(),
-            append_child=StringHelpers.LeftJustify(dest_writer.AppendChild(cls.CreateTemporaryElement("k", "1"), "result", "new_item"), 8).strip(),
+            append_child=LeftJustify(dest_writer.AppendChild(cls.CreateTemporaryElement("k", "1"), "result", "new_item"), 8).strip(),
         )
 
     # ----------------------------------------------------------------------
@@ -189,7 +194,7 @@ class PythonSourceStatementWriter(SourceStatementWriter):
     @classmethod
     @Interface.override
     def GetClassUtilityMethods(cls, dest_writer):
-        return textwrap.dedent(
+        return Dedent(
             """\
             # ----------------------------------------------------------------------
             @staticmethod
@@ -198,17 +203,37 @@ class PythonSourceStatementWriter(SourceStatementWriter):
                 attribute_name,
                 is_optional=False,
             ):
-                if not isinstance(item, dict):
-                    if hasattr(item, "__dict__"):
-                        item = item.__dict__
-                    else:
-                        item = {}
+                if isinstance(item, Object):
+                    # Avoid creating a dict for objects that store their values in slots
+                    value = getattr(item, attribute_name, DoesNotExist)
+                else:
+                    if not isinstance(item, dict):
+                        if hasattr(item, "__dict__"):
+                            item = item.__dict__
+                        else:
+                            item = {}
+
+                    value = item.get(attribute_name, DoesNotExist)
 
-                value = item.get(attribute_name, DoesNotExist)
                 if value is DoesNotExist and not is_optional:
                     raise SerializeException("No items were found")
 
                 return value
 
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def _GetPythonChildNames(item):
+                if isinstance(item, dict):
+                    return item
+
+                if isinstance(item, Object):
+                    return item.__dict__
+
+                if item is None or isinstance(item, (six.string_types, bool, int, float)):
+                    return DoesNotExist
+
+                # Other objects may be compound items or fundamental values (for example, a Uri)
+                return None
+
             """,
         )
@@ -16,60 +16,249 @@
 """Contains the PythonStatementWriterMixin object"""
 
 import os
-import textwrap
 
 import CommonEnvironment
 from CommonEnvironment import Interface
 
+from CommonEnvironmentEx.Package import InitRelativeImports
+
 # ----------------------------------------------------------------------
 _script_fullpath                            = CommonEnvironment.ThisFullpath()
 _script_dir, _script_name                   = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
+with InitRelativeImports():
+    from ..Templates import Dedent
+
 # ----------------------------------------------------------------------
 class PythonStatementWriterMixin(object):
-    _generated_global_utility_methods       = False
-
     # ----------------------------------------------------------------------
-    @classmethod
-    def GetGlobalUtilityMethods(cls, attributes_attribute_name):
-        # This method is potentially invoked by both source and dest statement writers,
-        # so we need to make sure that we only generate this content once.
-        if cls._generated_global_utility_methods:
-            return
+    @staticmethod
+    def GetGlobalUtilityMethods(attributes_attribute_name):
+        # This method is potentially invoked by both source and dest statement writers;
+        # the caller is responsible for ensuring that the content is only written once.
+        return Dedent(
+            '''\
+            # ----------------------------------------------------------------------
+            class _ObjectStorage(object):
+                # Stores values that aren't associated with a slot (such as additional data)
+                __slots__ = ("__dict__",)
+
+
+            _GetObjectStorage = _ObjectStorage.__dict__["__dict__"].__get__
 
-        cls._generated_global_utility_methods = True
 
-        return textwrap.dedent(
-            """\
             # ----------------------------------------------------------------------
-            class Object(object):
+            class _ObjectDict(dict):
+                # Returned by Object.__dict__. Changes made to the dict are also made to
+                # the object, as they would be for the __dict__ of a standard object.
+                __slots__ = ("_obj",)
+
+                def __init__(self, obj):
+                    super(_ObjectDict, self).__init__()
+                    self._obj = obj
+
+                def __setitem__(self, k, v):
+                    setattr(self._obj, k, v)
+                    super(_ObjectDict, self).__setitem__(k, v)
+
+                def __delitem__(self, k):
+                    super(_ObjectDict, self).__delitem__(k)
+                    delattr(self._obj, k)
+
+                def update(self, *args, **kwargs):
+                    for k, v in six.iteritems(dict(*args, **kwargs)):
+                        self[k] = v
+
+                def setdefault(self, k, default=None):
+                    if k not in self:
+                        self[k] = default
+
+                    return self[k]
+
+                def pop(self, k, *args):
+                    if k not in self:
+                        return super(_ObjectDict, self).pop(k, *args)
+
+                    value = self[k]
+                    del self[k]
+
+                    return value
+
+                def popitem(self):
+                    k, v = super(_ObjectDict, self).popitem()
+                    delattr(self._obj, k)
+
+                    return k, v
+
+                def clear(self):
+                    for k in list(self):
+                        del self[k]
+
+
+            # ----------------------------------------------------------------------
+            class Object(_ObjectStorage):
+                # Classes derived from Object store the values of known children in slots,
+                # which makes instances smaller and faster to create. __dict__ returns the
+                # slot values along with any other values, in that order; changes made to
+                # it are written through to the object.
+                __slots__ = ("{additional_data}",)
+
+                _slot_names = __slots__
+
                 def __init__(self):
                     self.{additional_data} = set()
 
+                @property
+                def __dict__(self):
+                    result = _ObjectDict(self)
+
+                    for k in self._slot_names:
+                        v = getattr(self, k, DoesNotExist)
+                        if v is not DoesNotExist:
+                            dict.__setitem__(result, k, v)
+
+                    for k, v in six.iteritems(_GetObjectStorage(self)):
+                        dict.__setitem__(result, k, v)
+
+                    return result
+
+                def __dir__(self):
+                    return list(self.__dict__)
+
+                def __getstate__(self):
+                    return dict(self.__dict__)
+
+                def __setstate__(self, state):
+                    for k, v in six.iteritems(state):
+                        setattr(self, k, v)
+
                 def __repr__(self):
                     return CommonEnvironment.ObjectReprImpl(self)
 
 
+            # ----------------------------------------------------------------------
+            class _LazyObject(Object):
+                # Objects with children that are created when they are first accessed. The
+                # functions that create the children are stored in the object's fallback
+                # dict until they are invoked.
+                __slots__ = ()
+
+                def __getattr__(self, name):
+                    # Only invoked when the attribute wasn't found
+                    lazy_children = _GetObjectStorage(self).get("_lazy_children", None)
+
+                    func = lazy_children.get(name, None) if lazy_children else None
+                    if func is None:
+                        raise AttributeError("'{{}}' object has no attribute '{{}}'".format(type(self).__name__, name))
+
+                    try:
+                        try:
+                            value = func()
+                        except:
+                            _DecorateActiveException(name)
+                    except SerializationException:
+                        raise
+                    except Exception as ex:
+                        raise DeserializeException(ex)
+
+                    del lazy_children[name]
+                    setattr(self, name, value)
+
+                    return value
+
+                @property
+                def __dict__(self):
+                    # __dict__ contains the values of all children, so the remaining children
+                    # are created here. Use dir() or _GetLazyChildNames to inspect the names
+                    # of the children without creating them.
+                    lazy_children = _GetObjectStorage(self).get("_lazy_children", None)
+
+                    while lazy_children:
+                        getattr(self, next(iter(lazy_children)))
+
+                    result = super(_LazyObject, self).__dict__
+                    dict.pop(result, "_lazy_children", None)
+
+                    return result
+
+                def __dir__(self):
+                    # Children that haven't been created yet are included, but not created
+                    storage = _GetObjectStorage(self)
+                    lazy_children = storage.get("_lazy_children", None) or {{}}
+
+                    return [k for k in self._slot_names if k in lazy_children or hasattr(self, k)] + [
+                        k for k in storage if k != "_lazy_children"
+                    ]
+
+
             # ----------------------------------------------------------------------
             def _CreatePythonObject(
+                object_type,
                 attributes=None,
                 **kwargs
             ):
-                attributes = attributes or {{}}
+                result = object_type.__new__(object_type)
+
+                # Each object gets its own set, as the set may be extended after the
+                # object is created
+                result.{additional_data} = set()
 
-                result = Object()
+                if attributes:
+                    result.{additional_data}.update(six.iterkeys(attributes))
 
-                for d in [attributes, kwargs]:
-                    for k, v in six.iteritems(d):
+                    for k, v in six.iteritems(attributes):
                         setattr(result, k, v)
 
-                for k in six.iterkeys(attributes):
-                    result.{additional_data}.add(k)
+                for k, v in six.iteritems(kwargs):
+                    setattr(result, k, v)
 
                 return result
 
-            """,
+
+            # ----------------------------------------------------------------------
+            def _AppendLazyChild(obj, lazy_object_type, attribute_name, func):
+                storage = _GetObjectStorage(obj)
+
+                if type(obj) is not lazy_object_type:
+                    obj.__class__ = lazy_object_type
+                    storage["_lazy_children"] = {{}}
+
+                storage["_lazy_children"][attribute_name] = func
+
+
+            # ----------------------------------------------------------------------
+            def _GetLazyChildNames(obj):
+                if not isinstance(obj, _LazyObject):
+                    return None
+
+                return _GetObjectStorage(obj)["_lazy_children"] or None
+
+
+            # ----------------------------------------------------------------------
+            def ValidateAll(item):
+                """\\
+                Creates and validates all of the children of an item that was deserialized
+                with 'lazy=True'. Errors are raised when children are first accessed for
+                these items, while this function raises them immediately.
+                """
+
+                items = [item]
+
+                while items:
+                    this_item = items.pop()
+
+                    if isinstance(this_item, list):
+                        items += this_item
+                    elif isinstance(this_item, dict):
+                        items += list(six.itervalues(this_item))
+                    elif isinstance(this_item, Object):
+                        # Accessing __dict__ creates any remaining children
+                        items += list(six.itervalues(this_item.__dict__))
+
+                return item
+
+            ''',
         ).format(
             additional_data=attributes_attribute_name,
         )
@@ -151,6 +151,34 @@ class SourceStatementWriter(StatementWriter):
         """
         raise Exception("Abstract method")
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.extensionmethod
+    def IterItems(var_name, element):
+        """\
+        Statement that is an iterator over the items of a collection element, where the
+        variable is a filename, a file-like object, or the serialized content. The items
+        should be read incrementally rather than reading all of the content into memory.
+
+        Returns None if incremental reads are not supported.
+        """
+        return None
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.extensionmethod
+    def GetChildNames(var_name):
+        """\
+        Statement that evaluates to a container of the names of the variable's children
+        (supporting 'in' and 'get') if the variable is a compound item, DoesNotExist if it
+        is a fundamental value, or None if it isn't possible to tell. This information is
+        used to eliminate variations that can't possibly match an item before attempting
+        to convert it.
+
+        Returns None if the writer isn't able to provide this information.
+        """
+        return None
+
     # ----------------------------------------------------------------------
     @staticmethod
     @Interface.extensionmethod
@@ -215,6 +243,28 @@ class DestinationStatementWriter(StatementWriter):
         """Returns a statement that converts the given var to a string"""
         raise Exception("Abstract method")
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.extensionmethod
+    def AppendLazyChild(element, child_element, parent_var_name, func_statement):
+        """\
+        Appends a child to an existing CompoundElement, where the child's value is created
+        by invoking 'func_statement' when the child is first accessed.
+
+        Returns None if lazily created children are not supported for the child.
+        """
+        return None
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.extensionmethod
+    def GetLazyChildNames(var_name):
+        """\
+        Statement that evaluates to the names of the variable's children that haven't been
+        created yet (see AppendLazyChild), or None if all of the children have been created.
+        """
+        return None
+
     # ----------------------------------------------------------------------
     @staticmethod
     @Interface.extensionmethod
@@ -0,0 +1,117 @@
+# ----------------------------------------------------------------------
+# |
+# |  Templates.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-11 09:12:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Functionality used when generating code from templates.
+
+Code generation invokes these functions for each element, so they are
+implemented with performance in mind (and produce the same output as
+`textwrap.dedent`, `StringHelpers.LeftJustify`, and `StreamDecorator`).
+"""
+
+import functools
+import os
+import re
+import textwrap
+
+import CommonEnvironment
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def Dedent(template):
+    """\
+    Returns the dedented template.
+
+    Templates are literal strings, so the result is calculated once for each
+    template rather than every time that the template is used.
+    """
+
+    return textwrap.dedent(template)
+
+
+# ----------------------------------------------------------------------
+def LeftJustify(
+    content,
+    indentation,
+    skip_first_line=True,
+    skip_empty_lines=True,
+):
+    """Equivalent to `StringHelpers.LeftJustify`"""
+
+    if not indentation:
+        return content
+
+    prefix = " " * indentation
+
+    if skip_empty_lines:
+        result = _NON_EMPTY_LINE_REGEX.sub("\n{}".format(prefix), content)
+
+        if not skip_first_line and content and content[0] != "\n":
+            result = "{}{}".format(prefix, result)
+
+    else:
+        result = _LINE_REGEX.sub("\n{}".format(prefix), content)
+
+        if not skip_first_line:
+            result = "{}{}".format(prefix, result)
+
+    return result
+
+
+# ----------------------------------------------------------------------
+class IndentedStream(object):
+    """Equivalent to `StreamDecorator(stream, line_prefix=line_prefix)`"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self, stream, line_prefix):
+        self._stream                        = stream
+        self._line_prefix                   = line_prefix
+        self._newline_replacement           = "\n{}".format(line_prefix)
+
+        self._is_line_start                 = True
+
+    # ----------------------------------------------------------------------
+    def write(self, content):
+        if not content:
+            return self
+
+        if content[-1] == "\n":
+            content = "{}\n".format(content[:-1].replace("\n", self._newline_replacement))
+            is_line_start = True
+        else:
+            content = content.replace("\n", self._newline_replacement)
+            is_line_start = False
+
+        if self._is_line_start:
+            content = "{}{}".format(self._line_prefix, content)
+
+        self._stream.write(content)
+        self._is_line_start = is_line_start
+
+        return self
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_NON_EMPTY_LINE_REGEX                       = re.compile(r"\n(?=[^\n])")
+_LINE_REGEX                                 = re.compile(r"\n(?!\Z)")
@@ -0,0 +1,144 @@
+# ----------------------------------------------------------------------
+# |
+# |  PythonSerializationImpl_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-16 08:12:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for PythonSerializationImpl.py"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+import CommonEnvironment
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ...PythonJsonPlugin import Plugin as PythonJsonPlugin
+
+    from ....Schema.Parse import ParseStrings
+
+# ----------------------------------------------------------------------
+_KEYED_SCHEMA                               = textwrap.dedent(
+    """\
+    <item>:
+        <name string>
+
+    <items item key="name" *>
+    """,
+)
+
+_STANDARD_SCHEMA                            = textwrap.dedent(
+    """\
+    <item>:
+        <name string>
+
+    <items item *>
+    """,
+)
+
+
+# ----------------------------------------------------------------------
+class MultipleInvocationsSuite(unittest.TestCase):
+    """Plugins may be invoked multiple times within the same process (by the server or when watching files)"""
+
+    # ----------------------------------------------------------------------
+    def test_GlobalUtilityMethods(self):
+        for fast_path in [False, True]:
+            first = _Generate(_STANDARD_SCHEMA, fast_path=fast_path)
+            second = _Generate(_STANDARD_SCHEMA, fast_path=fast_path)
+
+            self.assertEqual(first, second)
+
+            for content in [first, second]:
+                self.assertEqual(content.count("class Object(_ObjectStorage):"), 1)
+                self.assertEqual(content.count("def _CreatePythonObject("), 1)
+
+    # ----------------------------------------------------------------------
+    def test_ValidateKeys(self):
+        for fast_path in [False, True]:
+            self.assertTrue("def _ValidateKeys(" in _Generate(_KEYED_SCHEMA, fast_path=fast_path))
+            self.assertTrue("def _ValidateKeys(" not in _Generate(_STANDARD_SCHEMA, fast_path=fast_path))
+
+
+# ----------------------------------------------------------------------
+class ValidatePackageSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_Installed(self):
+        PythonJsonPlugin._ValidatePackage("six", "The setting")
+
+    # ----------------------------------------------------------------------
+    def test_NotInstalled(self):
+        with self.assertRaisesRegex(Exception, "The setting requires the 'NotAValidPackageName' package, which is not installed"):
+            PythonJsonPlugin._ValidatePackage("NotAValidPackageName", "The setting")
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Generate(schema, **settings):
+    plugin = PythonJsonPlugin()
+
+    elements = ParseStrings(
+        {"Test": schema},
+        plugin,
+        False,
+        False,
+    )
+
+    kwargs = dict(plugin.GenerateCustomSettingsAndDefaults())
+    kwargs.update(settings)
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        output_filenames = list(plugin.GenerateOutputFilenames({"output_dir": temp_directory, "output_name": "Test"}))
+        assert len(output_filenames) == 1, output_filenames
+
+        result = plugin.Generate(
+            None,
+            None,
+            [],
+            output_filenames,
+            "Test",
+            elements,
+            range(len(elements)),
+            StreamDecorator(None),
+            StreamDecorator(None),
+            False,
+            **kwargs
+        )
+        assert not result, result
+
+        with open(output_filenames[0]) as f:
+            return f.read()
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
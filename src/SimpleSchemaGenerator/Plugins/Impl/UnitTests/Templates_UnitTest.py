@@ -0,0 +1,127 @@
+# ----------------------------------------------------------------------
+# |
+# |  Templates_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-11 10:03:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for Templates.py"""
+
+import itertools
+import os
+import sys
+import textwrap
+import unittest
+
+import six
+
+import CommonEnvironment
+from CommonEnvironment import StringHelpers
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..Templates import *
+
+# ----------------------------------------------------------------------
+_CONTENTS                                   = [
+    "",
+    "\n",
+    "\n\n",
+    "one",
+    "one\n",
+    "one\ntwo",
+    "one\ntwo\n",
+    "one\n\ntwo\n\n",
+    "\none\n  two\n",
+    "    one\n\n        two\n    three",
+]
+
+
+# ----------------------------------------------------------------------
+class DedentSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        template = """\
+            one
+                two
+
+            three
+            """
+
+        self.assertEqual(Dedent(template), textwrap.dedent(template))
+        self.assertTrue(Dedent(template) is Dedent(template))
+
+
+# ----------------------------------------------------------------------
+class LeftJustifySuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        self.assertEqual(LeftJustify("one\ntwo\n\nthree\n", 4), "one\n    two\n\n    three\n")
+
+    # ----------------------------------------------------------------------
+    def test_Equivalence(self):
+        for content, indentation, skip_first_line, skip_empty_lines in itertools.product(
+            _CONTENTS,
+            [0, 4, 8],
+            [True, False],
+            [True, False],
+        ):
+            self.assertEqual(
+                LeftJustify(content, indentation, skip_first_line=skip_first_line, skip_empty_lines=skip_empty_lines),
+                StringHelpers.LeftJustify(content, indentation, skip_first_line=skip_first_line, skip_empty_lines=skip_empty_lines),
+                (content, indentation, skip_first_line, skip_empty_lines),
+            )
+
+
+# ----------------------------------------------------------------------
+class IndentedStreamSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        sink = six.moves.StringIO()
+
+        IndentedStream(sink, "    ").write("one\n\ntwo").write(" three\n")
+        self.assertEqual(sink.getvalue(), "    one\n    \n    two three\n")
+
+    # ----------------------------------------------------------------------
+    def test_Equivalence(self):
+        for contents in itertools.permutations(_CONTENTS, 3):
+            sink = six.moves.StringIO()
+            expected_sink = six.moves.StringIO()
+
+            stream = IndentedStream(IndentedStream(sink, "    "), "  ")
+            expected_stream = StreamDecorator(StreamDecorator(expected_sink, line_prefix="    "), line_prefix="  ")
+
+            for content in contents:
+                stream.write(content)
+                expected_stream.write(content)
+
+            self.assertEqual(sink.getvalue(), expected_sink.getvalue(), contents)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -56,8 +56,9 @@ def Build(
 
         schema_names = [
             ("AllTypes.SimpleSchema", [], " /include=types"),
+            ("ColumnarTest.SimpleSchema", ["PythonColumnar", "PythonJson"], None),
             ("DefaultValues.SimpleSchema", [], None),
-            ("DictionaryTest.SimpleSchema", ["PythonJson", "PythonYaml"], None),
+            ("DictionaryTest.SimpleSchema", ["PythonJson", "PythonMsgpack", "PythonYaml"], None),
             ("FileSystemTest.SimpleSchema", [], None),
             ("ProcessAdditionalData.SimpleSchema", [], None),
             ("Test.SimpleSchema", [], None),
@@ -65,6 +66,7 @@ def Build(
 
         all_plugin_names = [
             "PythonJson",
+            "PythonMsgpack",
             "PythonXml",
             "PythonYaml",
             "JsonSchema",
@@ -0,0 +1,79 @@
+# ----------------------------------------------------------------------
+# |
+# |  GenerateUtils.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-16 10:14:32
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Helpers for tests that generate code with non-default plugin settings"""
+
+import importlib.util
+import os
+
+import CommonEnvironment
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ....Schema.Parse import ParseFiles
+
+# ----------------------------------------------------------------------
+def GenerateModule(plugin, schema_name, output_dir, output_name, **plugin_settings):
+    """\
+    Generates code for a schema in the Plugins/Impl directory and returns the generated module.
+
+    Build.py generates the modules used by most tests with the default settings; this is used
+    for settings that require optional packages.
+    """
+
+    schema_filename = os.path.join(_script_dir, "..", "..", "Impl", schema_name)
+    assert os.path.isfile(schema_filename), schema_filename
+
+    elements = ParseFiles(
+        [schema_filename],
+        plugin,
+        False,
+        True,
+    )
+
+    settings = dict(plugin.GenerateCustomSettingsAndDefaults())
+    settings.update(plugin_settings)
+
+    output_filenames = list(plugin.GenerateOutputFilenames({"output_dir": output_dir, "output_name": output_name}))
+    assert len(output_filenames) == 1, output_filenames
+
+    result = plugin.Generate(
+        None,
+        None,
+        [schema_filename],
+        output_filenames,
+        output_name,
+        elements,
+        range(len(elements)),
+        StreamDecorator(None),
+        StreamDecorator(None),
+        False,
+        **settings
+    )
+    assert not result, result
+
+    spec = importlib.util.spec_from_file_location(output_name, output_filenames[0])
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
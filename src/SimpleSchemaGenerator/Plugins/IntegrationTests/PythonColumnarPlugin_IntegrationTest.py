@@ -0,0 +1,209 @@
+# ----------------------------------------------------------------------
+# |
+# |  PythonColumnarPlugin_IntegrationTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-09 13:02:45
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Integration tests for PythonColumnarPlugin"""
+
+import datetime
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import uuid
+
+import CommonEnvironment
+from CommonEnvironment.CallOnExit import CallOnExit
+from CommonEnvironment.TypeInfo.FundamentalTypes.UriTypeInfo import Uri
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "ColumnarTest"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import ColumnarTest_PythonColumnar as ColumnarTestColumnar
+    import ColumnarTest_PythonJsonSerialization as ColumnarTestJsonSerialization
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        json_filename = os.path.join(_script_dir, "..", "Impl", "ColumnarTest.json")
+        assert os.path.isfile(json_filename), json_filename
+
+        self._records = ColumnarTestJsonSerialization.Deserialize(json_filename)
+        self._temp_dir = tempfile.mkdtemp()
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    @unittest.skipIf(ColumnarTestColumnar.pyarrow is None, "pyarrow is not installed")
+    def test_Arrow(self):
+        filename = os.path.join(self._temp_dir, "records.arrow")
+
+        ColumnarTestColumnar.Write_records(filename, self._records, file_format="arrow")
+        self.assertEqual(ColumnarTestColumnar.Read_records(filename), _EXPECTED)
+
+        # The content is readable by other Arrow-based tools
+        with ColumnarTestColumnar.pyarrow.memory_map(filename) as source:
+            table = ColumnarTestColumnar.pyarrow.ipc.open_file(source).read_all()
+
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column_names, list(_EXPECTED.keys()))
+        self.assertEqual(table.column("rows").to_pylist(), _EXPECTED["rows"])
+
+    # ----------------------------------------------------------------------
+    def test_Simple(self):
+        filename = os.path.join(self._temp_dir, "records.simple")
+
+        ColumnarTestColumnar.Write_records(filename, self._records, file_format="simple")
+        self.assertEqual(ColumnarTestColumnar.Read_records(filename), _EXPECTED)
+
+    # ----------------------------------------------------------------------
+    def test_Batches(self):
+        for file_format in self._GetFileFormats():
+            filename = os.path.join(self._temp_dir, "records.{}".format(file_format))
+
+            with ColumnarTestColumnar.CreateWriter_records(filename, batch_size=2, file_format=file_format) as writer:
+                for record in self._records:
+                    writer.Write(record)
+
+                # The first batch has been written
+                self.assertEqual(len(writer._buffers[0]), 1)                    # <Access to a protected member> pylint: disable = W0212
+
+            self.assertEqual(ColumnarTestColumnar.Read_records(filename), _EXPECTED)
+
+            # Encoding each record in its own batch produces the same results
+            ColumnarTestColumnar.Write_records(filename, self._records, batch_size=1, file_format=file_format)
+            self.assertEqual(ColumnarTestColumnar.Read_records(filename), _EXPECTED)
+
+    # ----------------------------------------------------------------------
+    def test_Columns(self):
+        for file_format in self._GetFileFormats():
+            filename = os.path.join(self._temp_dir, "records.{}".format(file_format))
+
+            ColumnarTestColumnar.Write_records(filename, self._records, batch_size=2, file_format=file_format)
+
+            result = ColumnarTestColumnar.Read_records(filename, ["points", "id"])
+
+            self.assertEqual(list(result.keys()), ["points", "id"])
+            self.assertEqual(result["points"], _EXPECTED["points"])
+            self.assertEqual(result["id"], _EXPECTED["id"])
+
+            self.assertRaisesRegex(
+                Exception,
+                "'does_not_exist' is not a valid column name",
+                lambda: ColumnarTestColumnar.Read_records(filename, ["does_not_exist"]),
+            )
+
+    # ----------------------------------------------------------------------
+    def test_Dicts(self):
+        for file_format in self._GetFileFormats():
+            filename = os.path.join(self._temp_dir, "records.{}".format(file_format))
+
+            ColumnarTestColumnar.Write_records(
+                filename,
+                [
+                    {"id": 1, "location": {"x": 1.0, "y": 2.0}, "rows": [[1, 2, 3], [4]]},
+                    {"id": 2, "name": "second"},
+                ],
+                file_format=file_format,
+            )
+
+            result = ColumnarTestColumnar.Read_records(filename, ["id", "name", "location", "rows", "points"])
+
+            self.assertEqual(result["id"], [1, 2])
+            self.assertEqual(result["name"], [None, "second"])
+            self.assertEqual(result["location"], [{"x": 1.0, "y": 2.0}, None])
+            self.assertEqual(result["rows"], [[[1, 2, 3], [4]], []])
+            self.assertEqual(result["points"], [[], []])
+
+    # ----------------------------------------------------------------------
+    def test_DerivedElement(self):
+        for file_format in self._GetFileFormats():
+            filename = os.path.join(self._temp_dir, "records.{}".format(file_format))
+
+            ColumnarTestColumnar.Write_records(filename, self._records, file_format=file_format)
+
+            result = ColumnarTestColumnar.Read_records(filename, ["labeled_point"])
+
+            # Children defined in the base element are included
+            self.assertEqual(result["labeled_point"], _EXPECTED["labeled_point"])
+
+    # ----------------------------------------------------------------------
+    def test_InvalidFileFormat(self):
+        self.assertRaisesRegex(
+            Exception,
+            "'invalid' is not a valid file format",
+            lambda: ColumnarTestColumnar.CreateWriter_records(os.path.join(self._temp_dir, "records"), file_format="invalid"),
+        )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetFileFormats():
+        if ColumnarTestColumnar.pyarrow is None:
+            return ["simple"]
+
+        return ["arrow", "simple"]
+
+
+# ----------------------------------------------------------------------
+_EXPECTED                                   = {
+    "id": [1, 2, 3],
+    "name": ["first", None, "third"],
+    "timestamp_": [
+        datetime.datetime(2022, 5, 9, 8, 0, 0),
+        datetime.datetime(2022, 5, 9, 9, 30, 0, 123456),
+        datetime.datetime(2022, 5, 9, 10, 0, 0),
+    ],
+    "duration_": [datetime.timedelta(hours=1, minutes=2, seconds=3), None, None],
+    "guid_": [
+        uuid.UUID("f638e451-c276-479a-aaa0-c699e35196fb"),
+        uuid.UUID("5e1e0c5d-28a4-4b5f-9a4f-2b8b0e1c7d33"),
+        uuid.UUID("0b6a0f3e-7f22-4d7e-8f2a-93d1d3f4a2c1"),
+    ],
+    "enum_": ["one", "two", "three"],
+    "uri_": [Uri.FromString("https://test.com"), None, None],
+    "measurement": [{"value": 1.5, "units": "m"}, None, None],
+    "tags": [["a", "b"], [], ["c"]],
+    "location": [{"x": 1.0, "y": 2.0}, None, None],
+    "points": [
+        [{"x": 10.0, "y": 20.0}, {"x": 30.0, "y": 40.0}],
+        [],
+        [{"x": -1.0, "y": -2.0}],
+    ],
+    "labeled_point": [{"label": "origin", "x": 0.0, "y": 0.0}, None, None],
+    "rows": [[[1, 2, 3], [4]], [], [[5, 6]]],
+}
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
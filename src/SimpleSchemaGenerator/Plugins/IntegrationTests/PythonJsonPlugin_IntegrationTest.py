@@ -15,13 +15,22 @@
 # ----------------------------------------------------------------------
 """Integration tests for PythonJsonPlugin"""
 
+import importlib.util
+import json
 import os
+import pickle
+import shutil
 import sys
+import tempfile
 import textwrap
 import unittest
 
+import six
+
 import CommonEnvironment
 from CommonEnvironment.CallOnExit import CallOnExit
+from CommonEnvironment import FileSystem
+from CommonEnvironment.Shell.All import CurrentShell
 
 from CommonEnvironmentEx.Package import InitRelativeImports
 
@@ -30,6 +39,12 @@ _script_fullpath                            = CommonEnvironment.ThisFullpath()
 _script_dir, _script_name                   = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "AllTypes"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import AllTypes_PythonJsonSerialization as AllTypesJsonSerialization
+    import AllTypes_PythonYamlSerialization as AllTypesYamlSerialization
+
+
 sys.path.insert(0, os.path.join(_script_dir, "Generated", "DefaultValues"))
 with CallOnExit(lambda: sys.path.pop(0)):
     import DefaultValues_PythonJsonSerialization as DefaultValuesJsonSerialization
@@ -54,9 +69,12 @@ with CallOnExit(lambda: sys.path.pop(0)):
 
 
 with InitRelativeImports():
+    from ..PythonJsonPlugin import Plugin as PythonJsonPlugin
+
     from .Impl.DefaultValuesUtils import DefaultValuesMixin
     from .Impl.DictionaryTestUtils import DictionaryTestMixin
     from .Impl.FileSystemTestUtils import FileSystemUtilsMixin
+    from .Impl.GenerateUtils import GenerateModule
     from .Impl.TestUtils import TestUtilsMixin
 
 # ----------------------------------------------------------------------
@@ -609,6 +627,319 @@ class TestSuite(unittest.TestCase, TestUtilsMixin):
 
         self.ValidateTestDerived(obj)
 
+    # ----------------------------------------------------------------------
+    def test_Object(self):
+        obj = TestJsonSerialization.Deserialize_test_base(TestJsonSerialization.Serialize_test_base(self._xml_obj))
+
+        self.assertTrue(isinstance(obj[0], TestJsonSerialization.Object))
+        self.assertEqual(type(obj[0]).__slots__, ("a",))
+
+        # Values that aren't associated with a slot
+        obj[0].extra = "extra"
+
+        self.assertEqual(
+            [(k, v) for k, v in six.iteritems(obj[0].__dict__) if not k.startswith("_")],
+            [("a", ["one", "two"]), ("extra", "extra")],
+        )
+
+        # Changes made to __dict__ are written through to the object
+        obj[1].__dict__["a"] = ["four"]
+        vars(obj[1]).update(other="other")
+        self.assertEqual(obj[1].a, ["four"])
+        self.assertEqual(obj[1].other, "other")
+
+        del obj[1].__dict__["other"]
+        self.assertFalse(hasattr(obj[1], "other"))
+
+        obj[1].a = ["three"]
+
+        # Each object has its own set of attribute names
+        obj[0]._attribute_names.add("extra")
+
+        self.assertEqual(obj[0]._attribute_names, set(["extra"]))
+        self.assertEqual(obj[1]._attribute_names, set())
+
+        obj = pickle.loads(pickle.dumps(obj))
+
+        self.ValidateTestBase(obj)
+        self.assertEqual(obj[0].extra, "extra")
+        self.assertFalse(hasattr(obj[1], "extra"))
+
+    # ----------------------------------------------------------------------
+    def test_Lazy(self):
+        serialized_obj = TestJsonSerialization.Serialize_test_derived(self._xml_obj)
+
+        obj = TestJsonSerialization.Deserialize_test_derived(serialized_obj, lazy=True)
+
+        self.assertTrue("sub_item" in dir(obj))
+        self.assertEqual(list(TestJsonSerialization._GetLazyChildNames(obj)), ["sub_item"])
+
+        self.ValidateTestDerived(obj)
+        self.assertEqual(obj.sub_item.v, "string value")
+        self.assertEqual(TestJsonSerialization._GetLazyChildNames(obj), None)
+
+        obj = pickle.loads(pickle.dumps(TestJsonSerialization.Deserialize_test_derived(serialized_obj, lazy=True)))
+        self.ValidateTestDerived(obj)
+
+        # Errors are raised when the child is first accessed
+        serialized_obj.sub_item.v = 1
+
+        obj = TestJsonSerialization.Deserialize_test_derived(serialized_obj, lazy=True)
+        self.assertEqual(obj.b, False)
+
+        with self.assertRaises(TestJsonSerialization.DeserializeException) as ctx:
+            obj.sub_item
+
+        self.assertEqual(ctx.exception.stack, ["sub_item", "v"])
+
+        with self.assertRaises(TestJsonSerialization.DeserializeException) as ctx:
+            TestJsonSerialization.ValidateAll(TestJsonSerialization.Deserialize_test_derived(serialized_obj, lazy=True))
+
+        self.assertEqual(ctx.exception.stack, ["sub_item", "v"])
+
+    # ----------------------------------------------------------------------
+    def test_ValidationLevel(self):
+        serialized_obj = TestJsonSerialization.Serialize_test_derived(self._xml_obj)
+
+        for validation_level in ["full", "structure", "none"]:
+            self.ValidateTestDerived(TestJsonSerialization.Deserialize_test_derived(serialized_obj, validation_level=validation_level))
+            self.ValidateTestDerived(TestJsonSerialization.Deserialize_test_derived(serialized_obj, lazy=True, validation_level=validation_level))
+
+        # Constraints are only checked with full validation
+        serialized_obj.ref2 = -1.0
+
+        with self.assertRaises(TestJsonSerialization.DeserializeException) as ctx:
+            TestJsonSerialization.Deserialize_test_derived(serialized_obj)
+
+        self.assertEqual(ctx.exception.stack, ["test_derived", "ref2"])
+
+        for validation_level in ["structure", "none"]:
+            self.assertEqual(TestJsonSerialization.Deserialize_test_derived(serialized_obj, validation_level=validation_level).ref2, -1.0)
+
+        # The number of items is checked unless validation is disabled
+        serialized_obj.ref3 = serialized_obj.ref3 * 2
+
+        with self.assertRaises(TestJsonSerialization.DeserializeException) as ctx:
+            TestJsonSerialization.Deserialize_test_derived(serialized_obj, validation_level="structure")
+
+        self.assertEqual(ctx.exception.stack, ["test_derived", "ref3"])
+
+        self.assertEqual(len(TestJsonSerialization.Deserialize_test_derived(serialized_obj, validation_level="none").ref3), 4)
+
+        # Module-wide settings
+        TestJsonSerialization.SetValidationLevel("none")
+        try:
+            TestJsonSerialization.Deserialize_test_derived(serialized_obj)
+        finally:
+            TestJsonSerialization.SetValidationLevel("full")
+
+        self.assertRaises(Exception, lambda: TestJsonSerialization.SetValidationLevel("invalid"))
+        self.assertRaises(TestJsonSerialization.DeserializeException, lambda: TestJsonSerialization.Deserialize_test_derived(serialized_obj, validation_level="invalid"))
+
+    # ----------------------------------------------------------------------
+    def test_Many(self):
+        for max_workers in [None, 2]:
+            serialized_objs = TestJsonSerialization.SerializeMany_test_base(
+                [self._xml_obj.test_base] * 3,
+                max_workers=max_workers,
+            )
+
+            self.assertEqual(len(serialized_objs), 3)
+
+            for serialized_obj in serialized_objs:
+                self.ValidateTestBase(serialized_obj)
+
+            objs = TestJsonSerialization.DeserializeMany_test_base(
+                serialized_objs,
+                max_workers=max_workers,
+            )
+
+            self.assertEqual(len(objs), 3)
+
+            for obj in objs:
+                self.ValidateTestBase(obj)
+
+    # ----------------------------------------------------------------------
+    def test_ManyError(self):
+        serialized_objs = TestJsonSerialization.SerializeMany_test_base([self._xml_obj.test_base] * 2)
+
+        serialized_objs[1][0].a = [1]
+
+        with self.assertRaises(TestJsonSerialization.DeserializeException) as ctx:
+            TestJsonSerialization.DeserializeMany_test_base(serialized_objs)
+
+        self.assertEqual(ctx.exception.stack[:2], ["Index 1", "test_base"])
+
+    # ----------------------------------------------------------------------
+    def test_Iter(self):
+        content = TestJsonSerialization.Serialize(self._xml_obj, to_string=True)
+
+        # The items are in an object
+        objs = list(TestJsonSerialization.IterDeserialize_test_base(six.moves.StringIO(content)))
+        self.ValidateTestBase(objs)
+
+        # The items are in a list
+        content = TestJsonSerialization.Serialize_test_base(self._xml_obj, to_string=True)
+
+        objs = list(TestJsonSerialization.IterDeserialize_test_base(six.moves.StringIO(content)))
+        self.ValidateTestBase(objs)
+
+        # The items are in a string
+        objs = list(TestJsonSerialization.IterDeserialize_test_base(content))
+        self.ValidateTestBase(objs)
+
+        # The items are in a file
+        temp_filename = CurrentShell.CreateTempFilename(".json")
+
+        with open(temp_filename, "w") as f:
+            f.write(content)
+
+        with CallOnExit(lambda: FileSystem.RemoveFile(temp_filename)):
+            objs = list(TestJsonSerialization.IterDeserialize_test_base(temp_filename))
+            self.ValidateTestBase(objs)
+
+        # Errors
+        with self.assertRaises(TestJsonSerialization.DeserializeException) as ctx:
+            list(TestJsonSerialization.IterDeserialize_test_base(six.moves.StringIO('[{"a": ["one"]}, {"a": [1]}]')))
+
+        self.assertEqual(ctx.exception.stack[:2], ["test_base", "Index 1"])
+
+
+# ----------------------------------------------------------------------
+class JsonBackendSuite(unittest.TestCase, TestUtilsMixin):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        xml_filename = os.path.join(_script_dir, "..", "Impl", "Test.xml")
+        assert os.path.isfile(xml_filename), xml_filename
+
+        self._xml_obj = TestXmlSerialization.Deserialize(xml_filename)
+        self._temp_dir = tempfile.mkdtemp()
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    @unittest.skipIf(importlib.util.find_spec("orjson") is None, "orjson is not installed")
+    def test_Orjson(self):
+        self._Execute("orjson")
+
+    # ----------------------------------------------------------------------
+    @unittest.skipIf(importlib.util.find_spec("ujson") is None, "ujson is not installed")
+    def test_Ujson(self):
+        self._Execute("ujson")
+
+    # ----------------------------------------------------------------------
+    def _Execute(self, json_backend):
+        module = GenerateModule(
+            PythonJsonPlugin(),
+            "Test.SimpleSchema",
+            self._temp_dir,
+            "Test_{}".format(json_backend),
+            json_backend=json_backend,
+        )
+
+        self.assertEqual(module._json_backend_name, json_backend)
+
+        content = module.Serialize(self._xml_obj, to_string=True)
+
+        # The content is equivalent to the content created by the standard library
+        standard_content = TestJsonSerialization.Serialize(self._xml_obj, to_string=True)
+
+        self.assertEqual(json.loads(content), json.loads(standard_content))
+
+        for this_content in [content, standard_content]:
+            obj = module.Deserialize(this_content)
+
+            self.ValidateTestBase(obj.test_base)
+            self.ValidateTestDerived(obj.test_derived)
+
+        # The items are read incrementally with the standard library
+        self.ValidateTestBase(list(module.IterDeserialize_test_base(module.Serialize_test_base(self._xml_obj, to_string=True))))
+
+
+# ----------------------------------------------------------------------
+@unittest.skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+class NumpyArraysSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = tempfile.mkdtemp()
+
+        # The content for collections is created by different code when 'fast_path' is set
+        cls._modules = [
+            GenerateModule(
+                PythonJsonPlugin(),
+                "AllTypes.SimpleSchema",
+                cls._temp_dir,
+                "AllTypes_numpy{}".format("_fast_path" if fast_path else ""),
+                numpy_arrays=True,
+                fast_path=fast_path,
+            )
+            for fast_path in [False, True]
+        ]
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        yaml_filename = os.path.join(_script_dir, "..", "Impl", "AllTypes.yaml")
+        assert os.path.isfile(yaml_filename), yaml_filename
+
+        self._serialized_obj = AllTypesJsonSerialization.Serialize_types(AllTypesYamlSerialization.Deserialize_types(yaml_filename))
+
+    # ----------------------------------------------------------------------
+    def test_Deserialize(self):
+        import numpy
+
+        for module in self._modules:
+            obj = module.Deserialize_types(self._serialized_obj)
+
+            # Ints in a collection of numbers are converted to floats
+            self.assertTrue(isinstance(obj.number_, numpy.ndarray))
+            self.assertEqual(obj.number_.dtype, numpy.float64)
+            self.assertEqual(obj.number_.tolist(), [100.1, 100.0, -100.1, -100.0])
+
+            self.assertTrue(isinstance(obj.int_, numpy.ndarray))
+            self.assertEqual(obj.int_.dtype, numpy.int64)
+            self.assertEqual(obj.int_.tolist(), [10, -10])
+
+            # Other collections are lists
+            self.assertEqual(obj.string_, ["test"])
+
+    # ----------------------------------------------------------------------
+    def test_Serialize(self):
+        import numpy
+
+        for module in self._modules:
+            obj = module.Deserialize_types(self._serialized_obj)
+
+            content = module.Serialize_types(obj, to_string=True)
+
+            # Ints in a collection of numbers are written as floats (2 -> 2.0)
+            self.assertTrue('"number_": [100.1, 100.0, -100.1, -100.0]' in content, content)
+            self.assertTrue('"int_": [10, -10]' in content, content)
+
+            # The content is equivalent to the content created without numpy arrays
+            self.assertEqual(
+                json.loads(content),
+                json.loads(AllTypesJsonSerialization.Serialize_types(AllTypesJsonSerialization.Deserialize_types(self._serialized_obj), to_string=True)),
+            )
+
+            # Lists and numpy arrays can be serialized
+            obj.number_ = [2, 3.5]
+            self.assertTrue('"number_": [2, 3.5]' in module.Serialize_types(obj, to_string=True))
+
+            obj.number_ = numpy.array([2, 3.5])
+            self.assertTrue('"number_": [2.0, 3.5]' in module.Serialize_types(obj, to_string=True))
+
 
 # ----------------------------------------------------------------------
 class DefaultValuesSuite(unittest.TestCase, DefaultValuesMixin):
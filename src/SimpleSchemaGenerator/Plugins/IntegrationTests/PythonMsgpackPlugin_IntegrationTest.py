@@ -0,0 +1,590 @@
+# ----------------------------------------------------------------------
+# |
+# |  PythonMsgpackPlugin_IntegrationTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-02 13:48:05
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Integration tests for PythonMsgpackPlugin"""
+
+import json
+import os
+import pickle
+import sys
+import unittest
+
+import msgpack
+import six
+
+import CommonEnvironment
+from CommonEnvironment.CallOnExit import CallOnExit
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "AllTypes"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import AllTypes_PythonMsgpackSerialization as AllTypesMsgpack
+    import AllTypes_PythonYamlSerialization as AllTypesYaml
+
+
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "DefaultValues"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import DefaultValues_PythonMsgpackSerialization as DefaultValuesMsgpackSerialization
+
+
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "DictionaryTest"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import DictionaryTest_PythonJsonSerialization as DictionaryTestJsonSerialization
+    import DictionaryTest_PythonMsgpackSerialization as DictionaryTestMsgpackSerialization
+
+
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "FileSystemTest"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import FileSystemTest_PythonMsgpackSerialization as FileSystemMsgpackSerialization
+    import FileSystemTest_PythonXmlSerialization as FileSystemXmlSerialization
+
+
+sys.path.insert(0, os.path.join(_script_dir, "Generated", "Test"))
+with CallOnExit(lambda: sys.path.pop(0)):
+    import Test_PythonMsgpackSerialization as TestMsgpackSerialization
+    import Test_PythonXmlSerialization as TestXmlSerialization
+
+
+with InitRelativeImports():
+    from .Impl.DefaultValuesUtils import DefaultValuesMixin
+    from .Impl.DictionaryTestUtils import DictionaryTestMixin
+    from .Impl.FileSystemTestUtils import FileSystemUtilsMixin
+    from .Impl.TestUtils import TestUtilsMixin
+
+# ----------------------------------------------------------------------
+class AllTypesSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        yaml_filename = os.path.join(_script_dir, "..", "Impl", "AllTypes.yaml")
+        assert os.path.isfile(yaml_filename), yaml_filename
+
+        self._obj = AllTypesYaml.Deserialize_types(yaml_filename)
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        content = AllTypesMsgpack.Serialize_types(self._obj, to_string=True)
+
+        self.assertTrue(isinstance(content, bytes))
+
+        obj = AllTypesMsgpack.Deserialize_types(content)
+
+        self.assertEqual(obj.bool_, self._obj.bool_)
+        self.assertEqual(obj.date_, self._obj.date_)
+        self.assertEqual(obj.datetime_, self._obj.datetime_)
+        self.assertEqual(obj.duration_, self._obj.duration_)
+        self.assertEqual(obj.enum_, self._obj.enum_)
+        self.assertEqual(obj.guid_, self._obj.guid_)
+        self.assertEqual(obj.int_, self._obj.int_)
+        self.assertEqual(obj.number_, self._obj.number_)
+        self.assertEqual(obj.string_, self._obj.string_)
+        self.assertEqual(obj.time_, self._obj.time_)
+
+    # ----------------------------------------------------------------------
+    def test_NativeTypes(self):
+        content = msgpack.unpackb(AllTypesMsgpack.Serialize_types(self._obj, to_string=True))
+
+        # Datetimes, durations, and guids are stored as extension types rather than strings
+        self.assertTrue(all(isinstance(item, msgpack.ExtType) and item.code == 1 for item in content["datetime_"]))
+        self.assertTrue(all(isinstance(item, msgpack.ExtType) and item.code == 2 and len(item.data) == 8 for item in content["duration_"]))
+        self.assertTrue(all(isinstance(item, msgpack.ExtType) and item.code == 3 and len(item.data) == 16 for item in content["guid_"]))
+
+        self.assertEqual(content["int_"], [10, -10])
+        self.assertEqual(content["date_"], ["2019-02-11", "2019-02-11"])
+
+    # ----------------------------------------------------------------------
+    def test_Strings(self):
+        # Values that aren't stored natively are converted
+        obj = AllTypesMsgpack.Deserialize_types(
+            msgpack.packb(
+                {
+                    "bool_": ["true"],
+                    "date_": ["2019-02-11"],
+                    "datetime_": ["2019-02-11T17:00:00"],
+                    "directory_": ["DirectoryName"],
+                    "duration_": ["1:23:01:02"],
+                    "enum_": ["three"],
+                    "filename_": ["FileName"],
+                    "number_": ["100.1"],
+                    "guid_": ["f638e451-c276-479a-aaa0-c699e35196fb"],
+                    "int_": ["10"],
+                    "string_": ["test"],
+                    "time_": ["10:11:12"],
+                    "uri_": ["https://www.test.com"],
+                },
+            ),
+        )
+
+        self.assertEqual(obj.bool_, [True])
+        self.assertEqual(obj.datetime_, self._obj.datetime_[:1])
+        self.assertEqual(obj.duration_, self._obj.duration_[:1])
+        self.assertEqual(obj.guid_, self._obj.guid_[:1])
+        self.assertEqual(obj.int_, [10])
+
+    # ----------------------------------------------------------------------
+    def test_StandardList(self):
+        self.assertEqual(AllTypesMsgpack.Deserialize_standard_list(msgpack.packb(["one", "two", "three"])), ["one", "two", "three"])
+
+        # Errors
+        self.assertRaisesRegex(AllTypesMsgpack.DeserializeException, r"An item was expected", lambda: AllTypesMsgpack.Deserialize_standard_list(msgpack.packb([])))
+
+
+# ----------------------------------------------------------------------
+class FileSystemSuite(unittest.TestCase, FileSystemUtilsMixin):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        # Use the xml file as a source as it is capable of processing attributes.
+        xml_filename = os.path.join(_script_dir, "..", "Impl", "FileSystemTest.xml")
+        assert os.path.isfile(xml_filename), xml_filename
+
+        xml_obj = FileSystemXmlSerialization.Deserialize(
+            xml_filename,
+            process_additional_data=True,
+        )
+
+        self._xml_obj = xml_obj
+
+    # ----------------------------------------------------------------------
+    def test_All(self):
+        serialized_obj = FileSystemMsgpackSerialization.Serialize(
+            self._xml_obj,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoot(serialized_obj.root)
+        self.ValidateRoots(serialized_obj.roots)
+
+        obj = FileSystemMsgpackSerialization.Deserialize(
+            serialized_obj,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoot(obj.root)
+        self.ValidateRoots(obj.roots)
+
+    # ----------------------------------------------------------------------
+    def test_AllAdditionalData(self):
+        serialized_obj = FileSystemMsgpackSerialization.Serialize(
+            self._xml_obj,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoot(
+            serialized_obj.root,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoots(
+            serialized_obj.roots,
+            process_additional_data=True,
+        )
+
+        obj = FileSystemMsgpackSerialization.Deserialize(
+            serialized_obj,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoot(
+            obj.root,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoots(
+            obj.roots,
+            process_additional_data=True,
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Root(self):
+        serialized_obj = FileSystemMsgpackSerialization.Serialize_root(self._xml_obj.root)
+
+        self.ValidateRoot(serialized_obj)
+
+        obj = FileSystemMsgpackSerialization.Deserialize_root(serialized_obj)
+
+        self.ValidateRoot(obj)
+
+    # ----------------------------------------------------------------------
+    def test_Roots(self):
+        serialized_obj = FileSystemMsgpackSerialization.Serialize_roots(
+            self._xml_obj.roots,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoots(serialized_obj)
+
+        obj = FileSystemMsgpackSerialization.Deserialize_roots(
+            serialized_obj,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoots(obj)
+
+    # ----------------------------------------------------------------------
+    def test_AllToString(self):
+        content = FileSystemMsgpackSerialization.Serialize(
+            self._xml_obj,
+            to_string=True,
+            process_additional_data=True,
+        )
+
+        self.assertEqual(msgpack.unpackb(content), {"root": _ROOT, "roots": _ROOTS})
+
+        obj = FileSystemMsgpackSerialization.Deserialize(
+            content,
+            process_additional_data=True,
+        )
+
+        self.ValidateRoot(obj.root)
+        self.ValidateRoots(
+            obj.roots,
+            process_additional_data=True,
+        )
+
+    # ----------------------------------------------------------------------
+    def test_RootToString(self):
+        content = FileSystemMsgpackSerialization.Serialize_root(
+            self._xml_obj,
+            to_string=True,
+        )
+
+        self.assertEqual(msgpack.unpackb(content), _ROOT)
+
+        self.ValidateRoot(FileSystemMsgpackSerialization.Deserialize_root(content))
+
+    # ----------------------------------------------------------------------
+    def test_RootsToString(self):
+        content = FileSystemMsgpackSerialization.Serialize_roots(
+            self._xml_obj,
+            to_string=True,
+            process_additional_data=True,
+        )
+
+        self.assertEqual(msgpack.unpackb(content), _ROOTS)
+
+        self.ValidateRoots(
+            FileSystemMsgpackSerialization.Deserialize_roots(
+                content,
+                process_additional_data=True,
+            ),
+            process_additional_data=True,
+        )
+
+    # ----------------------------------------------------------------------
+    def test_File(self):
+        content = FileSystemMsgpackSerialization.Serialize(
+            self._xml_obj,
+            to_string=True,
+            process_additional_data=True,
+        )
+
+        filename = os.path.join(_script_dir, "Generated", "FileSystemTest", "FileSystemTest.msgpack")
+
+        with open(filename, "wb") as f:
+            f.write(content)
+
+        with CallOnExit(lambda: os.remove(filename)):
+            obj = FileSystemMsgpackSerialization.Deserialize(
+                filename,
+                process_additional_data=True,
+            )
+
+        self.ValidateRoot(obj.root)
+        self.ValidateRoots(obj.roots)
+
+
+# ----------------------------------------------------------------------
+class TestSuite(unittest.TestCase, TestUtilsMixin):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        xml_filename = os.path.join(_script_dir, "..", "Impl", "Test.xml")
+        assert os.path.isfile(xml_filename), xml_filename
+
+        xml_obj = TestXmlSerialization.Deserialize(xml_filename)
+
+        self._xml_obj = xml_obj
+
+    # ----------------------------------------------------------------------
+    def test_All(self):
+        serialized_obj = TestMsgpackSerialization.Serialize(self._xml_obj)
+        obj = TestMsgpackSerialization.Deserialize(serialized_obj)
+
+        self.ValidateTestBase(obj.test_base)
+        self.ValidateTestDerived(obj.test_derived)
+
+    # ----------------------------------------------------------------------
+    def test_AllToString(self):
+        content = TestMsgpackSerialization.Serialize(self._xml_obj, to_string=True)
+        obj = TestMsgpackSerialization.Deserialize(content)
+
+        self.ValidateTestBase(obj.test_base)
+        self.ValidateTestDerived(obj.test_derived)
+
+    # ----------------------------------------------------------------------
+    def test_Base(self):
+        serialized_obj = TestMsgpackSerialization.Serialize_test_base(self._xml_obj)
+
+        self.ValidateTestBase(serialized_obj)
+
+        obj = TestMsgpackSerialization.Deserialize_test_base(serialized_obj)
+
+        self.ValidateTestBase(obj)
+
+    # ----------------------------------------------------------------------
+    def test_Derived(self):
+        serialized_obj = TestMsgpackSerialization.Serialize_test_derived(self._xml_obj)
+        obj = TestMsgpackSerialization.Deserialize_test_derived(serialized_obj)
+
+        self.ValidateTestDerived(obj)
+
+    # ----------------------------------------------------------------------
+    def test_Object(self):
+        obj = TestMsgpackSerialization.Deserialize_test_base(TestMsgpackSerialization.Serialize_test_base(self._xml_obj))
+
+        self.assertTrue(isinstance(obj[0], TestMsgpackSerialization.Object))
+        self.assertEqual(type(obj[0]).__slots__, ("a",))
+
+        obj = pickle.loads(pickle.dumps(obj))
+
+        self.ValidateTestBase(obj)
+
+        # Objects can be packed directly
+        self.assertEqual(msgpack.unpackb(TestMsgpackSerialization._MsgpackDumps(obj)), [{"a": ["one", "two"]}, {"a": ["three"]}])
+
+    # ----------------------------------------------------------------------
+    def test_Lazy(self):
+        serialized_obj = TestMsgpackSerialization.Serialize_test_derived(self._xml_obj)
+
+        obj = TestMsgpackSerialization.Deserialize_test_derived(serialized_obj, lazy=True)
+
+        self.assertEqual(list(TestMsgpackSerialization._GetLazyChildNames(obj)), ["sub_item"])
+
+        self.ValidateTestDerived(obj)
+        self.assertEqual(obj.sub_item.v, "string value")
+        self.assertEqual(TestMsgpackSerialization._GetLazyChildNames(obj), None)
+
+        # Errors are raised when the child is first accessed
+        serialized_obj.sub_item.v = 1
+
+        obj = TestMsgpackSerialization.Deserialize_test_derived(serialized_obj, lazy=True)
+        self.assertEqual(obj.b, False)
+
+        with self.assertRaises(TestMsgpackSerialization.DeserializeException) as ctx:
+            obj.sub_item
+
+        self.assertEqual(ctx.exception.stack, ["sub_item", "v"])
+
+    # ----------------------------------------------------------------------
+    def test_ValidationLevel(self):
+        serialized_obj = TestMsgpackSerialization.Serialize_test_derived(self._xml_obj)
+
+        for validation_level in ["full", "structure", "none"]:
+            self.ValidateTestDerived(TestMsgpackSerialization.Deserialize_test_derived(serialized_obj, validation_level=validation_level))
+
+        # Constraints are only checked with full validation
+        serialized_obj.ref2 = -1.0
+
+        with self.assertRaises(TestMsgpackSerialization.DeserializeException) as ctx:
+            TestMsgpackSerialization.Deserialize_test_derived(serialized_obj)
+
+        self.assertEqual(ctx.exception.stack, ["test_derived", "ref2"])
+
+        for validation_level in ["structure", "none"]:
+            self.assertEqual(TestMsgpackSerialization.Deserialize_test_derived(serialized_obj, validation_level=validation_level).ref2, -1.0)
+
+    # ----------------------------------------------------------------------
+    def test_Many(self):
+        for max_workers in [None, 2]:
+            serialized_objs = TestMsgpackSerialization.SerializeMany_test_base(
+                [self._xml_obj.test_base] * 3,
+                max_workers=max_workers,
+            )
+
+            self.assertEqual(len(serialized_objs), 3)
+
+            for serialized_obj in serialized_objs:
+                self.ValidateTestBase(serialized_obj)
+
+            objs = TestMsgpackSerialization.DeserializeMany_test_base(
+                serialized_objs,
+                max_workers=max_workers,
+            )
+
+            self.assertEqual(len(objs), 3)
+
+            for obj in objs:
+                self.ValidateTestBase(obj)
+
+    # ----------------------------------------------------------------------
+    def test_ManyError(self):
+        serialized_objs = TestMsgpackSerialization.SerializeMany_test_base([self._xml_obj.test_base] * 2)
+
+        serialized_objs[1][0].a = [1]
+
+        with self.assertRaises(TestMsgpackSerialization.DeserializeException) as ctx:
+            TestMsgpackSerialization.DeserializeMany_test_base(serialized_objs)
+
+        self.assertEqual(ctx.exception.stack[:2], ["Index 1", "test_base"])
+
+    # ----------------------------------------------------------------------
+    def test_Iter(self):
+        content = TestMsgpackSerialization.Serialize(self._xml_obj, to_string=True)
+
+        # The items are in a map
+        objs = list(TestMsgpackSerialization.IterDeserialize_test_base(six.BytesIO(content)))
+        self.ValidateTestBase(objs)
+
+        # The items are in an array
+        content = TestMsgpackSerialization.Serialize_test_base(self._xml_obj, to_string=True)
+
+        objs = list(TestMsgpackSerialization.IterDeserialize_test_base(six.BytesIO(content)))
+        self.ValidateTestBase(objs)
+
+        # The content itself
+        objs = list(TestMsgpackSerialization.IterDeserialize_test_base(content))
+        self.ValidateTestBase(objs)
+
+        # Content that is read in small pieces
+        self.assertEqual(
+            list(TestMsgpackSerialization._MsgpackStreamReader(six.BytesIO(content), read_size=1).IterItems("test_base")),
+            [{"a": ["one", "two"]}, {"a": ["three"]}],
+        )
+
+        # Errors
+        with self.assertRaises(TestMsgpackSerialization.DeserializeException) as ctx:
+            list(TestMsgpackSerialization.IterDeserialize_test_base(six.BytesIO(msgpack.packb([{"a": ["one"]}, {"a": [1]}]))))
+
+        self.assertEqual(ctx.exception.stack[:2], ["test_base", "Index 1"])
+
+
+# ----------------------------------------------------------------------
+class DefaultValuesSuite(unittest.TestCase, DefaultValuesMixin):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+    # ----------------------------------------------------------------------
+    def test_All(self):
+        json_filename = os.path.join(_script_dir, "..", "Impl", "DefaultValues.json")
+        assert os.path.isfile(json_filename), json_filename
+
+        with open(json_filename) as f:
+            content = msgpack.packb(json.load(f))
+
+        obj = DefaultValuesMsgpackSerialization.Deserialize(content)
+
+        self.ValidateObject1(obj[0])
+        self.ValidateObject2(obj[1])
+
+
+# ----------------------------------------------------------------------
+class DictionaryTestSuite(unittest.TestCase, DictionaryTestMixin):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        json_filename = os.path.join(_script_dir, "..", "Impl", "DictionaryTest.json")
+        assert os.path.isfile(json_filename), json_filename
+
+        self._json_filename                 = json_filename
+
+    # ----------------------------------------------------------------------
+    def test_SimpleDict(self):
+        json_obj = DictionaryTestJsonSerialization.Deserialize_simple_dict(self._json_filename)
+
+        obj = DictionaryTestMsgpackSerialization.Deserialize_simple_dict(DictionaryTestMsgpackSerialization.Serialize_simple_dict(json_obj, to_string=True))
+        self.ValidateSimpleDict(obj)
+
+    # ----------------------------------------------------------------------
+    def test_StandardDict(self):
+        json_obj = DictionaryTestJsonSerialization.Deserialize_standard_dict(self._json_filename)
+
+        obj = DictionaryTestMsgpackSerialization.Deserialize_standard_dict(DictionaryTestMsgpackSerialization.Serialize_standard_dict(json_obj, to_string=True))
+        self.ValidateStandardDict(obj)
+
+    # ----------------------------------------------------------------------
+    def test_NestedDict(self):
+        json_obj = DictionaryTestJsonSerialization.Deserialize_nested_dict(self._json_filename)
+
+        obj = DictionaryTestMsgpackSerialization.Deserialize_nested_dict(DictionaryTestMsgpackSerialization.Serialize_nested_dict(json_obj, to_string=True))
+        self.ValidateNestedDict(obj)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_ROOT                                       = {
+    "name": "one",
+    "directories": [
+        {
+            "name": "two",
+            "directories": [
+                {
+                    "name": "three",
+                    "files": [
+                        {"size": 10, "name": "file1"},
+                        {"size": 200, "name": "file2"},
+                    ],
+                },
+            ],
+        },
+    ],
+    "files": [
+        {"size": 20, "name": "file10"},
+    ],
+}
+
+_ROOTS                                      = [
+    {"name": "dir1"},
+    {
+        "name": "dir2",
+        "extra": [
+            {"two": "2", "simple_value": "value"},
+            {
+                "a": "a",
+                "b": "b",
+                "value": [
+                    {"one": "1", "simple_value": "text value"},
+                    {"simple_value": "another text value"},
+                ],
+            },
+        ],
+    },
+]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
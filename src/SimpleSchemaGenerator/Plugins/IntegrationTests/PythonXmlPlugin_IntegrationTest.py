@@ -22,6 +22,8 @@ import unittest
 
 import xml.etree.ElementTree as ET
 
+import six
+
 import CommonEnvironment
 from CommonEnvironment.CallOnExit import CallOnExit
 
@@ -533,6 +535,39 @@ class TestSuite(TestSuiteImpl):
         self.ValidateTestBase(obj.test_base)
         self.ValidateTestDerived(obj.test_derived)
 
+    # ----------------------------------------------------------------------
+    def test_Iter(self):
+        # The items are in a child of the document element
+        objs = list(TestXmlSerialization.IterDeserialize_test_base(self._xml_filename))
+        self.ValidateTestBase(objs)
+
+        # The items are in the document element
+        content = textwrap.dedent(
+            """\
+            <test_base>
+                <item><a><item>one</item><item>two</item></a></item>
+                <item><a><item>three</item></a></item>
+            </test_base>
+            """,
+        )
+
+        objs = list(TestXmlSerialization.IterDeserialize_test_base(six.moves.StringIO(content)))
+        self.ValidateTestBase(objs)
+
+        # The items are in a string
+        objs = list(TestXmlSerialization.IterDeserialize_test_base(content))
+        self.ValidateTestBase(objs)
+
+        # Errors
+        with self.assertRaises(TestXmlSerialization.DeserializeException) as ctx:
+            list(
+                TestXmlSerialization.IterDeserialize_test_base(
+                    six.moves.StringIO("<test_base><item><a><item>one</item></a></item><item><a><item><b /></item></a></item></test_base>"),
+                ),
+            )
+
+        self.assertEqual(ctx.exception.stack, ["test_base", "Index 1", "a", "Index 0"])
+
 
 # ----------------------------------------------------------------------
 class DefaultValuesSuite(unittest.TestCase, DefaultValuesMixin):
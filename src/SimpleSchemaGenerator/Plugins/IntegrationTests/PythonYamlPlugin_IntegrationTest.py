@@ -17,12 +17,15 @@
 
 import os
 import re
+import shutil
 import sys
+import tempfile
 import textwrap
 import unittest
 import uuid
 
 import rtyaml
+import yaml
 
 import CommonEnvironment
 from CommonEnvironment.CallOnExit import CallOnExit
@@ -60,10 +63,13 @@ with CallOnExit(lambda: sys.path.pop(0)):
 
 
 with InitRelativeImports():
+    from ..PythonYamlPlugin import Plugin as PythonYamlPlugin
+
     from .Impl.DefaultValuesUtils import DefaultValuesMixin
     from .Impl.DictionaryTestUtils import DictionaryTestMixin
     from .Impl.AllTypesUtils import AllTypesUtilsMixin
     from .Impl.FileSystemTestUtils import FileSystemUtilsMixin
+    from .Impl.GenerateUtils import GenerateModule
     from .Impl.TestUtils import TestUtilsMixin
 
 
@@ -735,6 +741,50 @@ class DictionaryTestSuite(unittest.TestCase, DictionaryTestMixin):
         self.ValidateNestedDict(yaml_obj2)
 
 
+# ----------------------------------------------------------------------
+@unittest.skipIf(not hasattr(yaml, "CSafeLoader"), "The LibYAML bindings are not available")
+class LibYamlBackendSuite(unittest.TestCase, TestUtilsMixin):
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self.maxDiff = None
+
+        xml_filename = os.path.join(_script_dir, "..", "Impl", "Test.xml")
+        assert os.path.isfile(xml_filename), xml_filename
+
+        self._xml_obj = TestXml.Deserialize(xml_filename)
+        self._temp_dir = tempfile.mkdtemp()
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_RoundTrip(self):
+        module = GenerateModule(
+            PythonYamlPlugin(),
+            "Test.SimpleSchema",
+            self._temp_dir,
+            "Test_libyaml",
+            yaml_backend="libyaml",
+        )
+
+        self.assertEqual(module._yaml_backend_name, "libyaml")
+        self.assertTrue(issubclass(module._YamlLoader, yaml.CSafeLoader))
+
+        content = module.Serialize(self._xml_obj, to_string=True)
+
+        # The content is equivalent to the content created by rtyaml
+        rtyaml_content = TestYaml.Serialize(self._xml_obj, to_string=True)
+
+        self.assertEqual(yaml.load(content, Loader=yaml.CSafeLoader), rtyaml.load(rtyaml_content))
+
+        for this_content in [content, rtyaml_content]:
+            obj = module.Deserialize(this_content)
+
+            self.ValidateTestBase(obj.test_base)
+            self.ValidateTestDerived(obj.test_derived)
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
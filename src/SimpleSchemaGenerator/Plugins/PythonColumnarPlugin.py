@@ -0,0 +1,941 @@
+# ----------------------------------------------------------------------
+# |
+# |  PythonColumnarPlugin.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-09 08:41:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Plugin object"""
+
+import os
+import textwrap
+
+import CommonEnvironment
+from CommonEnvironment import Interface
+from CommonEnvironment.TypeInfo.FundamentalTypes.Visitor import Visitor as FundamentalTypeInfoVisitor
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..Plugin import Plugin as PluginBase, ParseFlag
+    from ..Schema import Elements
+
+    from .Impl.ElementVisitors import ToPythonName
+
+# ----------------------------------------------------------------------
+@Interface.staticderived
+class Plugin(PluginBase):
+    # ----------------------------------------------------------------------
+    # |  Public Properties
+    Name                                    = Interface.DerivedProperty("PythonColumnar")
+    Description                             = Interface.DerivedProperty("Creates python code that encodes python objects as columns and writes them to Arrow IPC (or simple column) files")
+    Flags                                   = Interface.DerivedProperty(
+        ParseFlag.SupportAttributes
+        | ParseFlag.SupportIncludeStatements
+        # | ParseFlag.SupportConfigStatements
+        # | ParseFlag.SupportExtensionsStatements
+        # | ParseFlag.SupportUnnamedDeclarations
+        # | ParseFlag.SupportUnnamedObjects
+        | ParseFlag.SupportNamedDeclarations
+        | ParseFlag.SupportNamedObjects
+        | ParseFlag.SupportRootDeclarations
+        | ParseFlag.SupportRootObjects
+        | ParseFlag.SupportChildDeclarations
+        | ParseFlag.SupportChildObjects
+        # | ParseFlag.SupportCustomElements
+        # | ParseFlag.SupportAnyElements
+        | ParseFlag.SupportReferenceElements
+        | ParseFlag.SupportListElements
+        | ParseFlag.SupportSimpleObjectElements,
+        # | ParseFlag.SupportVariantElements
+        # | ParseFlag.SupportDictionaryElements
+    )
+
+    # ----------------------------------------------------------------------
+    # |  Methods
+    @staticmethod
+    @Interface.override
+    def IsValidEnvironment():
+        return True
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    @Interface.override
+    def GetAdditionalGeneratorItems(cls, context):
+        return [_script_fullpath] + super(Plugin, cls).GetAdditionalGeneratorItems(context)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def GenerateCustomSettingsAndDefaults():
+        # The number of records encoded before the columns are written to the file
+        yield "batch_size", 10000
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    @Interface.override
+    def GenerateOutputFilenames(cls, context):
+        yield os.path.join(context["output_dir"], "{}_{}.py".format(context["output_name"], cls.Name))
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    @Interface.override
+    def Generate(
+        cls,
+        simple_schema_generator,
+        invoke_reason,
+        input_filenames,
+        output_filenames,
+        name,
+        elements,
+        include_indexes,
+        status_stream,
+        verbose_stream,
+        verbose,
+        batch_size,
+    ):
+        assert len(output_filenames) == 1, output_filenames
+        output_filename = output_filenames[0]
+        del output_filenames
+
+        if batch_size < 1:
+            raise Exception("'batch_size' must be greater than 0")
+
+        top_level_elements = [elements[include_index] for include_index in include_indexes if not elements[include_index].IsDefinitionOnly]
+
+        status_stream.write("Creating '{}'...".format(output_filename))
+        with status_stream.DoneManager():
+            with open(output_filename, "w") as f:
+                f.write(
+                    cls._GenerateFileHeader(
+                        prefix="# ",
+                        filename_prefix="<SimpleSchemaGenerator>/",
+                    ),
+                )
+
+                f.write(_FILE_HEADER)
+                f.write("DEFAULT_BATCH_SIZE = {}\n\n\n".format(batch_size))
+                f.write(_COLUMNAR_IMPL)
+
+                for element in top_level_elements:
+                    columns, num_buffers, append_statements = _EncoderGenerator().Generate(element)
+
+                    f.write(
+                        textwrap.dedent(
+                            """\
+                            # ----------------------------------------------------------------------
+                            # |
+                            # |  {name}
+                            # |
+                            # ----------------------------------------------------------------------
+                            class _{python_name}_Writer(_ColumnarWriter):
+                                COLUMNS = [
+                                    {columns}
+                                ]
+
+                                NUM_BUFFERS = {num_buffers}
+
+                                # ----------------------------------------------------------------------
+                                @staticmethod
+                                def _Append(b, record):
+                                    {append_statements}
+
+
+                            # ----------------------------------------------------------------------
+                            def CreateWriter_{python_name}(filename, batch_size=None, file_format=None):
+                                \"\"\"\\
+                                Returns a writer that encodes '{name}' items as columns. Call `Close` (or use
+                                the writer as a context manager) once all of the items have been written.
+                                \"\"\"
+
+                                return _{python_name}_Writer(filename, batch_size=batch_size, file_format=file_format)
+
+
+                            # ----------------------------------------------------------------------
+                            def Write_{python_name}(filename, items, batch_size=None, file_format=None):
+                                with CreateWriter_{python_name}(filename, batch_size=batch_size, file_format=file_format) as writer:
+                                    writer.WriteMany(items)
+
+
+                            # ----------------------------------------------------------------------
+                            def Read_{python_name}(filename, columns=None):
+                                \"\"\"Returns the values of the specified columns (or all columns if None) written by `Write_{python_name}`\"\"\"
+
+                                return _ReadColumns(filename, _{python_name}_Writer.COLUMNS, columns)
+
+
+                            """,
+                        ).format(
+                            name=element.Name,
+                            python_name=ToPythonName(element),
+                            columns="\n        ".join(
+                                '("{}", {}),'.format(column_name, _FormatColumn(column, "        "))
+                                for column_name, column in columns
+                            ),
+                            num_buffers=num_buffers,
+                            append_statements="\n        ".join(append_statements),
+                        ),
+                    )
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _EncoderGenerator(object):
+    """\
+    Generates the column descriptions for an element and the python statements that
+    append a record to the buffers associated with those columns.
+
+    Columns are described by nested tuples (see _COLUMNAR_IMPL):
+
+        ("leaf", <buffer index>, <type name>)
+        ("list", <offsets buffer index>, <item column>)
+        ("struct", <validity buffer index or None>, [(<name>, <column>), ...])
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._num_buffers                   = 0
+        self._num_vars                      = 0
+        self._statements                    = []
+        self._compound_stack                = []
+
+    # ----------------------------------------------------------------------
+    def Generate(self, element):
+        """Returns (columns, num_buffers, statements)"""
+
+        column = self._OnItem(element, "record", 0, False)
+
+        if column[0] == "struct":
+            assert column[1] is None, column
+            columns = column[2]
+        else:
+            columns = [(element.Name, column)]
+
+        return columns, self._num_buffers, self._statements or ["pass"]
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _OnElement(self, element, value_expr, indent):
+        if element.TypeInfo.Arity.IsCollection:
+            offsets_index = self._CreateBuffer()
+
+            items_var = self._CreateVar("items")
+            item_var = self._CreateVar("item")
+
+            self._Write(indent, "{} = {} or []".format(items_var, value_expr))
+            self._Write(indent, "b[{index}].append(b[{index}][-1] + len({items}))".format(index=offsets_index, items=items_var))
+            self._Write(indent, "for {} in {}:".format(item_var, items_var))
+
+            num_statements = len(self._statements)
+
+            item_column = self._OnItem(element, item_var, indent + 1, False)
+
+            if len(self._statements) == num_statements:
+                self._Write(indent + 1, "pass")
+
+            return ("list", offsets_index, item_column)
+
+        return self._OnItem(element, value_expr, indent, element.TypeInfo.Arity.IsOptional)
+
+    # ----------------------------------------------------------------------
+    def _OnItem(self, element, value_expr, indent, is_optional):
+        # The arity of the reference (rather than the arity of the referenced element)
+        # has already been applied, so don't use `Resolve` here (as it would skip ListElements).
+        while isinstance(element, Elements.ReferenceElement):
+            element = element.Reference
+
+        if isinstance(element, Elements.ListElement):
+            return self._OnElement(element.Reference, value_expr, indent)
+
+        if isinstance(element, Elements.FundamentalElement):
+            return self._OnFundamental(element.TypeInfo, value_expr, indent)
+
+        if isinstance(element, (Elements.CompoundElement, Elements.SimpleElement)):
+            if element in self._compound_stack:
+                raise Exception("The element '{}' is recursive and cannot be encoded as columns".format(element.DottedName))
+
+            self._compound_stack.append(element)
+
+            if value_expr.isidentifier():
+                value_var = value_expr
+            else:
+                value_var = self._CreateVar("value")
+                self._Write(indent, "{} = {}".format(value_var, value_expr))
+
+            if is_optional:
+                validity_index = self._CreateBuffer()
+                self._Write(indent, "b[{}].append({} is not None)".format(validity_index, value_var))
+
+                child_value_template = 'None if {var} is None else _GetValue({var}, "{{}}")'.format(var=value_var)
+            else:
+                validity_index = None
+                child_value_template = '_GetValue({}, "{{}}")'.format(value_var)
+
+            fields = []
+
+            if isinstance(element, Elements.SimpleElement):
+                fields.append(
+                    (
+                        element.FundamentalAttributeName,
+                        self._OnFundamental(
+                            element.TypeInfo.Items[element.FundamentalAttributeName],
+                            child_value_template.format(element.FundamentalAttributeName),
+                            indent,
+                        ),
+                    ),
+                )
+
+            for child in Plugin._EnumerateChildren(
+                element,
+                include_definitions=False,
+            ):
+                fields.append((child.Name, self._OnElement(child, child_value_template.format(child.Name), indent)))
+
+            self._compound_stack.pop()
+
+            return ("struct", validity_index, fields)
+
+        raise Exception("'{}' is not supported".format(element.DottedName))
+
+    # ----------------------------------------------------------------------
+    def _OnFundamental(self, type_info, value_expr, indent):
+        buffer_index = self._CreateBuffer()
+        self._Write(indent, "b[{}].append({})".format(buffer_index, value_expr))
+
+        return ("leaf", buffer_index, _TypeNameVisitor.Accept(type_info))
+
+    # ----------------------------------------------------------------------
+    def _CreateBuffer(self):
+        self._num_buffers += 1
+        return self._num_buffers - 1
+
+    # ----------------------------------------------------------------------
+    def _CreateVar(self, prefix):
+        self._num_vars += 1
+        return "{}_{}".format(prefix, self._num_vars)
+
+    # ----------------------------------------------------------------------
+    def _Write(self, indent, statement):
+        self._statements.append("{}{}".format("    " * indent, statement))
+
+
+# ----------------------------------------------------------------------
+@Interface.staticderived
+class _TypeNameVisitor(FundamentalTypeInfoVisitor):
+    """Returns the type name used in column descriptions"""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnBool(type_info):
+        return "bool"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnDateTime(type_info):
+        return "datetime"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnDate(type_info):
+        return "date"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnDirectory(type_info):
+        return "string"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnDuration(type_info):
+        return "duration"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnEnum(type_info):
+        return "string"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnFilename(type_info):
+        return "string"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnFloat(type_info):
+        return "float"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnGuid(type_info):
+        return "guid"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnInt(type_info):
+        return "int"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnString(type_info):
+        return "string"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnTime(type_info):
+        return "time"
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def OnUri(type_info):
+        return "uri"
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _FormatColumn(column, indent):
+    kind, index, value = column
+
+    if kind == "leaf":
+        return '("leaf", {}, "{}")'.format(index, value)
+
+    if kind == "list":
+        return '("list", {}, {})'.format(index, _FormatColumn(value, indent))
+
+    assert kind == "struct", kind
+
+    child_indent = "{}    ".format(indent)
+
+    return '("struct", {}, [\n{}{}])'.format(
+        index,
+        "".join(
+            '{}("{}", {}),\n'.format(child_indent, child_name, _FormatColumn(child, child_indent))
+            for child_name, child in value
+        ),
+        indent,
+    )
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_FILE_HEADER                                = textwrap.dedent(
+    """\
+    import json
+    import os
+    import struct
+    import uuid
+
+    from collections import OrderedDict
+
+    import six
+
+    import CommonEnvironment
+    from CommonEnvironment.TypeInfo.FundamentalTypes.Serialization.StringSerialization import StringSerialization
+    from CommonEnvironment.TypeInfo.FundamentalTypes.UriTypeInfo import Uri
+
+    # <Unused import> pylint: disable = W0611
+    # <Unused import> pylint: disable = W0614
+    from CommonEnvironment.TypeInfo.FundamentalTypes.All import *                   # <Wildcard import> pylint: disable = W0401
+
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        pyarrow = None
+
+    # <Standard import should be placed before...> pylint: disable = C0411
+
+    # ----------------------------------------------------------------------
+    # <Method name "..." doesn't conform to PascalCase naming style> pylint: disable = C0103
+    # <Line too long> pylint: disable = C0301
+    # <Too many lines in module> pylint: disable = C0302
+
+    # <Too few public methods> pylint: disable = R0903
+    # <Too many branches> pylint: disable = R0912
+    # <Too many statements> pylint: disable = R0915
+
+
+    """,
+)
+
+_COLUMNAR_IMPL                              = textwrap.dedent(
+    '''\
+    # ----------------------------------------------------------------------
+    # |
+    # |  Columnar Implementation
+    # |
+    # ----------------------------------------------------------------------
+
+    # Columns are described by nested tuples:
+    #
+    #     ("leaf", <buffer index>, <type name>)
+    #     ("list", <offsets buffer index>, <item column>)
+    #     ("struct", <validity buffer index or None>, [(<name>, <column>), ...])
+    #
+    # Records are appended to flat python lists (buffers) that are written to the
+    # file once a batch is complete. As with Arrow, lists are encoded as offsets into
+    # the buffers of their items, and optional structs record whether each value is
+    # present. Items that are None are encoded as empty lists.
+
+    _SIMPLE_FORMAT_MAGIC = b"SSGCOLS1"
+
+    # Values that can't be represented in JSON are written to simple files as strings
+    _SIMPLE_TYPE_INFOS = {
+        "date": DateTypeInfo(),
+        "datetime": DateTimeTypeInfo(),
+        "duration": DurationTypeInfo(),
+        "guid": GuidTypeInfo(),
+        "time": TimeTypeInfo(),
+        "uri": UriTypeInfo(),
+    }
+
+    if pyarrow is not None:
+        _ARROW_TYPES = {
+            "bool": pyarrow.bool_(),
+            "date": pyarrow.date32(),
+            "datetime": pyarrow.timestamp("us"),
+            "duration": pyarrow.duration("us"),
+            "float": pyarrow.float64(),
+            "guid": pyarrow.binary(16),
+            "int": pyarrow.int64(),
+            "string": pyarrow.string(),
+            "time": pyarrow.time64("us"),
+            "uri": pyarrow.string(),
+        }
+
+        _ARROW_ENCODERS = {
+            "guid": lambda value: value.bytes,
+            "uri": lambda value: value.ToString(),
+        }
+
+        _ARROW_DECODERS = {
+            "guid": lambda value: uuid.UUID(bytes=value),
+            "uri": Uri.FromString,
+        }
+
+
+    # ----------------------------------------------------------------------
+    class _ColumnarWriter(object):
+        """Encodes records as columns that are written to a file every `batch_size` records"""
+
+        # Set by derived classes
+        COLUMNS = None
+        NUM_BUFFERS = None
+
+        # ----------------------------------------------------------------------
+        def __init__(self, filename, batch_size=None, file_format=None):
+            if file_format is None:
+                file_format = "arrow" if pyarrow is not None else "simple"
+
+            if file_format == "arrow":
+                if pyarrow is None:
+                    raise Exception("'pyarrow' must be installed to write Arrow IPC files")
+
+                self._file = _ArrowFile(filename, self.COLUMNS)
+            elif file_format == "simple":
+                self._file = _SimpleFile(filename, self.COLUMNS)
+            else:
+                raise Exception("'{}' is not a valid file format".format(file_format))
+
+            self._batch_size = batch_size or DEFAULT_BATCH_SIZE
+            self._offsets_indexes = [column[1] for _, column in self.COLUMNS for column in _IterBufferColumns(column) if column[0] == "list"]
+
+            self._buffers = None
+            self._num_rows = None
+
+            self._ResetBuffers()
+
+        # ----------------------------------------------------------------------
+        def __enter__(self):
+            return self
+
+        # ----------------------------------------------------------------------
+        def __exit__(self, *args):
+            self.Close()
+
+        # ----------------------------------------------------------------------
+        def Write(self, record):
+            self._Append(self._buffers, record)
+            self._num_rows += 1
+
+            if self._num_rows == self._batch_size:
+                self.Flush()
+
+        # ----------------------------------------------------------------------
+        def WriteMany(self, records):
+            for record in records:
+                self.Write(record)
+
+        # ----------------------------------------------------------------------
+        def Flush(self):
+            if self._num_rows:
+                self._file.WriteBatch(self._num_rows, self._buffers)
+                self._ResetBuffers()
+
+        # ----------------------------------------------------------------------
+        def Close(self):
+            if self._file is None:
+                return
+
+            self.Flush()
+
+            self._file.Close()
+            self._file = None
+
+        # ----------------------------------------------------------------------
+        # ----------------------------------------------------------------------
+        # ----------------------------------------------------------------------
+        def _ResetBuffers(self):
+            self._buffers = [[] for _ in six.moves.range(self.NUM_BUFFERS)]
+            self._num_rows = 0
+
+            for index in self._offsets_indexes:
+                self._buffers[index].append(0)
+
+        # ----------------------------------------------------------------------
+        @staticmethod
+        def _Append(b, record):
+            raise Exception("Abstract method")
+
+
+    # ----------------------------------------------------------------------
+    class _ArrowFile(object):
+        # ----------------------------------------------------------------------
+        def __init__(self, filename, columns):
+            self._columns = columns
+            self._schema = pyarrow.schema([(name, _ToArrowType(column)) for name, column in columns])
+            self._writer = pyarrow.ipc.new_file(filename, self._schema)
+
+        # ----------------------------------------------------------------------
+        def WriteBatch(self, num_rows, buffers):
+            self._writer.write_batch(
+                pyarrow.RecordBatch.from_arrays(
+                    [_ToArrowArray(column, buffers) for _, column in self._columns],
+                    schema=self._schema,
+                ),
+            )
+
+        # ----------------------------------------------------------------------
+        def Close(self):
+            self._writer.close()
+
+
+    # ----------------------------------------------------------------------
+    class _SimpleFile(object):
+        """\\
+        File that contains JSON-encoded buffers for each column in each batch, followed by
+        a JSON-encoded footer with the location of that content, the footer size, and a
+        magic value.
+        """
+
+        # ----------------------------------------------------------------------
+        def __init__(self, filename, columns):
+            self._columns = columns
+            self._batches = []
+
+            self._f = open(filename, "wb")
+            self._f.write(_SIMPLE_FORMAT_MAGIC)
+
+        # ----------------------------------------------------------------------
+        def WriteBatch(self, num_rows, buffers):
+            batch_columns = OrderedDict()
+
+            for name, column in self._columns:
+                content = json.dumps(
+                    [
+                        _ToSimpleValues(buffer_column, buffers[buffer_column[1]])
+                        for buffer_column in _IterBufferColumns(column)
+                    ],
+                ).encode("utf-8")
+
+                batch_columns[name] = [self._f.tell(), len(content)]
+                self._f.write(content)
+
+            self._batches.append(
+                OrderedDict(
+                    [
+                        ("num_rows", num_rows),
+                        ("columns", batch_columns),
+                    ],
+                ),
+            )
+
+        # ----------------------------------------------------------------------
+        def Close(self):
+            footer = json.dumps(
+                OrderedDict(
+                    [
+                        ("columns", [name for name, _ in self._columns]),
+                        ("batches", self._batches),
+                    ],
+                ),
+            ).encode("utf-8")
+
+            self._f.write(footer)
+            self._f.write(struct.pack("<Q", len(footer)))
+            self._f.write(_SIMPLE_FORMAT_MAGIC)
+
+            self._f.close()
+
+
+    # ----------------------------------------------------------------------
+    def _GetValue(item, name):
+        if isinstance(item, dict):
+            return item.get(name, None)
+
+        return getattr(item, name, None)
+
+
+    # ----------------------------------------------------------------------
+    def _IterBufferColumns(column):
+        """Yields the columns (including the column itself) that are associated with a buffer"""
+
+        kind, index, value = column
+
+        if kind == "leaf":
+            yield column
+
+        elif kind == "list":
+            yield column
+
+            for child in _IterBufferColumns(value):
+                yield child
+
+        else:
+            if index is not None:
+                yield column
+
+            for _, child_column in value:
+                for child in _IterBufferColumns(child_column):
+                    yield child
+
+
+    # ----------------------------------------------------------------------
+    def _ToSimpleValues(column, values):
+        if column[0] == "leaf":
+            type_info = _SIMPLE_TYPE_INFOS.get(column[2], None)
+            if type_info is not None:
+                return [None if value is None else StringSerialization.SerializeItem(type_info, value) for value in values]
+
+        return values
+
+
+    # ----------------------------------------------------------------------
+    def _FromSimpleValues(column, values):
+        if column[0] == "leaf":
+            type_info = _SIMPLE_TYPE_INFOS.get(column[2], None)
+            if type_info is not None:
+                return [None if value is None else StringSerialization.DeserializeItem(type_info, value) for value in values]
+
+        return values
+
+
+    # ----------------------------------------------------------------------
+    def _ToArrowType(column):
+        kind, _, value = column
+
+        if kind == "leaf":
+            return _ARROW_TYPES[value]
+
+        if kind == "list":
+            return pyarrow.list_(_ToArrowType(value))
+
+        return pyarrow.struct([(name, _ToArrowType(child)) for name, child in value])
+
+
+    # ----------------------------------------------------------------------
+    def _ToArrowArray(column, buffers):
+        kind, index, value = column
+
+        if kind == "leaf":
+            values = buffers[index]
+
+            encoder = _ARROW_ENCODERS.get(value, None)
+            if encoder is not None:
+                values = [None if item is None else encoder(item) for item in values]
+
+            return pyarrow.array(values, type=_ARROW_TYPES[value])
+
+        if kind == "list":
+            return pyarrow.ListArray.from_arrays(
+                pyarrow.array(buffers[index], type=pyarrow.int32()),
+                _ToArrowArray(value, buffers),
+            )
+
+        return pyarrow.StructArray.from_arrays(
+            [_ToArrowArray(child, buffers) for _, child in value],
+            fields=list(_ToArrowType(column)),
+            mask=None if index is None else pyarrow.array([not item for item in buffers[index]], type=pyarrow.bool_()),
+        )
+
+
+    # ----------------------------------------------------------------------
+    def _FromArrowArray(column, array, buffers):
+        kind, index, value = column
+
+        if kind == "leaf":
+            values = array.to_pylist()
+
+            decoder = _ARROW_DECODERS.get(value, None)
+            if decoder is not None:
+                values = [None if item is None else decoder(item) for item in values]
+
+            buffers[index] = values
+
+        elif kind == "list":
+            buffers[index] = array.offsets.to_pylist()
+            _FromArrowArray(value, array.values, buffers)
+
+        else:
+            if index is not None:
+                buffers[index] = array.is_valid().to_pylist()
+
+            for child_index, (_, child) in enumerate(value):
+                _FromArrowArray(child, array.field(child_index), buffers)
+
+
+    # ----------------------------------------------------------------------
+    def _Assemble(column, buffers, start, end):
+        """Returns the values for rows [start, end)"""
+
+        kind, index, value = column
+
+        if kind == "leaf":
+            return buffers[index][start:end]
+
+        if kind == "list":
+            offsets = buffers[index]
+            items = _Assemble(value, buffers, offsets[start], offsets[end])
+
+            base = offsets[start]
+
+            return [items[offsets[row] - base:offsets[row + 1] - base] for row in six.moves.range(start, end)]
+
+        fields = [(name, _Assemble(child, buffers, start, end)) for name, child in value]
+        validity = None if index is None else buffers[index]
+
+        results = []
+
+        for row in six.moves.range(start, end):
+            if validity is not None and not validity[row]:
+                results.append(None)
+            else:
+                results.append(OrderedDict([(name, values[row - start]) for name, values in fields]))
+
+        return results
+
+
+    # ----------------------------------------------------------------------
+    def _IterArrowBatches(filename, columns):
+        with pyarrow.memory_map(filename) as source:
+            reader = pyarrow.ipc.open_file(source)
+
+            for batch_index in six.moves.range(reader.num_record_batches):
+                batch = reader.get_batch(batch_index)
+                buffers = {}
+
+                for name, column in columns:
+                    _FromArrowArray(column, batch.column(batch.schema.get_field_index(name)), buffers)
+
+                yield batch.num_rows, buffers
+
+
+    # ----------------------------------------------------------------------
+    def _IterSimpleBatches(filename, columns):
+        with open(filename, "rb") as f:
+            f.seek(-(len(_SIMPLE_FORMAT_MAGIC) + 8), os.SEEK_END)
+
+            footer_size = struct.unpack("<Q", f.read(8))[0]
+            if f.read() != _SIMPLE_FORMAT_MAGIC:
+                raise Exception("'{}' is not a valid simple column file".format(filename))
+
+            f.seek(-(len(_SIMPLE_FORMAT_MAGIC) + 8 + footer_size), os.SEEK_END)
+            footer = json.loads(f.read(footer_size).decode("utf-8"))
+
+            for batch in footer["batches"]:
+                buffers = {}
+
+                for name, column in columns:
+                    offset, size = batch["columns"][name]
+
+                    f.seek(offset)
+                    content = json.loads(f.read(size).decode("utf-8"))
+
+                    buffer_columns = list(_IterBufferColumns(column))
+                    assert len(buffer_columns) == len(content), (len(buffer_columns), len(content))
+
+                    for buffer_column, values in six.moves.zip(buffer_columns, content):
+                        buffers[buffer_column[1]] = _FromSimpleValues(buffer_column, values)
+
+                yield batch["num_rows"], buffers
+
+
+    # ----------------------------------------------------------------------
+    def _ReadColumns(filename, all_columns, names):
+        all_columns = OrderedDict(all_columns)
+
+        if names is None:
+            names = list(six.iterkeys(all_columns))
+        else:
+            for name in names:
+                if name not in all_columns:
+                    raise Exception("'{}' is not a valid column name".format(name))
+
+        columns = [(name, all_columns[name]) for name in names]
+
+        with open(filename, "rb") as f:
+            is_simple = f.read(len(_SIMPLE_FORMAT_MAGIC)) == _SIMPLE_FORMAT_MAGIC
+
+        if is_simple:
+            iter_batches_func = _IterSimpleBatches
+        elif pyarrow is None:
+            raise Exception("'pyarrow' must be installed to read Arrow IPC files")
+        else:
+            iter_batches_func = _IterArrowBatches
+
+        results = OrderedDict([(name, []) for name in names])
+
+        for num_rows, buffers in iter_batches_func(filename, columns):
+            for name, column in columns:
+                results[name] += _Assemble(column, buffers, 0, num_rows)
+
+        return results
+
+
+    ''',
+)
@@ -18,6 +18,8 @@
 import os
 import textwrap
 
+from collections import OrderedDict
+
 import CommonEnvironment
 from CommonEnvironment import Interface
 
@@ -43,6 +45,18 @@ class Plugin(PythonSerializationImpl):
     Name                                    = Interface.DerivedProperty("PythonJson")
     Description                             = Interface.DerivedProperty("Creates python code that is able to serialize and deserialize python objects to JSON")
 
+    # Backends are tried in order; the standard library is used if none of them are installed.
+    # Packages for backends that are selected explicitly must be installed when the code is
+    # generated; the generated code warns if they aren't installed when it is imported.
+    JSON_BACKENDS                           = OrderedDict(
+        [
+            ("json", []),
+            ("orjson", ["orjson"]),
+            ("ujson", ["ujson"]),
+            ("auto", ["orjson", "ujson"]),
+        ],
+    )
+
     # ----------------------------------------------------------------------
     # |  Methods
     @classmethod
@@ -50,6 +64,13 @@ class Plugin(PythonSerializationImpl):
     def GetAdditionalGeneratorItems(cls, context):
         return [_script_fullpath, PythonDestinationStatementWriter, PythonSourceStatementWriter] + super(Plugin, cls).GetAdditionalGeneratorItems(context)
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    @Interface.override
+    def GenerateCustomSettingsAndDefaults(cls):
+        yield from super(Plugin, cls).GenerateCustomSettingsAndDefaults()
+        yield "json_backend", "json"
+
     # ----------------------------------------------------------------------
     # |  Private Types
     @Interface.staticderived
@@ -68,9 +89,9 @@ class Plugin(PythonSerializationImpl):
                 if isinstance({var_name}, six.string_types):
                     if FileSystem.IsFilename({var_name}):
                         with open({var_name}) as f:
-                            {var_name} = json.load(f)
+                            {var_name} = _JsonLoads(f.read())
                     else:
-                        {var_name} = json.loads({var_name})
+                        {var_name} = _JsonLoads({var_name})
                 """,
             ).format(
                 var_name=var_name,
@@ -87,6 +108,15 @@ class Plugin(PythonSerializationImpl):
 
             return content
 
+        # ----------------------------------------------------------------------
+        @staticmethod
+        @Interface.override
+        def IterItems(var_name, element):
+            return '_IterJsonItems({var_name}, "{name}")'.format(
+                var_name=var_name,
+                name=element.Name,
+            )
+
     # ----------------------------------------------------------------------
     @Interface.staticderived
     class DestinationStatementWriter(PythonDestinationStatementWriter):
@@ -118,7 +148,7 @@ class Plugin(PythonSerializationImpl):
                         return "\\n".join([line.rstrip() for line in content.split("\\n")])
 
                     else:
-                        return json.dumps(obj, cls=JsonEncoder)
+                        return _JsonDumps(obj)
 
                 """,
             )
@@ -138,34 +168,224 @@ class Plugin(PythonSerializationImpl):
     # |  Private Methods
     @staticmethod
     @Interface.override
-    def _WriteFileHeader(output_stream):
+    def _WriteFileHeader(output_stream, json_backend="json"):
+        if json_backend not in Plugin.JSON_BACKENDS:
+            raise Exception("'{}' is not a valid 'json_backend' value; valid values are {}".format(json_backend, ", ".join(["'{}'".format(backend) for backend in Plugin.JSON_BACKENDS])))
+
+        if json_backend != "auto":
+            for package_name in Plugin.JSON_BACKENDS[json_backend]:
+                Plugin._ValidatePackage(package_name, "The '{}' json_backend".format(json_backend))
+
         output_stream.write(
             textwrap.dedent(
-                """\
+                '''\
                 import json
+                import re
+                import warnings
 
                 from CommonEnvironment import FileSystem
                 from CommonEnvironment.TypeInfo.FundamentalTypes.Serialization.JsonSerialization import JsonSerialization
 
+                # ----------------------------------------------------------------------
+                def _JsonDefault(o):
+                    if isinstance(o, Object):
+                        return {k: v for k, v in six.iteritems(o.__dict__) if not k.startswith("_")}
+
+                    return getattr(o, "__dict__", o)
+
+
                 # ----------------------------------------------------------------------
                 class JsonEncoder(json.JSONEncoder):
                     def default(self, o):
-                        if isinstance(o, Object):
-                            d = copy.deepcopy(o.__dict__)
+                        return _JsonDefault(o)
 
-                            for k in list(six.iterkeys(d)):
-                                if k.startswith("_"):
-                                    del d[k]
 
-                            return d
+                # ----------------------------------------------------------------------
+                def _CreateJsonBackend(backend_names, warn_on_fallback):
+                    """\\
+                    Returns the name, dumps, and loads functions for the first installed backend; the
+                    standard library is used if none of the backends are installed.
+                    """
 
-                        return getattr(o, "__dict__", o)
+                    for backend_name in backend_names:
+                        try:
+                            if backend_name == "orjson":
+                                import orjson
 
+                                return (
+                                    backend_name,
+                                    lambda obj: orjson.dumps(obj, default=_JsonDefault, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"),
+                                    orjson.loads,
+                                )
 
-                """,
+                            if backend_name == "ujson":
+                                import ujson
+
+                                return (
+                                    backend_name,
+                                    lambda obj: ujson.dumps(obj, default=_JsonDefault, escape_forward_slashes=False),
+                                    ujson.loads,
+                                )
+
+                        except ImportError:
+                            continue
+
+                        assert False, backend_name
+
+                    if warn_on_fallback:
+                        warnings.warn(
+                            "The JSON backend {} is not installed; the standard library will be used instead".format(
+                                ", ".join(["'{}'".format(backend_name) for backend_name in backend_names]),
+                            ),
+                        )
+
+                    return "json", lambda obj: json.dumps(obj, cls=JsonEncoder), json.loads
+
+
+                # ----------------------------------------------------------------------
+                class _JsonStreamReader(object):
+                    """Reads the items in a JSON list without reading all of the content into memory"""
+
+                    _whitespace_regex = re.compile(r"[ \\t\\n\\r]*")
+                    _number_regex = re.compile(r"[0-9.eE+\\-]*")
+
+                    # ----------------------------------------------------------------------
+                    def __init__(self, f, read_size=65536):
+                        self._f = f
+                        self._read_size = read_size
+                        self._decoder = json.JSONDecoder()
+                        self._content = ""
+                        self._offset = 0
+                        self._is_eof = False
+
+                    # ----------------------------------------------------------------------
+                    def IterItems(self, name):
+                        """Yields the items in a top-level list or in the list associated with 'name' in a top-level object"""
+
+                        if self._Peek() == "{":
+                            self._offset += 1
+
+                            while True:
+                                if self._Peek() == "}":
+                                    return
+
+                                key = self._Decode()
+                                self._Consume(":")
+
+                                if key == name:
+                                    break
+
+                                # Skip the value
+                                self._Decode()
+
+                                if self._Peek() == ",":
+                                    self._offset += 1
+
+                        self._Consume("[")
+
+                        if self._Peek() == "]":
+                            return
+
+                        while True:
+                            yield self._Decode()
+
+                            if self._Peek() == "]":
+                                return
+
+                            self._Consume(",")
+
+                    # ----------------------------------------------------------------------
+                    def _Peek(self):
+                        """Returns the next non-whitespace character"""
+
+                        while True:
+                            self._offset = self._whitespace_regex.match(self._content, self._offset).end()
+
+                            if self._offset < len(self._content):
+                                return self._content[self._offset]
+
+                            if not self._Read():
+                                raise Exception("Unexpected end of JSON content")
+
+                    # ----------------------------------------------------------------------
+                    def _Consume(self, expected):
+                        if self._Peek() != expected:
+                            raise Exception("'{}' was expected".format(expected))
+
+                        self._offset += 1
+
+                    # ----------------------------------------------------------------------
+                    def _Decode(self):
+                        self._Peek()
+
+                        # The value is decoded from its beginning each time that content is read, so
+                        # the amount read doubles each time to keep the total work linear in the size
+                        # of the value.
+                        read_size = self._read_size
+
+                        while True:
+                            try:
+                                value, offset = self._decoder.raw_decode(self._content, self._offset)
+
+                                # A number that ends with the content read so far may be incomplete
+                                if self._number_regex.match(self._content, offset).end() < len(self._content) or self._is_eof:
+                                    self._offset = offset
+                                    return value
+
+                            except ValueError:
+                                if self._is_eof:
+                                    raise
+
+                            self._Read(read_size)
+                            read_size *= 2
+
+                    # ----------------------------------------------------------------------
+                    def _Read(self, read_size=None):
+                        if not self._is_eof:
+                            content = self._f.read(read_size or self._read_size)
+
+                            if content:
+                                self._content = self._content[self._offset:] + content
+                                self._offset = 0
+
+                                return True
+
+                            self._is_eof = True
+
+                        return False
+
+
+                # ----------------------------------------------------------------------
+                def _IterJsonItems(f_or_filename_or_content, name):
+                    if isinstance(f_or_filename_or_content, six.string_types):
+                        if FileSystem.IsFilename(f_or_filename_or_content):
+                            with open(f_or_filename_or_content) as f:
+                                for item in _JsonStreamReader(f).IterItems(name):
+                                    yield item
+
+                            return
+
+                        f_or_filename_or_content = six.moves.StringIO(f_or_filename_or_content)
+
+                    for item in _JsonStreamReader(f_or_filename_or_content).IterItems(name):
+                        yield item
+
+
+                ''',
             ),
         )
 
+        output_stream.write(
+            textwrap.dedent(
+                """\
+                # ----------------------------------------------------------------------
+                _json_backend_name, _JsonDumps, _JsonLoads = _CreateJsonBackend({}, {})
+
+
+                """,
+            ).format(Plugin.JSON_BACKENDS[json_backend], json_backend not in ["json", "auto"]),
+        )
+
     # ----------------------------------------------------------------------
     @staticmethod
     @Interface.override
@@ -0,0 +1,250 @@
+# ----------------------------------------------------------------------
+# |
+# |  PythonMsgpackPlugin.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-05-02 11:26:40
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Plugin object"""
+
+import os
+
+import CommonEnvironment
+from CommonEnvironment import Interface
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from .Impl.PythonSerializationImpl import PythonSerializationImpl
+    from .Impl.Templates import Dedent
+
+    from .Impl.StatementWriters.PythonDestinationStatementWriter import PythonDestinationStatementWriter
+    from .Impl.StatementWriters.PythonSourceStatementWriter import PythonSourceStatementWriter
+
+# ----------------------------------------------------------------------
+@Interface.staticderived
+@Interface.clsinit
+class Plugin(PythonSerializationImpl):
+    # ----------------------------------------------------------------------
+    # |  Properties
+    Name                                    = Interface.DerivedProperty("PythonMsgpack")
+    Description                             = Interface.DerivedProperty("Creates python code that is able to serialize and deserialize python objects to MessagePack")
+
+    # ----------------------------------------------------------------------
+    # |  Methods
+    @classmethod
+    @Interface.override
+    def GetAdditionalGeneratorItems(cls, context):
+        return [_script_fullpath, PythonDestinationStatementWriter, PythonSourceStatementWriter] + super(Plugin, cls).GetAdditionalGeneratorItems(context)
+
+    # ----------------------------------------------------------------------
+    # |  Private Types
+    @Interface.staticderived
+    class SourceStatementWriter(PythonSourceStatementWriter):
+        # ----------------------------------------------------------------------
+        # |  Public Properties
+        ObjectTypeDesc                      = Interface.DerivedProperty("a MessagePack object")
+
+        # ----------------------------------------------------------------------
+        # |  Methods
+        @classmethod
+        @Interface.override
+        def ConvenienceConversions(cls, var_name, element_or_none):
+            content = Dedent(
+                """\
+                if isinstance({var_name}, (bytes, bytearray)):
+                    {var_name} = _MsgpackLoads({var_name})
+                elif isinstance({var_name}, six.string_types) and FileSystem.IsFilename({var_name}):
+                    with open({var_name}, "rb") as f:
+                        {var_name} = _MsgpackLoads(f.read())
+                """,
+            ).format(
+                var_name=var_name,
+            )
+
+            if element_or_none is not None:
+                content += Dedent(
+                    """\
+
+                    {}
+
+                    """,
+                ).format(super(Plugin.SourceStatementWriter, cls).ConvenienceConversions(var_name, element_or_none))
+
+            return content
+
+        # ----------------------------------------------------------------------
+        @staticmethod
+        @Interface.override
+        def IterItems(var_name, element):
+            return '_IterMsgpackItems({var_name}, "{name}")'.format(
+                var_name=var_name,
+                name=element.Name,
+            )
+
+    # ----------------------------------------------------------------------
+    @Interface.staticderived
+    class DestinationStatementWriter(PythonDestinationStatementWriter):
+        # ----------------------------------------------------------------------
+        # |  Public Properties
+        ObjectTypeDesc                      = Interface.DerivedProperty("a MessagePack object")
+
+        # ----------------------------------------------------------------------
+        # |  Methods
+        @staticmethod
+        @Interface.override
+        def SerializeToString(var_name):
+            return "_MsgpackDumps({var_name})".format(
+                var_name=var_name,
+            )
+
+    # ----------------------------------------------------------------------
+    # |  Private Properties
+    _SupportAttributes                      = Interface.DerivedProperty(False)
+    _SupportAnyElements                     = Interface.DerivedProperty(True)
+    _SupportDictionaryElements              = Interface.DerivedProperty(True)
+
+    _TypeInfoSerializationName              = Interface.DerivedProperty("MsgpackSerialization")
+
+    _SourceStatementWriter                  = Interface.DerivedProperty(SourceStatementWriter)
+    _DestinationStatementWriter             = Interface.DerivedProperty(DestinationStatementWriter)
+
+    # ----------------------------------------------------------------------
+    # |  Private Methods
+    @staticmethod
+    @Interface.override
+    def _WriteFileHeader(output_stream):
+        Plugin._ValidatePackage("msgpack", "The 'PythonMsgpack' plugin")
+
+        output_stream.write(
+            Dedent(
+                '''\
+                import msgpack
+
+                from CommonEnvironment import FileSystem
+
+                from CommonSimpleSchemaGenerator.TypeInfo.FundamentalTypes.Serialization.MsgpackSerialization import MsgpackSerialization
+
+                # ----------------------------------------------------------------------
+                _MSGPACK_UNPACK_KWARGS = {
+                    "ext_hook": MsgpackSerialization.FromExtType,
+                    "raw": False,
+                    "strict_map_key": False,
+                    "timestamp": 3,
+                }
+
+
+                # ----------------------------------------------------------------------
+                def _MsgpackDefault(o):
+                    if isinstance(o, Object):
+                        return {k: v for k, v in six.iteritems(o.__dict__) if not k.startswith("_")}
+
+                    result = MsgpackSerialization.ToExtType(o)
+                    if result is not None:
+                        return result
+
+                    return getattr(o, "__dict__", o)
+
+
+                # ----------------------------------------------------------------------
+                def _MsgpackDumps(obj):
+                    return msgpack.packb(obj, default=_MsgpackDefault, use_bin_type=True)
+
+
+                # ----------------------------------------------------------------------
+                def _MsgpackLoads(content):
+                    return msgpack.unpackb(content, **_MSGPACK_UNPACK_KWARGS)
+
+
+                # ----------------------------------------------------------------------
+                class _MsgpackStreamReader(object):
+                    """Reads the items in a MessagePack array without reading all of the content into memory"""
+
+                    # ----------------------------------------------------------------------
+                    def __init__(self, f, read_size=65536):
+                        self._f = f
+                        self._read_size = read_size
+                        self._unpacker = msgpack.Unpacker(**_MSGPACK_UNPACK_KWARGS)
+                        self._first_byte = None
+
+                    # ----------------------------------------------------------------------
+                    def IterItems(self, name):
+                        """Yields the items in a top-level array or in the array associated with 'name' in a top-level map"""
+
+                        self._Read()
+
+                        # fixmap, map 16, or map 32
+                        if self._first_byte & 0xF0 == 0x80 or self._first_byte in (0xDE, 0xDF):
+                            for _ in range(self._Invoke(self._unpacker.read_map_header)):
+                                key = self._Invoke(self._unpacker.unpack)
+
+                                if key == name:
+                                    break
+
+                                # Skip the value
+                                self._Invoke(self._unpacker.skip)
+
+                            else:
+                                return
+
+                        for _ in range(self._Invoke(self._unpacker.read_array_header)):
+                            yield self._Invoke(self._unpacker.unpack)
+
+                    # ----------------------------------------------------------------------
+                    def _Invoke(self, func):
+                        while True:
+                            try:
+                                return func()
+                            except msgpack.OutOfData:
+                                self._Read()
+
+                    # ----------------------------------------------------------------------
+                    def _Read(self):
+                        content = self._f.read(self._read_size)
+                        if not content:
+                            raise Exception("Unexpected end of MessagePack content")
+
+                        if self._first_byte is None:
+                            self._first_byte = bytearray(content[:1])[0]
+
+                        self._unpacker.feed(content)
+
+
+                # ----------------------------------------------------------------------
+                def _IterMsgpackItems(f_or_filename_or_content, name):
+                    if isinstance(f_or_filename_or_content, (bytes, bytearray)):
+                        f_or_filename_or_content = six.BytesIO(f_or_filename_or_content)
+                    elif isinstance(f_or_filename_or_content, six.string_types):
+                        with open(f_or_filename_or_content, "rb") as f:
+                            for item in _MsgpackStreamReader(f).IterItems(name):
+                                yield item
+
+                        return
+
+                    for item in _MsgpackStreamReader(f_or_filename_or_content).IterItems(name):
+                        yield item
+
+
+                ''',
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @Interface.override
+    def _WriteFileFooter(output_stream):
+        # Nothing to do here
+        pass
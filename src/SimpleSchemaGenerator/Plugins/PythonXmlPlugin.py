@@ -97,6 +97,15 @@ class Plugin(PythonSerializationImpl):
 
             return content
 
+        # ----------------------------------------------------------------------
+        @staticmethod
+        @Interface.override
+        def IterItems(var_name, element):
+            return '_IterXmlItems({var_name}, "{name}")'.format(
+                var_name=var_name,
+                name=element.Name,
+            )
+
         # ----------------------------------------------------------------------
         @classmethod
         @Interface.override
@@ -507,5 +516,50 @@ class Plugin(PythonSerializationImpl):
     @staticmethod
     @Interface.override
     def _WriteFileFooter(output_stream):
-        # Nothing to do here
-        pass
+        output_stream.write(
+            textwrap.dedent(
+                """\
+
+
+                # ----------------------------------------------------------------------
+                def _IterXmlItems(f_or_filename_or_content, name):
+                    # Yields the items of the collection element 'name' as they are parsed. The
+                    # collection element is either the document element or a child of the document
+                    # element. Elements are removed from their parents once they have been
+                    # processed so that the document isn't built in memory.
+                    if isinstance(f_or_filename_or_content, six.string_types) and not FileSystem.IsFilename(f_or_filename_or_content):
+                        f_or_filename_or_content = six.moves.StringIO(f_or_filename_or_content)
+
+                    elements = []
+                    items_depth = None
+
+                    for event, element in ET.iterparse(f_or_filename_or_content, events=("start", "end")):
+                        if event == "start":
+                            elements.append(element)
+
+                            if items_depth is None:
+                                if len(elements) == 1 and element.tag == name:
+                                    items_depth = 2
+                                elif len(elements) == 2 and element.tag == name:
+                                    items_depth = 3
+
+                            continue
+
+                        depth = len(elements)
+                        elements.pop()
+
+                        if items_depth is not None:
+                            if depth == items_depth - 1:
+                                # The collection is complete
+                                return
+
+                            if depth == items_depth and (items_depth == 2 or element.tag == "{collection_item_name}"):
+                                yield element
+
+                        if depth == 2 or depth == items_depth:
+                            elements[-1].remove(element)
+                """,
+            ).format(
+                collection_item_name=Plugin.COLLECTION_ITEM_NAME,
+            ),
+        )
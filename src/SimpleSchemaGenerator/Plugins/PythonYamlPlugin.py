@@ -16,7 +16,8 @@
 """Contains the Plugin object"""
 
 import os
-import textwrap
+
+from collections import OrderedDict
 
 import CommonEnvironment
 from CommonEnvironment import Interface
@@ -30,6 +31,7 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 
 with InitRelativeImports():
     from .Impl.PythonSerializationImpl import PythonSerializationImpl
+    from .Impl.Templates import Dedent
 
     from .Impl.StatementWriters.PythonDestinationStatementWriter import PythonDestinationStatementWriter
     from .Impl.StatementWriters.PythonSourceStatementWriter import PythonSourceStatementWriter
@@ -43,6 +45,16 @@ class Plugin(PythonSerializationImpl):
     Name                                    = Interface.DerivedProperty("PythonYaml")
     Description                             = Interface.DerivedProperty("Creates python code that is able to serialize and deserialize python objects to YAML")
 
+    # Backends and the module imported by each. rtyaml uses the LibYAML bindings when they
+    # are available, so 'libyaml' doesn't improve throughput (see YamlBackendSuite in
+    # PythonSerializationImpl_PerformanceTest.py); it removes the dependency on rtyaml.
+    YAML_BACKENDS                           = OrderedDict(
+        [
+            ("rtyaml", "rtyaml"),
+            ("libyaml", "yaml"),
+        ],
+    )
+
     # ----------------------------------------------------------------------
     # |  Methods
     @classmethod
@@ -50,6 +62,13 @@ class Plugin(PythonSerializationImpl):
     def GetAdditionalGeneratorItems(cls, context):
         return [_script_fullpath, PythonDestinationStatementWriter, PythonSourceStatementWriter] + super(Plugin, cls).GetAdditionalGeneratorItems(context)
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    @Interface.override
+    def GenerateCustomSettingsAndDefaults(cls):
+        yield from super(Plugin, cls).GenerateCustomSettingsAndDefaults()
+        yield "yaml_backend", "rtyaml"
+
     # ----------------------------------------------------------------------
     # |  Private Types
     @Interface.staticderived
@@ -63,21 +82,21 @@ class Plugin(PythonSerializationImpl):
         @classmethod
         @Interface.override
         def ConvenienceConversions(cls, var_name, element_or_none):
-            content = textwrap.dedent(
+            content = Dedent(
                 """\
                 if isinstance({var_name}, six.string_types):
                     if FileSystem.IsFilename({var_name}):
                         with open({var_name}) as f:
-                            {var_name} = rtyaml.load(f)
+                            {var_name} = _YamlLoad(f)
                     else:
-                        {var_name} = rtyaml.load({var_name})
+                        {var_name} = _YamlLoad({var_name})
                 """,
             ).format(
                 var_name=var_name,
             )
 
             if element_or_none is not None:
-                content += textwrap.dedent(
+                content += Dedent(
                     """\
 
                     {}
@@ -99,7 +118,7 @@ class Plugin(PythonSerializationImpl):
         @staticmethod
         @Interface.override
         def SerializeToString(var_name):
-            return "rtyaml.dump({var_name})".format(
+            return "_YamlDump({var_name})".format(
                 var_name=var_name,
             )
 
@@ -118,41 +137,133 @@ class Plugin(PythonSerializationImpl):
     # |  Private Methods
     @staticmethod
     @Interface.override
-    def _WriteFileHeader(output_stream):
+    def _WriteFileHeader(output_stream, yaml_backend="rtyaml"):
+        if yaml_backend not in Plugin.YAML_BACKENDS:
+            raise Exception("'{}' is not a valid 'yaml_backend' value; valid values are {}".format(yaml_backend, ", ".join(["'{}'".format(backend) for backend in Plugin.YAML_BACKENDS])))
+
         output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
-                import rtyaml
+                import {}
 
                 from CommonEnvironment.CallOnExit import CallOnExit
                 from CommonEnvironment import FileSystem
                 from CommonEnvironment.TypeInfo.FundamentalTypes.Serialization.YamlSerialization import YamlSerialization
 
-
                 """,
-            ),
+            ).format(Plugin.YAML_BACKENDS[yaml_backend]),
         )
 
+        if yaml_backend == "rtyaml":
+            output_stream.write(
+                Dedent(
+                    """\
+                    # ----------------------------------------------------------------------
+                    _yaml_backend_name = "rtyaml"
+
+                    _YamlLoad = rtyaml.load
+                    _YamlDump = rtyaml.dump
+                    _YamlDumper = rtyaml.Dumper
+
+
+                    # ----------------------------------------------------------------------
+                    def _ObjectToYaml(dumper, data):
+                        d = dict(data.__dict__)
+                        for k in list(six.iterkeys(d)):
+                            if k.startswith("_"):
+                                del d[k]
+
+                        return dumper.represent_dict(d)
+
+
+                    """,
+                ),
+            )
+
+        elif yaml_backend == "libyaml":
+            output_stream.write(
+                Dedent(
+                    '''\
+                    import collections
+                    import datetime
+
+                    from CommonEnvironment.TypeInfo.FundamentalTypes.DurationTypeInfo import DurationTypeInfo
+                    from CommonEnvironment.TypeInfo.FundamentalTypes.Serialization.StringSerialization import StringSerialization
+                    from CommonEnvironment.TypeInfo.FundamentalTypes.TimeTypeInfo import TimeTypeInfo
+
+                    # ----------------------------------------------------------------------
+                    # Use the LibYAML bindings when they are available
+                    try:
+                        from yaml import CSafeLoader as _YamlLoaderBase, CSafeDumper as _YamlDumperBase
+
+                        _yaml_backend_name = "libyaml"
+
+                    except ImportError:
+                        from yaml import SafeLoader as _YamlLoaderBase, SafeDumper as _YamlDumperBase
+
+                        _yaml_backend_name = "yaml"
+
+
+                    # ----------------------------------------------------------------------
+                    class _YamlLoader(_YamlLoaderBase):
+                        """Isolates this module's customizations from the PyYAML loaders"""
+                        pass
+
+
+                    # ----------------------------------------------------------------------
+                    class _YamlDumper(_YamlDumperBase):
+                        """Isolates this module's customizations from the PyYAML dumpers"""
+                        pass
+
+
+                    # ----------------------------------------------------------------------
+                    def _YamlLoad(stream):
+                        return yaml.load(stream, Loader=_YamlLoader)
+
+
+                    # ----------------------------------------------------------------------
+                    def _YamlDump(obj):
+                        # Keys are written in the order in which they were added
+                        return yaml.dump(obj, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+
+                    # ----------------------------------------------------------------------
+                    def _ObjectToYaml(dumper, data):
+                        return dumper.represent_mapping(
+                            "tag:yaml.org,2002:map",
+                            [(k, v) for k, v in six.iteritems(data.__dict__) if not k.startswith("_")],
+                        )
+
+
+                    # ----------------------------------------------------------------------
+                    def _CreateStringRepresenter(type_info):
+                        # The safe dumpers aren't able to represent these types natively
+                        return lambda dumper, data: dumper.represent_str(StringSerialization.SerializeItem(type_info, data))
+
+
+                    _YamlDumper.add_representer(collections.OrderedDict, _YamlDumperBase.represent_dict)
+                    _YamlDumper.add_representer(datetime.timedelta, _CreateStringRepresenter(DurationTypeInfo()))
+                    _YamlDumper.add_representer(datetime.time, _CreateStringRepresenter(TimeTypeInfo()))
+
+
+                    ''',
+                ),
+            )
+
+        else:
+            assert False, yaml_backend
+
     # ----------------------------------------------------------------------
     @staticmethod
     @Interface.override
     def _WriteFileFooter(output_stream):
         output_stream.write(
-            textwrap.dedent(
+            Dedent(
                 """\
 
 
                 # ----------------------------------------------------------------------
-                def _ObjectToYaml(dumper, data):
-                    d = dict(data.__dict__)
-                    for k in list(six.iterkeys(d)):
-                        if k.startswith("_"):
-                            del d[k]
-
-                    return dumper.represent_dict(d)
-
-
-                rtyaml.Dumper.add_representer(Object, _ObjectToYaml)
+                _YamlDumper.add_multi_representer(Object, _ObjectToYaml)
                 """,
             ),
         )
@@ -227,6 +227,9 @@ class SimpleSchemaLexer(Lexer):
 
 
 
+    # Default value; actions and predicates access this value via `self` so that each
+    # lexer instance tracks its own state (a class-level counter is shared across lexers
+    # running concurrently or sequentially in the same process).
     multiline_statement_ctr = 0
 
     def nextToken(self):
@@ -262,32 +265,32 @@ class SimpleSchemaLexer(Lexer):
 
     def LPAREN_action(self, localctx:RuleContext , actionIndex:int):
         if actionIndex == 0:
-             SimpleSchemaLexer.multiline_statement_ctr += 1 
+             self.multiline_statement_ctr += 1 
      
 
     def RPAREN_action(self, localctx:RuleContext , actionIndex:int):
         if actionIndex == 1:
-             SimpleSchemaLexer.multiline_statement_ctr -= 1 
+             self.multiline_statement_ctr -= 1 
      
 
     def LBRACK_action(self, localctx:RuleContext , actionIndex:int):
         if actionIndex == 2:
-             SimpleSchemaLexer.multiline_statement_ctr += 1 
+             self.multiline_statement_ctr += 1 
      
 
     def RBRACK_action(self, localctx:RuleContext , actionIndex:int):
         if actionIndex == 3:
-             SimpleSchemaLexer.multiline_statement_ctr -= 1 
+             self.multiline_statement_ctr -= 1 
      
 
     def LT_action(self, localctx:RuleContext , actionIndex:int):
         if actionIndex == 4:
-             SimpleSchemaLexer.multiline_statement_ctr += 1 
+             self.multiline_statement_ctr += 1 
      
 
     def GT_action(self, localctx:RuleContext , actionIndex:int):
         if actionIndex == 5:
-             SimpleSchemaLexer.multiline_statement_ctr -= 1 
+             self.multiline_statement_ctr -= 1 
      
 
     def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
@@ -304,12 +307,12 @@ class SimpleSchemaLexer(Lexer):
 
     def MULTI_LINE_NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
             if predIndex == 0:
-                return  SimpleSchemaLexer.multiline_statement_ctr != 0 
+                return  self.multiline_statement_ctr != 0 
          
 
     def NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
             if predIndex == 1:
-                return  SimpleSchemaLexer.multiline_statement_ctr == 0 
+                return  self.multiline_statement_ctr == 0 
          
 
 
@@ -4,6 +4,9 @@ tokens { INDENT, DEDENT }
 
 @lexer::members {
 
+# Default value; actions and predicates access this value via `self` so that each
+# lexer instance tracks its own state (a class-level counter is shared across lexers
+# running concurrently or sequentially in the same process).
 multiline_statement_ctr = 0
 
 def nextToken(self):
@@ -26,17 +29,17 @@ def nextToken(self):
 // |  Lexer Rules
 // |
 // ---------------------------------------------------------------------------
-MULTI_LINE_NEWLINE:                         '\r'? '\n' { SimpleSchemaLexer.multiline_statement_ctr != 0 }? -> skip;
-NEWLINE:                                    '\r'? '\n' { SimpleSchemaLexer.multiline_statement_ctr == 0 }? [ \t]*;
+MULTI_LINE_NEWLINE:                         '\r'? '\n' { self.multiline_statement_ctr != 0 }? -> skip;
+NEWLINE:                                    '\r'? '\n' { self.multiline_statement_ctr == 0 }? [ \t]*;
 MULTI_LINE_ESCAPE:                          '\\' '\r'? '\n' -> skip;
 HORIZONTAL_WHITESPACE:                      [ \t]+ -> skip;
 
-LPAREN:                                     '(' { SimpleSchemaLexer.multiline_statement_ctr += 1 };
-RPAREN:                                     ')' { SimpleSchemaLexer.multiline_statement_ctr -= 1 };
-LBRACK:                                     '[' { SimpleSchemaLexer.multiline_statement_ctr += 1 };
-RBRACK:                                     ']' { SimpleSchemaLexer.multiline_statement_ctr -= 1 };
-LT:                                         '<' { SimpleSchemaLexer.multiline_statement_ctr += 1 };
-GT:                                         '>' { SimpleSchemaLexer.multiline_statement_ctr -= 1 };
+LPAREN:                                     '(' { self.multiline_statement_ctr += 1 };
+RPAREN:                                     ')' { self.multiline_statement_ctr -= 1 };
+LBRACK:                                     '[' { self.multiline_statement_ctr += 1 };
+RBRACK:                                     ']' { self.multiline_statement_ctr -= 1 };
+LT:                                         '<' { self.multiline_statement_ctr += 1 };
+GT:                                         '>' { self.multiline_statement_ctr -= 1 };
 LBRACE:                                     '{';
 RBRACE:                                     '}';
 
@@ -0,0 +1,164 @@
+# ----------------------------------------------------------------------
+# |
+# |  Fingerprint.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-24 13:07:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the CalculateFingerprint method"""
+
+import hashlib
+import inspect
+import os
+
+from collections import OrderedDict
+from enum import Enum
+
+import six
+
+import CommonEnvironment
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+def CalculateFingerprint(elements):
+    """\
+    Returns a hash value that is based on the data within the elements (and everything
+    that they reference) rather than the identity of the objects themselves; the same
+    schema produces the same fingerprint across invocations.
+
+    The same state captured by pickling is included in the fingerprint. Objects are
+    visited in breadth-first order and are assigned an index when first encountered;
+    references to an object are written in terms of its index, which allows for cycles
+    within the element graph.
+
+    Attributes that cache calculated values (for example, `Element._cached_dotted_name`)
+    are not included, as their values depend upon which properties have been accessed.
+    """
+
+    hasher = hashlib.sha256()
+
+    indexes = {}
+    queue = []
+
+    # ----------------------------------------------------------------------
+    def Update(value):
+        hasher.update(value.encode("utf-8"))
+        hasher.update(b"\0")
+
+    # ----------------------------------------------------------------------
+    def Encode(value):
+        if value is None or isinstance(value, (bool, float, complex) + six.integer_types + six.string_types + (six.binary_type,)):
+            return "{}:{!r}".format(type(value).__name__, value)
+
+        if isinstance(value, Enum):
+            return "{}:{}".format(_GetTypeName(value), value.name)
+
+        if isinstance(value, (list, tuple)):
+            return "{}[{}]".format(type(value).__name__, ",".join(Encode(item) for item in value))
+
+        if isinstance(value, (set, frozenset)):
+            # Set iteration order isn't stable across processes
+            return "{}[{}]".format(type(value).__name__, ",".join(sorted(Encode(item) for item in value)))
+
+        if isinstance(value, dict):
+            items = ["{}={}".format(Encode(k), Encode(v)) for k, v in six.iteritems(value)]
+
+            if not isinstance(value, OrderedDict):
+                items.sort()
+
+            return "{}{{{}}}".format(type(value).__name__, ",".join(items))
+
+        if inspect.isclass(value) or inspect.isroutine(value) or inspect.ismodule(value):
+            return "symbol:{}.{}".format(
+                getattr(value, "__module__", ""),
+                getattr(value, "__qualname__", getattr(value, "__name__", "")),
+            )
+
+        index = indexes.get(id(value), None)
+        if index is None:
+            if _GetState(value) is None:
+                # The default repr includes the object's address, which is different
+                # in each invocation.
+                if type(value).__repr__ is object.__repr__:
+                    return _GetTypeName(value)
+
+                return "{}:{!r}".format(_GetTypeName(value), value)
+
+            index = len(queue)
+
+            indexes[id(value)] = index
+            queue.append(value)
+
+        return "@{}".format(index)
+
+    # ----------------------------------------------------------------------
+
+    Update(Encode(list(elements)))
+
+    index = 0
+
+    while index < len(queue):
+        value = queue[index]
+
+        Update("#{} {}".format(index, _GetTypeName(value)))
+
+        for k, v in _GetState(value):
+            if k.startswith("_cached_"):
+                continue
+
+            Update(k)
+            Update(Encode(v))
+
+        index += 1
+
+    return hasher.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _GetTypeName(value):
+    value_type = type(value)
+    return "{}.{}".format(value_type.__module__, getattr(value_type, "__qualname__", value_type.__name__))
+
+
+# ----------------------------------------------------------------------
+def _GetState(value):
+    """Returns a list of (name, value) attributes or None if the object doesn't have any"""
+
+    state = None
+
+    value_dict = getattr(value, "__dict__", None)
+    if value_dict is not None:
+        state = list(six.iteritems(value_dict))
+
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get("__slots__", None)
+        if slots is None:
+            continue
+
+        if isinstance(slots, six.string_types):
+            slots = [slots]
+
+        for slot in slots:
+            if slot in ["__dict__", "__weakref__"] or not hasattr(value, slot):
+                continue
+
+            if state is None:
+                state = []
+
+            state.append((slot, getattr(value, slot)))
+
+    return state
@@ -176,6 +176,7 @@ class Item(object):
         self.element_type                   = None
 
         self._cached_key                    = None
+        self._cached_items_index            = None
 
     # ----------------------------------------------------------------------
     @property
@@ -196,6 +197,28 @@ class Item(object):
 
         return self._cached_key
 
+    # ----------------------------------------------------------------------
+    @property
+    def ItemsIndex(self):
+        """\
+        Child items organized by name; used when resolving references.
+
+            { "<name>" : [ <item>, ... ], ... }
+
+        The index is created at the end of Populate (or upon first access), and
+        doesn't reflect changes made to items after that point.
+        """
+
+        if self._cached_items_index is None:
+            index = {}
+
+            for item in self.items:
+                index.setdefault(item.name, []).append(item)
+
+            self._cached_items_index = index
+
+        return self._cached_items_index
+
     # ----------------------------------------------------------------------
     def __repr__(self):
         return CommonEnvironment.ObjectReprImpl(self)
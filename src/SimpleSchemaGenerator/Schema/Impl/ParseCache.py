@@ -0,0 +1,336 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseCache.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-14 09:12:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ParseCache and MemoryParseCache objects"""
+
+import hashlib
+import inspect
+import os
+import sys
+import tempfile
+import threading
+
+from collections import OrderedDict
+
+import six
+from six.moves import cPickle as pickle
+
+import CommonEnvironment
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from .PicklePath import PicklePathContext
+
+# The code used by a process doesn't change while it is running, so the hashes of the
+# source files are only calculated once.
+_schema_source_hash                         = None
+_plugin_source_hashes                       = {}    # { <plugin class> : "<hash>", ... }
+
+
+# ----------------------------------------------------------------------
+class ParseCache(object):
+    """\
+    Persists the elements produced by the parsing process to a directory, so that
+    subsequent invocations with the same input can skip parsing entirely.
+
+    Cache entries are keyed by the content of the source files, the plugin name and
+    flags, the filter options, and the source code of the plugin and Schema package
+    (which defines the parsing process and the metadata items supported by the plugin).
+    Each entry also stores the content hash of all of the files transitively included
+    by the sources; the entry is ignored when any of those files have changed.
+    """
+
+    # Increment this value when changes are made to the parsing process that
+    # invalidate previously cached content.
+    VERSION                                 = 1
+
+    # ----------------------------------------------------------------------
+    def __init__(self, cache_dir):
+        self.CacheDir                       = cache_dir
+
+    # ----------------------------------------------------------------------
+    def CreateKey(
+        self,
+        source_name_content_map,            # { "<name>" : "<content>", ... }
+        plugin,
+        filter_unsupported_extensions,
+        filter_unsupported_attributes,
+    ):
+        hasher = hashlib.sha256()
+
+        # ----------------------------------------------------------------------
+        def Update(value):
+            if not isinstance(value, six.binary_type):
+                value = six.text_type(value).encode("utf-8")
+
+            hasher.update(value)
+            hasher.update(b"\0")
+
+        # ----------------------------------------------------------------------
+
+        Update(self.VERSION)
+        Update("{}.{}".format(*sys.version_info[:2]))
+        Update(plugin.Name)
+        Update(plugin.Flags)
+        Update(filter_unsupported_extensions)
+        Update(filter_unsupported_attributes)
+
+        # The metadata items supported by the plugin vary by item and are defined by the plugin
+        # and the classes that it is derived from; changes to that code (or the code used to
+        # parse the content) invalidate the cached elements.
+        Update(self._GetSchemaSourceHash())
+        Update(self._GetPluginSourceHash(plugin))
+
+        for source_name, content in six.iteritems(source_name_content_map):
+            Update(source_name)
+            Update(self._CalculateHash(content))
+
+        return hasher.hexdigest()
+
+    # ----------------------------------------------------------------------
+    def Load(
+        self,
+        key,
+        include_filenames=None,             # [ "<filename>", ... ]; populated with the files included by the sources when the elements are returned
+    ):
+        """Returns the cached elements associated with the key or None if the elements don't exist or are stale"""
+
+        filename = self._GetFilename(key)
+        if not os.path.isfile(filename):
+            return None
+
+        try:
+            with open(filename, "rb") as f:
+                data = pickle.load(f)
+
+            if data["version"] != self.VERSION:
+                return None
+
+            for include_filename, include_hash in six.iteritems(data["includes"]):
+                if not os.path.isfile(include_filename):
+                    return None
+
+                if self._CalculateFileHash(include_filename) != include_hash:
+                    return None
+
+            with PicklePathContext():
+                elements = pickle.loads(data["elements"])
+
+            if include_filenames is not None:
+                include_filenames += list(six.iterkeys(data["includes"]))
+
+            return elements
+
+        except Exception:
+            # A corrupt or incompatible cache entry is treated as a cache miss
+            return None
+
+    # ----------------------------------------------------------------------
+    def Save(self, key, include_filenames, elements):
+        includes = OrderedDict()
+
+        for include_filename in include_filenames:
+            if include_filename in includes:
+                continue
+
+            includes[include_filename] = self._CalculateFileHash(include_filename)
+
+        with PicklePathContext():
+            pickled_elements = pickle.dumps(elements)
+
+        if not os.path.isdir(self.CacheDir):
+            os.makedirs(self.CacheDir)
+
+        # Write to a temporary file and move it into place so that concurrent
+        # readers never see a partially written entry.
+        file_handle, temp_filename = tempfile.mkstemp(
+            dir=self.CacheDir,
+            suffix=".tmp",
+        )
+
+        with os.fdopen(file_handle, "wb") as f:
+            pickle.dump(
+                {
+                    "version": self.VERSION,
+                    "includes": includes,
+                    "elements": pickled_elements,
+                },
+                f,
+                pickle.HIGHEST_PROTOCOL,
+            )
+
+        os.replace(temp_filename, self._GetFilename(key))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetFilename(self, key):
+        return os.path.join(self.CacheDir, "{}.pickle".format(key))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CalculateHash(content):
+        if not isinstance(content, six.binary_type):
+            content = content.encode("utf-8")
+
+        return hashlib.sha256(content).hexdigest()
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CalculateFileHash(cls, filename):
+        with open(filename, "rb") as f:
+            return cls._CalculateHash(f.read())
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _GetSchemaSourceHash(cls):
+        global _schema_source_hash
+
+        if _schema_source_hash is None:
+            schema_dir = os.path.realpath(os.path.join(_script_dir, ".."))
+            source_filenames = []
+
+            for root, directories, filenames in os.walk(schema_dir):
+                directories[:] = sorted(directory for directory in directories if directory not in ["__pycache__", "UnitTests", "PerformanceTests"])
+
+                for filename in sorted(filenames):
+                    if os.path.splitext(filename)[1] == ".py":
+                        source_filenames.append(os.path.join(root, filename))
+
+            _schema_source_hash = cls._CalculateFilesHash(source_filenames)
+
+        return _schema_source_hash
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _GetPluginSourceHash(cls, plugin):
+        plugin_class = plugin if isinstance(plugin, type) else type(plugin)
+
+        result = _plugin_source_hashes.get(plugin_class, None)
+        if result is None:
+            source_filenames = []
+
+            for class_ in inspect.getmro(plugin_class):
+                try:
+                    filename = inspect.getfile(class_)
+                except TypeError:
+                    # Raised for builtins
+                    continue
+
+                if os.path.splitext(filename)[1].lower() in [".pyc", ".pyo"]:
+                    filename = filename[:-1]
+
+                if os.path.isfile(filename):
+                    source_filenames.append(filename)
+
+            result = cls._CalculateFilesHash(source_filenames)
+            _plugin_source_hashes[plugin_class] = result
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CalculateFilesHash(cls, filenames):
+        hasher = hashlib.sha256()
+
+        for filename in filenames:
+            hasher.update(cls._CalculateFileHash(filename).encode("utf-8"))
+            hasher.update(b"\0")
+
+        return hasher.hexdigest()
+
+
+# ----------------------------------------------------------------------
+class MemoryParseCache(ParseCache):
+    """\
+    ParseCache that keeps entries in memory; used by long-running processes.
+
+    Includes are validated by modification time, falling back to the content hash
+    when the modification time has changed. Elements are stored in their pickled form
+    so that each load produces a distinct set of objects.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        super(MemoryParseCache, self).__init__(None)
+
+        self._entries                       = {}
+        self._entries_lock                  = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def Load(self, key, include_filenames=None):
+        with self._entries_lock:
+            entry = self._entries.get(key, None)
+
+        if entry is None:
+            return None
+
+        includes, pickled_elements = entry
+
+        # Entries are shared by all callers, so updated modification times are written to
+        # a copy of the includes that replaces the entry.
+        updated_includes = None
+
+        for include_filename, (include_mtime, include_hash) in six.iteritems(includes):
+            if not os.path.isfile(include_filename):
+                return None
+
+            mtime = os.path.getmtime(include_filename)
+            if mtime == include_mtime:
+                continue
+
+            if self._CalculateFileHash(include_filename) != include_hash:
+                return None
+
+            if updated_includes is None:
+                updated_includes = OrderedDict(includes)
+
+            updated_includes[include_filename] = (mtime, include_hash)
+
+        if updated_includes is not None:
+            with self._entries_lock:
+                # Don't replace an entry that was saved while the includes were validated
+                if self._entries.get(key, None) is entry:
+                    self._entries[key] = (updated_includes, pickled_elements)
+
+        with PicklePathContext():
+            elements = pickle.loads(pickled_elements)
+
+        if include_filenames is not None:
+            include_filenames += list(six.iterkeys(includes))
+
+        return elements
+
+    # ----------------------------------------------------------------------
+    def Save(self, key, include_filenames, elements):
+        includes = OrderedDict()
+
+        for include_filename in include_filenames:
+            if include_filename in includes:
+                continue
+
+            includes[include_filename] = (os.path.getmtime(include_filename), self._CalculateFileHash(include_filename))
+
+        with PicklePathContext():
+            pickled_elements = pickle.dumps(elements)
+
+        with self._entries_lock:
+            self._entries[key] = (includes, pickled_elements)
@@ -0,0 +1,145 @@
+# ----------------------------------------------------------------------
+# |
+# |  PassManager.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-28 10:14:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the PassManager object"""
+
+import os
+import time
+
+from collections import namedtuple
+
+import CommonEnvironment
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class PassManager(object):
+    """\
+    Invokes functors (passes) on every Item in an Item hierarchy.
+
+    Each pass lists the passes that must have been invoked on all Items before it can
+    be invoked on any Item. Passes without such dependencies share a traversal with
+    the passes that precede them; for each Item, passes are invoked in the order in
+    which they were added.
+
+    Items are visited in the same (pre-)order as a recursive traversal, but without
+    recursion. Children are enumerated after all passes in the traversal have been invoked
+    on the parent, so children added by a pass are visited.
+
+    Errors are reported as if each pass had its own traversal: when passes that share a
+    traversal raise exceptions, the exception raised by the pass added first (for the first
+    Item that it failed on) is raised once the traversal is complete.
+    """
+
+    Pass                                    = namedtuple("Pass", ["Name", "Functor", "Dependencies"])
+
+    # ----------------------------------------------------------------------
+    def __init__(self, name):
+        self.Name                           = name
+        self.Passes                         = []
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        name,
+        functor,                            # def Func(item) -> None
+        dependencies=None,                  # Names of passes that must be complete for all Items
+    ):
+        dependencies = dependencies or []
+
+        pass_names = set(p.Name for p in self.Passes)
+
+        assert name not in pass_names, name
+        assert all(dependency in pass_names for dependency in dependencies), dependencies
+
+        self.Passes.append(self.Pass(name, functor, dependencies))
+
+    # ----------------------------------------------------------------------
+    def CreateTraversals(self):
+        """Returns a list of lists of passes, where each list of passes is invoked during a single traversal"""
+
+        traversals = []
+        traversal_names = set()
+
+        for p in self.Passes:
+            if not traversals or any(dependency in traversal_names for dependency in p.Dependencies):
+                traversals.append([])
+                traversal_names = set()
+
+            traversals[-1].append(p)
+            traversal_names.add(p.Name)
+
+        return traversals
+
+    # ----------------------------------------------------------------------
+    def Execute(
+        self,
+        root,
+        timings=None,                       # { "<manager name>.<pass name>" : <seconds>, ... }
+    ):
+        for traversal in self.CreateTraversals():
+            if timings is None:
+                functors = [p.Functor for p in traversal]
+            else:
+                functors = [self._CreateTimedFunctor(timings, p) for p in traversal]
+
+            # Passes that follow a pass that raised an exception can't change the exception
+            # that will be raised, so they aren't invoked once that exception is encountered.
+            num_active_functors = len(functors)
+            error = None
+
+            items = [root]
+
+            while items and num_active_functors:
+                item = items.pop()
+
+                for index, functor in enumerate(functors[:num_active_functors]):
+                    try:
+                        functor(item)
+                    except Exception as ex:
+                        num_active_functors = index
+                        error = ex
+
+                        break
+
+                items += reversed(item.items)
+
+            if error is not None:
+                raise error
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateTimedFunctor(self, timings, p):
+        key = "{}.{}".format(self.Name, p.Name)
+        timings.setdefault(key, 0.0)
+
+        functor = p.Functor
+
+        # ----------------------------------------------------------------------
+        def Impl(item):
+            start = time.perf_counter()
+
+            try:
+                functor(item)
+            finally:
+                timings[key] += time.perf_counter() - start
+
+        # ----------------------------------------------------------------------
+
+        return Impl
@@ -0,0 +1,177 @@
+# ----------------------------------------------------------------------
+# |
+# |  Resolve_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-25 09:42:18
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance test for Resolve.py"""
+
+import os
+import sys
+import time
+import unittest
+
+import six
+
+import CommonEnvironment
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..Populate import Populate
+    from ..Resolve import *
+
+    from ... import Elements
+
+    from ....Plugin import ParseFlag
+
+# ----------------------------------------------------------------------
+class ReferenceSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Wide(self):
+        # Many siblings, each referencing a sibling
+        num_items = 4000
+
+        content = []
+
+        for index in range(num_items):
+            content.append("<decl{} string>\n".format(index))
+
+        for index in range(num_items):
+            content.append("<ref{} decl{}>\n".format(index, num_items - index - 1))
+
+        root = self._Execute("Wide", "".join(content))
+
+        self.assertEqual(len(root.items), num_items * 2)
+        self.assertTrue(root.items[num_items].references[0] is root.items[num_items - 1])
+
+    # ----------------------------------------------------------------------
+    def test_Deep(self):
+        # Deeply nested objects, where the innermost items reference siblings of
+        # the outermost object.
+        depth = 60
+        num_siblings = 200
+
+        content = []
+
+        for index in range(num_siblings):
+            content.append("<decl{} string>\n".format(index))
+
+        for level in range(depth):
+            indentation = "    " * level
+
+            content.append("{}<obj{}>:\n".format(indentation, level))
+
+            for index in range(num_siblings):
+                content.append("{}    <member{}_{} string>\n".format(indentation, level, index))
+
+        indentation = "    " * depth
+
+        for index in range(num_siblings):
+            content.append("{}<ref{} decl{}>\n".format(indentation, index, index))
+
+        root = self._Execute("Deep", "".join(content))
+
+        self.assertEqual(len(root.items), num_siblings + 1)
+
+    # ----------------------------------------------------------------------
+    def test_CompoundChain(self):
+        # Objects that are based on the previous object; determining that an object
+        # is compound requires searching all of the objects that precede it.
+        num_items = 2000
+
+        content = ["<obj0>:\n    <value0 string>\n"]
+
+        for index in range(1, num_items):
+            content.append("<obj{} obj{}>:\n    <value{} string>\n".format(index, index - 1, index))
+
+        root = self._Execute("CompoundChain", "".join(content))
+
+        self.assertEqual(len(root.items), num_items)
+        self.assertTrue(all(item.element_type == Elements.CompoundElement for item in root.items))
+
+    # ----------------------------------------------------------------------
+    def test_SimpleChain(self):
+        num_items = 2000
+
+        content = ["<obj0 string>:\n    [value0 string]\n"]
+
+        for index in range(1, num_items):
+            content.append("<obj{} obj{}>:\n    [value{} string]\n".format(index, index - 1, index))
+
+        root = self._Execute("SimpleChain", "".join(content))
+
+        self.assertEqual(len(root.items), num_items)
+        self.assertTrue(all(item.element_type == Elements.SimpleElement for item in root.items))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Execute(name, content):
+        start = time.perf_counter()
+
+        root = Populate({name: lambda: content}, ParseFlag.AllFlags)
+
+        populate_time = time.perf_counter() - start
+        start = time.perf_counter()
+
+        timings = {}
+
+        root = Resolve(root, _CreatePlugin(), timings=timings)
+
+        resolve_time = time.perf_counter() - start
+
+        sys.stdout.write("\n{}: Populate {:.3f}s, Resolve {:.3f}s\n".format(name, populate_time, resolve_time))
+
+        for k, v in six.iteritems(timings):
+            sys.stdout.write("    {:<30} {:.3f}s\n".format(k, v))
+
+        return root
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreatePlugin():
+    # ----------------------------------------------------------------------
+    class Object(object):
+        pass
+
+    # ----------------------------------------------------------------------
+
+    plugin = Object()
+
+    plugin.Name = "Plugin"
+    plugin.Flags = ParseFlag.AllFlags
+    plugin.GetRequiredMetadataItems = lambda item: []
+    plugin.GetOptionalMetadataItems = lambda item: []
+
+    return plugin
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,66 @@
+# ----------------------------------------------------------------------
+# |
+# |  PicklePath.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-28 10:41:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the PicklePathContext method"""
+
+import os
+import sys
+import threading
+
+from contextlib import contextmanager
+
+import CommonEnvironment
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# Pickling requires a fully qualified name, which is the root of this package
+_package_root                               = os.path.normpath(os.path.join(_script_dir, "..", "..", ".."))
+
+_lock                                       = threading.Lock()
+_ref_count                                  = 0
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def PicklePathContext():
+    """\
+    Adds the root of this package to sys.path while elements are pickled or unpickled.
+
+    Elements may be pickled or unpickled on multiple threads, so contexts are
+    reference counted: the path is added when the first context is entered
+    and removed when the last one exits. The path is removed by value, as other code may
+    have modified sys.path in the meantime.
+    """
+
+    global _ref_count
+
+    with _lock:
+        if _ref_count == 0:
+            sys.path.insert(0, _package_root)
+
+        _ref_count += 1
+
+    try:
+        yield
+
+    finally:
+        with _lock:
+            _ref_count -= 1
+
+            if _ref_count == 0:
+                sys.path.remove(_package_root)
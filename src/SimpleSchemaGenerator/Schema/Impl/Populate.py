@@ -14,10 +14,13 @@
 # ----------------------------------------------------------------------
 """Uses ANTLR-generated functionality to populate items"""
 
+import copy
 import os
 import sys
+import threading
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 
 import antlr4
@@ -44,6 +47,7 @@ with CallOnExit(lambda: sys.path.pop(0)):
 
 with InitRelativeImports():
     from .Item import Item, Metadata, MetadataValue, MetadataSource, ResolvedMetadata
+    from .PicklePath import PicklePathContext
 
     from ..Attributes import FUNDAMENTAL_ATTRIBUTE_INFO_MAP
     from .. import Exceptions
@@ -51,9 +55,201 @@ with InitRelativeImports():
     from ...Plugin import ParseFlag
 
 # ----------------------------------------------------------------------
-def Populate(source_name_content_generators, parse_flags):                  # { "name" : def Func() -> content, }
+def Populate(
+    source_name_content_generators,         # { "name" : def Func() -> content, }
+    parse_flags,
+    max_num_workers=None,                   # Lex and parse files in a process pool when > 1
+):
     include_filenames = []
 
+    root = _CreateRoot()
+
+    # ----------------------------------------------------------------------
+    def UpdateIncludeFilenames(source_name):
+        for filename in root.includes.get(source_name, []):
+            if filename not in source_name_content_generators and filename not in include_filenames:
+                include_filenames.append(filename)
+
+    # ----------------------------------------------------------------------
+
+    if not max_num_workers or max_num_workers <= 1:
+        for source_name, content_generator in six.iteritems(source_name_content_generators):
+            _ParseContent(
+                root,
+                parse_flags,
+                source_name,
+                content_generator(),
+                is_external=False,
+            )
+
+            UpdateIncludeFilenames(source_name)
+
+        # Iterating via index rather than by element as processing the content may update
+        # the list.
+        index = 0
+
+        while index < len(include_filenames):
+            _ParseContent(
+                root,
+                parse_flags,
+                include_filenames[index],
+                None,
+                is_external=True,
+            )
+
+            UpdateIncludeFilenames(include_filenames[index])
+
+            index += 1
+
+        _CreateItemsIndexes(root)
+        return root
+
+    # Lex and parse in a process pool, merging the results into root in the same
+    # order as they would have been processed serially. Errors encountered in the
+    # pool are reproduced by parsing the file again in this process, so that the
+    # exception (and the file that it is associated with) is the same exception
+    # raised when parsing serially.
+
+    # ----------------------------------------------------------------------
+    def Execute(executor, source_name_content_is_external_items, exception_info):
+        futures = [
+            executor.submit(_ParseWorker, parse_flags, source_name, content, is_external)
+            for source_name, content, is_external in source_name_content_is_external_items
+        ]
+
+        for future, (source_name, content, is_external) in zip(futures, source_name_content_is_external_items):
+            try:
+                result = future.result()
+            except Exception:
+                # The result couldn't be transferred from the worker; process the content locally
+                result = None
+
+            if result is None:
+                _ParseContent(
+                    root,
+                    parse_flags,
+                    source_name,
+                    content,
+                    is_external=is_external,
+                )
+            else:
+                items, config, includes, used_flags = result
+
+                for item in items:
+                    item.Parent = root
+                    root.items.append(item)
+
+                for k, v in six.iteritems(config):
+                    root.config.setdefault(k, []).extend(v)
+
+                for k, v in six.iteritems(includes):
+                    root.includes.setdefault(k, []).extend(v)
+
+                root.used_flags.update(used_flags)
+
+            UpdateIncludeFilenames(source_name)
+
+        if exception_info is not None:
+            six.reraise(*exception_info)
+
+    # ----------------------------------------------------------------------
+
+    with PicklePathContext():
+        with ProcessPoolExecutor(max_num_workers) as executor:
+            # Content generators are invoked in order; an exception raised while generating
+            # content is raised after errors associated with previous sources.
+            items = []
+            exception_info = None
+
+            for source_name, content_generator in six.iteritems(source_name_content_generators):
+                try:
+                    content = content_generator()
+                except Exception:
+                    exception_info = sys.exc_info()
+                    break
+
+                items.append((source_name, content, False))
+
+            Execute(executor, items, exception_info)
+
+            # Process includes in waves, as each include may introduce new includes
+            index = 0
+
+            while index < len(include_filenames):
+                items = [(include_filename, None, True) for include_filename in include_filenames[index:]]
+                index += len(items)
+
+                Execute(executor, items, None)
+
+    _CreateItemsIndexes(root)
+    return root
+
+
+# ----------------------------------------------------------------------
+class PopulateCache(object):
+    """\
+    Shares the results of Populate across plugins that process the same content.
+
+    Content is populated once with all flags and copied for each plugin that supports
+    the flags used by the content. Content is populated again with the plugin's flags
+    when the plugin doesn't support the content (or populating with all flags failed),
+    so that errors are the same as those generated when invoking Populate directly.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._roots                         = {}
+        self._roots_lock                    = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def __deepcopy__(self, memo):
+        # The cache is passed to the code generator as metadata, which is deep copied;
+        # all copies must share the same populated content.
+        return self
+
+    # ----------------------------------------------------------------------
+    def Populate(
+        self,
+        source_name_content_generators,     # { "name" : def Func() -> content, }
+        parse_flags,
+        max_num_workers=None,
+    ):
+        source_name_content_map = OrderedDict(
+            [(k, v()) for k, v in six.iteritems(source_name_content_generators)],
+        )
+
+        source_name_content_generators = OrderedDict(
+            [(k, lambda v=v: v) for k, v in six.iteritems(source_name_content_map)],
+        )
+
+        key = tuple(six.iteritems(source_name_content_map))
+
+        with self._roots_lock:
+            is_cached = key in self._roots
+            root = self._roots.get(key, None)
+
+        if not is_cached:
+            # Content is populated without the lock so that callers populating different
+            # content don't wait on each other; if multiple callers populate the same content,
+            # the first result is used by all of them.
+            try:
+                root = Populate(source_name_content_generators, ParseFlag.AllFlags, max_num_workers=max_num_workers)
+            except Exception:
+                root = None
+
+            with self._roots_lock:
+                root = self._roots.setdefault(key, root)
+
+        if root is None or any(not parse_flags & flag for flag in root.used_flags):
+            return Populate(source_name_content_generators, parse_flags, max_num_workers=max_num_workers)
+
+        return copy.deepcopy(root)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRoot():
     root = Item(
         declaration_type=Item.DeclarationType.Object,
         item_type=Item.ItemType.Standard,
@@ -70,6 +266,56 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
     root.config = OrderedDict()
 
+    # { "<source_name>" : [ "<include_filename>", ... ], ... }
+    root.includes = OrderedDict()
+
+    # Flags required by the content
+    root.used_flags = set()
+
+    return root
+
+
+# ----------------------------------------------------------------------
+def _CreateItemsIndexes(root):
+    """Creates the name index for all items once their names are known"""
+
+    items = [root]
+
+    while items:
+        item = items.pop()
+
+        item.ItemsIndex                                                     # <Statement has no effect> pylint: disable = W0104
+        items += item.items
+
+
+# ----------------------------------------------------------------------
+def _ParseWorker(parse_flags, source_name, content, is_external):
+    """Parses content within a process pool worker; returns None on error"""
+
+    root = _CreateRoot()
+
+    try:
+        _ParseContent(root, parse_flags, source_name, content, is_external)
+    except Exception:
+        # Exceptions aren't guaranteed to survive the trip across process boundaries;
+        # the content will be parsed again in the main process to produce the error.
+        return None
+
+    # The root is recreated in the main process
+    for item in root.items:
+        item.Parent = None
+
+    return root.items, root.config, root.includes, root.used_flags
+
+
+# ----------------------------------------------------------------------
+def _ParseContent(
+    root,
+    parse_flags,
+    source_name,
+    content,                                # Content is read from source_name if None
+    is_external,
+):
     # ----------------------------------------------------------------------
     class Visitor(SimpleSchemaVisitor):
         # <PascalCase naming style> pylint: disable = C0103
@@ -261,8 +507,7 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
         # ----------------------------------------------------------------------
         def visitIncludeStatement(self, ctx):
-            if not parse_flags & ParseFlag.SupportIncludeStatements:
-                raise Exceptions.PopulateUnsupportedIncludeStatementsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportIncludeStatements, Exceptions.PopulateUnsupportedIncludeStatementsException)
 
             values = self._GetChildValues(ctx)
             assert len(values) == 1, values
@@ -277,13 +522,11 @@ def Populate(source_name_content_generators, parse_flags):                  # {
                     name=filename,
                 )
 
-            if filename not in source_name_content_generators and filename not in include_filenames:
-                include_filenames.append(filename)
+            root.includes.setdefault(self._source_name, []).append(filename)
 
         # ----------------------------------------------------------------------
         def visitConfigStatement(self, ctx):
-            if not parse_flags & ParseFlag.SupportConfigStatements:
-                raise Exceptions.PopulateUnsupportedConfigStatementsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportConfigStatements, Exceptions.PopulateUnsupportedConfigStatementsException)
             values = self._GetChildValues(ctx)
 
             # There should be at least the name and 1 metadata item
@@ -312,15 +555,12 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
         # ----------------------------------------------------------------------
         def visitUnnamedObj(self, ctx):
-            if not parse_flags & ParseFlag.SupportUnnamedObjects:
-                raise Exceptions.PopulateUnsupportedUnnamedObjectsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportUnnamedObjects, Exceptions.PopulateUnsupportedUnnamedObjectsException)
 
             if len(self._stack) == 1:
-                if not parse_flags & ParseFlag.SupportRootObjects:
-                    raise Exceptions.PopulateUnsupportedRootObjectsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportRootObjects, Exceptions.PopulateUnsupportedRootObjectsException)
             else:
-                if not parse_flags & ParseFlag.SupportChildObjects:
-                    raise Exceptions.PopulateUnsupportedChildObjectsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportChildObjects, Exceptions.PopulateUnsupportedChildObjectsException)
 
             with self._PushNewStackItem(ctx, Item.DeclarationType.Object):
                 values = self._GetChildValues(ctx)
@@ -328,15 +568,12 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
         # ----------------------------------------------------------------------
         def visitObj(self, ctx):
-            if not parse_flags & ParseFlag.SupportNamedObjects:
-                raise Exceptions.PopulateUnsupportedNamedObjectsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportNamedObjects, Exceptions.PopulateUnsupportedNamedObjectsException)
 
             if len(self._stack) == 1:
-                if not parse_flags & ParseFlag.SupportRootObjects:
-                    raise Exceptions.PopulateUnsupportedRootObjectsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportRootObjects, Exceptions.PopulateUnsupportedRootObjectsException)
             else:
-                if not parse_flags & ParseFlag.SupportChildObjects:
-                    raise Exceptions.PopulateUnsupportedChildObjectsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportChildObjects, Exceptions.PopulateUnsupportedChildObjectsException)
 
             with self._PushNewStackItem(ctx, Item.DeclarationType.Object) as item:
                 values = self._GetChildValues(ctx)
@@ -403,15 +640,12 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
         # ----------------------------------------------------------------------
         def visitUnnamedDeclaration(self, ctx):
-            if not parse_flags & ParseFlag.SupportUnnamedDeclarations:
-                raise Exceptions.PopulateUnsupportedUnnamedDeclarationsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportUnnamedDeclarations, Exceptions.PopulateUnsupportedUnnamedDeclarationsException)
 
             if len(self._stack) == 1:
-                if not parse_flags & ParseFlag.SupportRootDeclarations:
-                    raise Exceptions.PopulateUnsupportedRootDeclarationsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportRootDeclarations, Exceptions.PopulateUnsupportedRootDeclarationsException)
             else:
-                if not parse_flags & ParseFlag.SupportChildDeclarations:
-                    raise Exceptions.PopulateUnsupportedChildDeclarationsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportChildDeclarations, Exceptions.PopulateUnsupportedChildDeclarationsException)
 
             with self._PushNewStackItem(ctx, Item.DeclarationType.Declaration):
                 values = self._GetChildValues(ctx)
@@ -419,15 +653,12 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
         # ----------------------------------------------------------------------
         def visitDeclaration(self, ctx):
-            if not parse_flags & ParseFlag.SupportNamedDeclarations:
-                raise Exceptions.PopulateUnsupportedNamedDeclarationsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportNamedDeclarations, Exceptions.PopulateUnsupportedNamedDeclarationsException)
 
             if len(self._stack) == 1:
-                if not parse_flags & ParseFlag.SupportRootDeclarations:
-                    raise Exceptions.PopulateUnsupportedRootDeclarationsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportRootDeclarations, Exceptions.PopulateUnsupportedRootDeclarationsException)
             else:
-                if not parse_flags & ParseFlag.SupportChildDeclarations:
-                    raise Exceptions.PopulateUnsupportedChildDeclarationsException(self._source_name, ctx.start.line, ctx.start.column + 1)
+                self._VerifyFlag(ctx, ParseFlag.SupportChildDeclarations, Exceptions.PopulateUnsupportedChildDeclarationsException)
 
             with self._PushNewStackItem(ctx, Item.DeclarationType.Declaration) as item:
                 values = self._GetChildValues(ctx)
@@ -495,8 +726,7 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
         # ----------------------------------------------------------------------
         def visitExtension(self, ctx):
-            if not parse_flags & ParseFlag.SupportExtensionsStatements:
-                raise Exceptions.PopulateUnsupportedExtensionStatementException(self._source_name, ctx.start.line, ctx.start.column + 1)
+            self._VerifyFlag(ctx, ParseFlag.SupportExtensionsStatements, Exceptions.PopulateUnsupportedExtensionStatementException)
 
             with self._PushNewStackItem(ctx, Item.DeclarationType.Extension) as item:
                 values = self._GetChildValues(ctx)
@@ -554,6 +784,13 @@ def Populate(source_name_content_generators, parse_flags):                  # {
 
             return result
 
+        # ----------------------------------------------------------------------
+        def _VerifyFlag(self, ctx, flag, exception_type):
+            root.used_flags.add(flag)
+
+            if not parse_flags & flag:
+                raise exception_type(self._source_name, ctx.start.line, ctx.start.column + 1)
+
         # ----------------------------------------------------------------------
         @contextmanager
         def _PushNewStackItem(self, ctx, declaration_type):
@@ -633,46 +870,22 @@ def Populate(source_name_content_generators, parse_flags):                  # {
                 )
 
     # ----------------------------------------------------------------------
-    def Impl(name, antlr_stream, is_external):
-        lexer = SimpleSchemaLexer(antlr_stream)
-        tokens = antlr4.CommonTokenStream(lexer)
-
-        tokens.fill()
-
-        parser = SimpleSchemaParser(tokens)
-        parser.addErrorListener(ErrorListener(name))
-
-        ast = parser.statements()
-        assert ast
-
-        ast.accept(Visitor(name, is_external))
-
-    # ----------------------------------------------------------------------
-
-    for source_name, content_generator in six.iteritems(source_name_content_generators):
-        content = content_generator()
-        content += "\n"
 
-        antlr_stream = antlr4.InputStream(content)
+    if content is None:
+        antlr_stream = antlr4.FileStream(source_name)
+    else:
+        antlr_stream = antlr4.InputStream(content + "\n")
         antlr_stream.filename = source_name
 
-        Impl(
-            source_name,
-            antlr_stream,
-            is_external=False,
-        )
+    lexer = SimpleSchemaLexer(antlr_stream)
+    tokens = antlr4.CommonTokenStream(lexer)
 
-    # Iterating via index rather than by element as processing the content may update
-    # the list.
-    index = 0
+    tokens.fill()
 
-    while index < len(include_filenames):
-        Impl(
-            include_filenames[0],
-            antlr4.FileStream(include_filenames[index]),
-            is_external=True,
-        )
+    parser = SimpleSchemaParser(tokens)
+    parser.addErrorListener(ErrorListener(source_name))
 
-        index += 1
+    ast = parser.statements()
+    assert ast
 
-    return root
+    ast.accept(Visitor(source_name, is_external))
@@ -37,6 +37,7 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 
 with InitRelativeImports():
     from .Item import Item, MetadataSource, MetadataValue, Metadata, ResolvedMetadata, ItemVisitor
+    from .PassManager import PassManager
 
     from .. import Attributes
     from .. import Elements
@@ -45,16 +46,11 @@ with InitRelativeImports():
     from ...Plugin import ParseFlag
 
 # ----------------------------------------------------------------------
-def Resolve(root, plugin):
-    # ----------------------------------------------------------------------
-    def Impl(item, functor):
-        functor(item)
-
-        for child in item.items:
-            Impl(child, functor)
-
-    # ----------------------------------------------------------------------
-
+def Resolve(
+    root,
+    plugin,
+    timings=None,                           # { "Resolve.<pass name>" : <seconds>, ... }
+):
     config_metadata = root.config.get(plugin.Name, [{}])
 
     # Flatten the config metadata
@@ -69,14 +65,30 @@ def Resolve(root, plugin):
     config_metadata = config_metadata[0]
 
     reference_states = {}
+    simple_cache = {}
+
+    # References are resolved via the names index created during Populate, so names
+    # can be updated during the same traversal.
+    passes = PassManager("Resolve")
+
+    passes.Add("Reference", _ResolveReference)
+    passes.Add("Name", _ResolveName)
+
+    # Element types are based on the references (and element types) of other items
+    passes.Add("ElementType", lambda item: _ResolveElementType(plugin, reference_states, simple_cache, item), ["Reference"])
 
-    Impl(root, _ResolveReference)
-    Impl(root, _ResolveName)
-    Impl(root, lambda item: _ResolveElementType(plugin, reference_states, item))
-    Impl(root, lambda item: _ResolveArity(plugin, item))
-    Impl(root, lambda item: _ResolveMetadata(plugin, config_metadata, item))
-    Impl(root, lambda item: _ResolveReferenceType(reference_states, item))
-    Impl(root, _ResolveMetadataDefaults)
+    # Arity is based on the element types of referenced items
+    passes.Add("Arity", lambda item: _ResolveArity(plugin, item), ["ElementType"])
+
+    # Metadata is based on the arity of referenced items
+    passes.Add("Metadata", lambda item: _ResolveMetadata(plugin, config_metadata, item), ["Arity"])
+    passes.Add("ReferenceType", lambda item: _ResolveReferenceType(reference_states, item), ["ElementType"])
+
+    # Defaults must not be applied until the metadata of all referencing items has been
+    # squashed, as squashed values take precedence over defaults.
+    passes.Add("MetadataDefaults", _ResolveMetadataDefaults, ["Metadata"])
+
+    passes.Execute(root, timings)
 
     return root
 
@@ -119,7 +131,7 @@ def _ResolveReference(item):
                 #   <obj>:
                 #       <foo foo> # Foo should not reference itself
                 #
-                query = next((qi for qi in query.items if qi.name == name_part and qi != item), None)
+                query = next((qi for qi in query.ItemsIndex.get(name_part, []) if qi != item), None)
                 if query is None:
                     break
 
@@ -178,12 +190,18 @@ def _ResolveName(item):
                 name=metadata_value.Value,
             )
 
+        # References are resolved by the original name; ensure that the parent's index
+        # has been created before the name changes (this is only a concern for Items that
+        # weren't created by Populate).
+        if item.Parent is not None:
+            item.Parent.ItemsIndex                                          # <Statement has no effect> pylint: disable = W0104
+
         item.name = metadata_value.Value
         del item.metadata.Values[Attributes.UNIVERSAL_NAME_OVERRIDE_ATTRIBUTE_NAME]
 
 
 # ----------------------------------------------------------------------
-def _ResolveElementType(plugin, reference_states, item):
+def _ResolveElementType(plugin, reference_states, simple_cache, item):
     """Assign an element type for the item"""
 
     if item.multi_reference_type == Item.MultiReferenceType.Variant:
@@ -199,32 +217,7 @@ def _ResolveElementType(plugin, reference_states, item):
         elif item.DeclarationType == Item.DeclarationType.Object:
             # If here, we are looking at a Compound or a Simple object. A Simple
             # object is one that ultimately references a fundamental type.
-
-            # ----------------------------------------------------------------------
-            def IsSimple():
-                search_queue = list(item.references)
-                searched = set()
-
-                while search_queue:
-                    ref = search_queue.pop(0)
-                    if ref in searched:
-                        continue
-
-                    searched.add(ref)
-
-                    if isinstance(ref, Attributes.FundamentalAttributeInfo):
-                        return True
-
-                    if ref.element_type == Elements.SimpleElement:
-                        return True
-
-                    search_queue += ref.references
-
-                return False
-
-            # ----------------------------------------------------------------------
-
-            if IsSimple():
+            if _IsSimple(simple_cache, item):
                 element_type = Elements.SimpleElement
                 found_fundamental_element = False
 
@@ -355,6 +348,102 @@ def _ResolveElementType(plugin, reference_states, item):
         item.element_type = element_type
 
 
+# ----------------------------------------------------------------------
+def _IsSimple(cache, item):
+    """\
+    Returns True if a fundamental type can be reached via the item's references.
+
+    Results are cached for the item and all of the items that it references. Items
+    are processed in dependency order by calculating strongly connected components
+    (Tarjan's algorithm); all of the items in a reference cycle share the same result.
+    """
+
+    if item in cache:
+        return cache[item]
+
+    indexes = {}
+    lowlinks = {}
+    is_simple = {}
+
+    stack = []
+    on_stack = set()
+
+    work = []
+
+    # ----------------------------------------------------------------------
+    def Push(item):
+        indexes[item] = len(indexes)
+        lowlinks[item] = indexes[item]
+        is_simple[item] = False
+
+        stack.append(item)
+        on_stack.add(item)
+
+        work.append((item, iter(item.references)))
+
+    # ----------------------------------------------------------------------
+
+    Push(item)
+
+    while work:
+        this_item, references = work[-1]
+
+        for ref in references:
+            if not isinstance(ref, Item):
+                if isinstance(ref, Attributes.FundamentalAttributeInfo):
+                    is_simple[this_item] = True
+
+                continue
+
+            if ref.element_type == Elements.SimpleElement:
+                is_simple[this_item] = True
+                continue
+
+            if ref in cache:
+                if cache[ref]:
+                    is_simple[this_item] = True
+
+                continue
+
+            if ref not in indexes:
+                Push(ref)
+                break
+
+            if ref in on_stack:
+                lowlinks[this_item] = min(lowlinks[this_item], indexes[ref])
+
+        else:
+            work.pop()
+
+            if lowlinks[this_item] == indexes[this_item]:
+                # this_item is the root of a strongly connected component
+                component = []
+
+                while True:
+                    component_item = stack.pop()
+                    on_stack.remove(component_item)
+
+                    component.append(component_item)
+
+                    if component_item is this_item:
+                        break
+
+                result = any(is_simple[component_item] for component_item in component)
+
+                for component_item in component:
+                    cache[component_item] = result
+
+            if work:
+                parent = work[-1][0]
+
+                lowlinks[parent] = min(lowlinks[parent], lowlinks[this_item])
+
+                if cache.get(this_item, False):
+                    is_simple[parent] = True
+
+    return cache[item]
+
+
 # ----------------------------------------------------------------------
 def _ResolveArity(plugin, item):
     for sub_item in item.Enumerate(
@@ -0,0 +1,186 @@
+# ----------------------------------------------------------------------
+# |
+# |  Fingerprint_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-24 14:21:06
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for Fingerprint.py"""
+
+import datetime
+import os
+import sys
+import textwrap
+import unittest
+
+import CommonEnvironment
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..Fingerprint import *
+
+    from ...Parse import ParseStrings
+    from ....Plugin import ParseFlag
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Objects(self):
+        self.assertEqual(CalculateFingerprint(self._CreateObjects()), CalculateFingerprint(self._CreateObjects()))
+        self.assertNotEqual(CalculateFingerprint(self._CreateObjects()), CalculateFingerprint(self._CreateObjects(value=2)))
+        self.assertNotEqual(CalculateFingerprint(self._CreateObjects()), CalculateFingerprint(self._CreateObjects(names=["b", "a"])))
+
+    # ----------------------------------------------------------------------
+    def test_Cycles(self):
+        objects = self._CreateObjects()
+
+        objects[0].Reference = objects[1]
+        objects[1].Reference = objects[0]
+
+        self.assertNotEqual(CalculateFingerprint(objects), CalculateFingerprint(self._CreateObjects()))
+
+        objects[1].Reference = objects[1]
+
+        self.assertNotEqual(CalculateFingerprint(objects), CalculateFingerprint(self._CreateObjects()))
+
+    # ----------------------------------------------------------------------
+    def test_StatelessObjects(self):
+        # ----------------------------------------------------------------------
+        def Create(value):
+            objects = self._CreateObjects()
+
+            objects[0].Value = value
+            return objects
+
+        # ----------------------------------------------------------------------
+
+        # Objects that use the default repr are encoded by type, as the repr contains their address
+        self.assertEqual(CalculateFingerprint(Create(object())), CalculateFingerprint(Create(object())))
+        self.assertNotEqual(CalculateFingerprint(Create(object())), CalculateFingerprint(Create(1)))
+
+        # Other objects are encoded by their repr
+        self.assertEqual(CalculateFingerprint(Create(datetime.date(2022, 1, 1))), CalculateFingerprint(Create(datetime.date(2022, 1, 1))))
+        self.assertNotEqual(CalculateFingerprint(Create(datetime.date(2022, 1, 1))), CalculateFingerprint(Create(datetime.date(2022, 1, 2))))
+
+    # ----------------------------------------------------------------------
+    def test_CachedValues(self):
+        objects = self._CreateObjects()
+        fingerprint = CalculateFingerprint(objects)
+
+        objects[0]._cached_value = "calculated"
+        self.assertEqual(CalculateFingerprint(objects), fingerprint)
+
+    # ----------------------------------------------------------------------
+    def test_Elements(self):
+        content = textwrap.dedent(
+            """\
+            <obj>:
+                <a string>
+                <b obj*>
+                <c int min=10 ?>
+            """,
+        )
+
+        fingerprint = CalculateFingerprint(self._Parse(content))
+
+        self.assertEqual(CalculateFingerprint(self._Parse(content)), fingerprint)
+        self.assertNotEqual(CalculateFingerprint(self._Parse(content.replace("min=10", "min=20"))), fingerprint)
+
+        # Accessing properties that cache values doesn't change the fingerprint
+        elements = self._Parse(content)
+
+        for element in elements:
+            element.DottedName
+
+        self.assertEqual(CalculateFingerprint(elements), fingerprint)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateObjects(value=1, names=None):
+        names = names or ["a", "b"]
+
+        # ----------------------------------------------------------------------
+        class Object(object):
+            pass
+
+        # ----------------------------------------------------------------------
+
+        objects = []
+
+        for name in names:
+            obj = Object()
+
+            obj.Name = name
+            obj.Value = value
+            obj.Items = {"one": [value, (name, None)]}
+            obj.Reference = None
+
+            objects.append(obj)
+
+        return objects
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Parse(content):
+        # ----------------------------------------------------------------------
+        class Plugin(object):
+            Name                            = "Plugin"
+            Flags                           = ParseFlag.AllFlags
+
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def VerifyFlags():
+                pass
+
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def GetRequiredMetadataItems(item):
+                return []
+
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def GetOptionalMetadataItems(item):
+                return []
+
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def GetExtensions():
+                return []
+
+        # ----------------------------------------------------------------------
+
+        return ParseStrings(
+            {"filename": content},
+            Plugin,
+            False,
+            False,
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
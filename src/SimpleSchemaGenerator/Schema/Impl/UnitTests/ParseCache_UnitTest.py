@@ -0,0 +1,260 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseCache_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-14 10:02:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for ParseCache.py"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from collections import OrderedDict
+
+import CommonEnvironment
+from CommonEnvironment.CallOnExit import CallOnExit
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..ParseCache import *
+
+    from ....Plugin import ParseFlag
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+
+        self._include_filename = os.path.join(self._temp_dir, "Include.SimpleSchema")
+        with open(self._include_filename, "w") as f:
+            f.write("<value string>\n")
+
+        self._cache = ParseCache(os.path.join(self._temp_dir, "Cache"))
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_Miss(self):
+        self.assertEqual(self._cache.Load(self._CreateKey()), None)
+
+    # ----------------------------------------------------------------------
+    def test_Hit(self):
+        key = self._CreateKey()
+
+        self._cache.Save(key, [self._include_filename], ["one", "two"])
+        self.assertEqual(self._cache.Load(key), ["one", "two"])
+
+    # ----------------------------------------------------------------------
+    def test_IncludeFilenames(self):
+        key = self._CreateKey()
+
+        include_filenames = []
+
+        self.assertEqual(self._cache.Load(key, include_filenames=include_filenames), None)
+        self.assertEqual(include_filenames, [])
+
+        self._cache.Save(key, [self._include_filename], ["one", "two"])
+
+        self.assertEqual(self._cache.Load(key, include_filenames=include_filenames), ["one", "two"])
+        self.assertEqual(include_filenames, [self._include_filename])
+
+    # ----------------------------------------------------------------------
+    def test_KeyChanges(self):
+        key = self._CreateKey()
+
+        self.assertEqual(key, self._CreateKey())
+        self.assertNotEqual(key, self._CreateKey(content="<different string>"))
+        self.assertNotEqual(key, self._CreateKey(name="Different"))
+        self.assertNotEqual(key, self._CreateKey(flags=ParseFlag.SupportRootObjects))
+        self.assertNotEqual(key, self._CreateKey(filter_unsupported_extensions=True))
+        self.assertNotEqual(key, self._CreateKey(filter_unsupported_attributes=True))
+
+    # ----------------------------------------------------------------------
+    def test_PluginSourceChanges(self):
+        plugin_filename = os.path.join(self._temp_dir, "TestPlugin.py")
+
+        # ----------------------------------------------------------------------
+        def CreateKey(content):
+            with open(plugin_filename, "w") as f:
+                f.write(content)
+
+            # Ensure that the modification time changes, even on file systems with coarse timestamps
+            stat = os.stat(plugin_filename)
+            os.utime(plugin_filename, (stat.st_atime, stat.st_mtime + len(content)))
+
+            spec = importlib.util.spec_from_file_location("TestPlugin", plugin_filename)
+
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            # The module must be available to determine the source file of the plugin
+            sys.modules[spec.name] = module
+            with CallOnExit(lambda: sys.modules.pop(spec.name)):
+                return self._cache.CreateKey(
+                    OrderedDict([("filename", "<value string>")]),
+                    module.Plugin,
+                    False,
+                    False,
+                )
+
+        # ----------------------------------------------------------------------
+
+        content = textwrap.dedent(
+            """\
+            class Plugin(object):
+                Name = "Plugin"
+                Flags = {}
+
+                @staticmethod
+                def GetOptionalMetadataItems(item):
+                    return []
+            """,
+        ).format(int(ParseFlag.AllFlags))
+
+        key = CreateKey(content)
+
+        self.assertEqual(key, CreateKey(content))
+        self.assertNotEqual(key, CreateKey(content.replace("return []", "return [item]")))
+
+    # ----------------------------------------------------------------------
+    def test_ModifiedInclude(self):
+        key = self._CreateKey()
+
+        self._cache.Save(key, [self._include_filename], ["one", "two"])
+
+        with open(self._include_filename, "w") as f:
+            f.write("<value int>\n")
+
+        self.assertEqual(self._cache.Load(key), None)
+
+    # ----------------------------------------------------------------------
+    def test_RemovedInclude(self):
+        key = self._CreateKey()
+
+        self._cache.Save(key, [self._include_filename], ["one", "two"])
+
+        os.remove(self._include_filename)
+
+        self.assertEqual(self._cache.Load(key), None)
+
+    # ----------------------------------------------------------------------
+    def test_CorruptEntry(self):
+        key = self._CreateKey()
+
+        self._cache.Save(key, [self._include_filename], ["one", "two"])
+
+        with open(os.path.join(self._cache.CacheDir, "{}.pickle".format(key)), "wb") as f:
+            f.write(b"Not a pickle")
+
+        self.assertEqual(self._cache.Load(key), None)
+
+    # ----------------------------------------------------------------------
+    def _CreateKey(
+        self,
+        content="<value string>",
+        name="Plugin",
+        flags=ParseFlag.AllFlags,
+        filter_unsupported_extensions=False,
+        filter_unsupported_attributes=False,
+    ):
+        # ----------------------------------------------------------------------
+        class Plugin(object):
+            pass
+
+        # ----------------------------------------------------------------------
+
+        plugin = Plugin()
+
+        plugin.Name = name
+        plugin.Flags = flags
+
+        return self._cache.CreateKey(
+            OrderedDict([("filename", content)]),
+            plugin,
+            filter_unsupported_extensions,
+            filter_unsupported_attributes,
+        )
+
+
+# ----------------------------------------------------------------------
+class MemorySuite(StandardSuite):
+    # Run all of the standard tests against the in-memory cache as well
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        super(MemorySuite, self).setUp()
+
+        self._cache = MemoryParseCache()
+
+    # ----------------------------------------------------------------------
+    def test_CorruptEntry(self):
+        # Entries are never written to disk
+        pass
+
+    # ----------------------------------------------------------------------
+    def test_DistinctObjects(self):
+        key = self._CreateKey()
+
+        self._cache.Save(key, [self._include_filename], [["one"], ["two"]])
+
+        result1 = self._cache.Load(key)
+        result2 = self._cache.Load(key)
+
+        self.assertEqual(result1, result2)
+        self.assertIsNot(result1[0], result2[0])
+
+    # ----------------------------------------------------------------------
+    def test_TouchedInclude(self):
+        key = self._CreateKey()
+
+        self._cache.Save(key, [self._include_filename], ["one", "two"])
+
+        # Modification time changes but content does not
+        stat = os.stat(self._include_filename)
+        os.utime(self._include_filename, (stat.st_atime, stat.st_mtime + 10))
+
+        original_includes = self._cache._entries[key][0]
+
+        self.assertEqual(self._cache.Load(key), ["one", "two"])
+
+        # The entry is replaced rather than modified in place
+        self.assertEqual(original_includes[self._include_filename][0], stat.st_mtime)
+        self.assertEqual(self._cache._entries[key][0][self._include_filename][0], os.path.getmtime(self._include_filename))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,206 @@
+# ----------------------------------------------------------------------
+# |
+# |  PassManager_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-28 11:02:51
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for PassManager.py"""
+
+import os
+import sys
+import unittest
+
+import CommonEnvironment
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..PassManager import *
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Traversals(self):
+        passes = PassManager("Test")
+
+        passes.Add("One", lambda item: None)
+        passes.Add("Two", lambda item: None)
+        passes.Add("Three", lambda item: None, ["Two"])
+        passes.Add("Four", lambda item: None, ["One"])
+        passes.Add("Five", lambda item: None, ["Three", "Four"])
+
+        self.assertEqual(
+            [[p.Name for p in traversal] for traversal in passes.CreateTraversals()],
+            [["One", "Two"], ["Three", "Four"], ["Five"]],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_InvalidDependency(self):
+        passes = PassManager("Test")
+
+        self.assertRaises(AssertionError, lambda: passes.Add("One", lambda item: None, ["Two"]))
+
+    # ----------------------------------------------------------------------
+    def test_Order(self):
+        root = _Item("root", _Item("a", _Item("a1"), _Item("a2")), _Item("b"))
+
+        visited = []
+
+        passes = PassManager("Test")
+
+        passes.Add("One", lambda item: visited.append(("One", item.name)))
+        passes.Add("Two", lambda item: visited.append(("Two", item.name)))
+        passes.Add("Three", lambda item: visited.append(("Three", item.name)), ["One"])
+
+        passes.Execute(root)
+
+        self.assertEqual(
+            visited,
+            [
+                ("One", "root"), ("Two", "root"),
+                ("One", "a"), ("Two", "a"),
+                ("One", "a1"), ("Two", "a1"),
+                ("One", "a2"), ("Two", "a2"),
+                ("One", "b"), ("Two", "b"),
+                ("Three", "root"),
+                ("Three", "a"),
+                ("Three", "a1"),
+                ("Three", "a2"),
+                ("Three", "b"),
+            ],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_AddedChildren(self):
+        root = _Item("root", _Item("a"))
+
+        visited = []
+
+        # ----------------------------------------------------------------------
+        def AddChild(item):
+            if item.name == "a":
+                item.items.insert(0, _Item("added"))
+
+        # ----------------------------------------------------------------------
+
+        passes = PassManager("Test")
+
+        passes.Add("Add", AddChild)
+        passes.Add("Visit", lambda item: visited.append(item.name))
+
+        passes.Execute(root)
+
+        self.assertEqual(visited, ["root", "a", "added"])
+
+    # ----------------------------------------------------------------------
+    def test_Errors(self):
+        root = _Item("root", _Item("a"), _Item("b"), _Item("c"))
+
+        visited = []
+
+        # ----------------------------------------------------------------------
+        def CreateFunctor(pass_name, invalid_item_names):
+            # ----------------------------------------------------------------------
+            def Impl(item):
+                visited.append((pass_name, item.name))
+
+                if item.name in invalid_item_names:
+                    raise Exception("{} {}".format(pass_name, item.name))
+
+            # ----------------------------------------------------------------------
+
+            return Impl
+
+        # ----------------------------------------------------------------------
+
+        passes = PassManager("Test")
+
+        passes.Add("One", CreateFunctor("One", ["c"]))
+        passes.Add("Two", CreateFunctor("Two", ["a", "b"]))
+        passes.Add("Three", CreateFunctor("Three", []), ["One"])
+
+        # The error is the error that would have been raised if each pass had its own traversal
+        self.assertRaisesRegex(Exception, "^One c$", lambda: passes.Execute(root))
+
+        self.assertEqual(
+            visited,
+            [
+                ("One", "root"), ("Two", "root"),
+                ("One", "a"), ("Two", "a"),
+                ("One", "b"),
+                ("One", "c"),
+            ],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Deep(self):
+        root = _Item("0")
+
+        item = root
+        for index in range(1, sys.getrecursionlimit() * 2):
+            child = _Item(str(index))
+
+            item.items.append(child)
+            item = child
+
+        visited = []
+
+        passes = PassManager("Test")
+        passes.Add("Visit", lambda item: visited.append(item.name))
+
+        passes.Execute(root)
+
+        self.assertEqual(len(visited), sys.getrecursionlimit() * 2)
+
+    # ----------------------------------------------------------------------
+    def test_Timings(self):
+        passes = PassManager("Test")
+
+        passes.Add("One", lambda item: None)
+        passes.Add("Two", lambda item: None, ["One"])
+
+        timings = {}
+
+        passes.Execute(_Item("root", _Item("a")), timings)
+
+        self.assertEqual(sorted(timings.keys()), ["Test.One", "Test.Two"])
+        self.assertTrue(all(value >= 0.0 for value in timings.values()))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _Item(object):
+    # ----------------------------------------------------------------------
+    def __init__(self, name, *items):
+        self.name                           = name
+        self.items                          = list(items)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,108 @@
+# ----------------------------------------------------------------------
+# |
+# |  PicklePath_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-28 11:02:54
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit test for PicklePath.py"""
+
+import os
+import sys
+import threading
+import unittest
+
+import CommonEnvironment
+
+from CommonEnvironmentEx.Package import InitRelativeImports
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+with InitRelativeImports():
+    from ..PicklePath import *
+    from ..PicklePath import _package_root
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Nested(self):
+        original_path = list(sys.path)
+
+        with PicklePathContext():
+            self.assertEqual(sys.path[0], _package_root)
+
+            with PicklePathContext():
+                self.assertEqual(sys.path[0], _package_root)
+                self.assertEqual(sys.path.count(_package_root), original_path.count(_package_root) + 1)
+
+            self.assertEqual(sys.path[0], _package_root)
+
+        self.assertEqual(sys.path, original_path)
+
+    # ----------------------------------------------------------------------
+    def test_Threads(self):
+        original_path = list(sys.path)
+
+        # Contexts entered and exited on different threads in an interleaved order
+        first_entered = threading.Event()
+        second_entered = threading.Event()
+        first_exited = threading.Event()
+
+        second_path = []
+
+        # ----------------------------------------------------------------------
+        def First():
+            with PicklePathContext():
+                first_entered.set()
+                second_entered.wait()
+
+            first_exited.set()
+
+        # ----------------------------------------------------------------------
+        def Second():
+            first_entered.wait()
+
+            with PicklePathContext():
+                second_entered.set()
+                first_exited.wait()
+
+                second_path.append(sys.path[0])
+
+        # ----------------------------------------------------------------------
+
+        threads = [threading.Thread(target=First), threading.Thread(target=Second)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(second_path, [_package_root])
+        self.assertEqual(sys.path, original_path)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(
+            unittest.main(
+                verbosity=2,
+            ),
+        )
+    except KeyboardInterrupt:
+        pass
@@ -14,11 +14,17 @@
 # ----------------------------------------------------------------------
 """Unit test for Populate.py"""
 
+import copy
 import os
 import sys
 import textwrap
 import unittest
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import six
+
 import CommonEnvironment
 from CommonEnvironment.Shell.All import CurrentShell
 from CommonEnvironment.TypeInfo import Arity
@@ -1236,6 +1242,201 @@ class MiscSuite(unittest.TestCase):
         )
 
 
+# ----------------------------------------------------------------------
+class ParallelSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Equivalent(self):
+        include_filename = CurrentShell.CreateTempFilename(".SimpleSchema")
+
+        with open(include_filename, "w") as f:
+            f.write(
+                textwrap.dedent(
+                    """\
+                    <included_string string>
+                    """,
+                ),
+            )
+
+        with CallOnExit(lambda: os.remove(include_filename)):
+            content = OrderedDict(
+                [
+                    (
+                        "one",
+                        textwrap.dedent(
+                            """\
+                            simple_schema_include('{}')
+
+                            simple_schema_config("test"):
+                                one = "two"
+
+                            <obj1>:
+                                <a string>
+                                <b int min=10 ?>
+                            """,
+                        ).format(include_filename),
+                    ),
+                    (
+                        "two",
+                        textwrap.dedent(
+                            """\
+                            simple_schema_config("test"):
+                                three = 4
+
+                            <obj2 obj1>:
+                                <c bool *>
+                            """,
+                        ),
+                    ),
+                    (
+                        "three",
+                        textwrap.dedent(
+                            """\
+                            simple_schema_include('{}')
+
+                            <a_string string>
+                            """,
+                        ).format(include_filename),
+                    ),
+                ],
+            )
+
+            serial_root = Populate(OrderedDict([(k, lambda v=v: v) for k, v in six.iteritems(content)]), ParseFlag.AllFlags)
+            parallel_root = Populate(OrderedDict([(k, lambda v=v: v) for k, v in six.iteritems(content)]), ParseFlag.AllFlags, max_num_workers=4)
+
+        self.assertEqual(_ToComparable(parallel_root), _ToComparable(serial_root))
+
+        self.assertEqual(list(parallel_root.config.keys()), ["test"])
+        self.assertEqual(
+            [list(metadata.Values.keys()) for metadata in parallel_root.config["test"]],
+            [["one"], ["three"]],
+        )
+
+        self.assertEqual(list(parallel_root.includes.keys()), ["one", "three"])
+        self.assertEqual([item.name for item in parallel_root.items], ["obj1", "obj2", "a_string", "included_string"])
+        self.assertTrue(all(item.Parent is parallel_root for item in parallel_root.items))
+
+    # ----------------------------------------------------------------------
+    def test_ErrorOrder(self):
+        content = OrderedDict(
+            [
+                ("valid", "<a string>"),
+                ("reserved", "<string string>"),
+                ("invalid", "<invalid"),
+            ],
+        )
+
+        for max_num_workers in [None, 4]:
+            with self.assertRaises(Exceptions.PopulateReservedNameException) as ctx:
+                Populate(OrderedDict([(k, lambda v=v: v) for k, v in six.iteritems(content)]), ParseFlag.AllFlags, max_num_workers=max_num_workers)
+
+            self.assertEqual(ctx.exception.Source, "reserved")
+
+    # ----------------------------------------------------------------------
+    def test_Threads(self):
+        # Multi-line statements rely on lexer state; ensure that lexers running concurrently
+        # don't impact each other.
+        content = [
+            textwrap.dedent(
+                """\
+                <obj{index}>:
+                    <value{index} string
+                        min_length={length}
+                    >
+                    <values{index} int
+                        min=0
+                        max={length}
+                        *
+                    >
+                    [attr{index} bool]
+                """,
+            ).format(
+                index=index,
+                length=index + 1,
+            )
+            for index in range(100)
+        ]
+
+        serial_results = [_ToComparable(_Invoke(c)) for c in content]
+
+        with ThreadPoolExecutor(8) as executor:
+            threaded_results = list(executor.map(lambda c: _ToComparable(_Invoke(c)), content))
+
+        self.assertEqual(threaded_results, serial_results)
+
+
+# ----------------------------------------------------------------------
+class PopulateCacheSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_UsedFlags(self):
+        root = _Invoke(
+            textwrap.dedent(
+                """\
+                <obj>:
+                    <a string>
+                """,
+            ),
+        )
+
+        self.assertEqual(
+            root.used_flags,
+            set(
+                [
+                    ParseFlag.SupportNamedObjects,
+                    ParseFlag.SupportRootObjects,
+                    ParseFlag.SupportNamedDeclarations,
+                    ParseFlag.SupportChildDeclarations,
+                ],
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Shared(self):
+        cache = PopulateCache()
+
+        content = {"content": lambda: "<a string>"}
+
+        root1 = cache.Populate(content, ParseFlag.AllFlags)
+        root2 = cache.Populate(content, ParseFlag.SupportNamedDeclarations | ParseFlag.SupportRootDeclarations)
+
+        self.assertEqual(_ToComparable(root1), _ToComparable(_Invoke("<a string>")))
+        self.assertEqual(_ToComparable(root1), _ToComparable(root2))
+        self.assertIsNot(root1, root2)
+        self.assertIsNot(root1.items[0], root2.items[0])
+
+    # ----------------------------------------------------------------------
+    def test_UnsupportedFlags(self):
+        cache = PopulateCache()
+
+        content = {"content": lambda: "<a string>"}
+
+        cache.Populate(content, ParseFlag.AllFlags)
+
+        self.assertRaises(
+            Exceptions.PopulateUnsupportedRootDeclarationsException,
+            lambda: cache.Populate(content, ParseFlag.SupportNamedDeclarations),
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Threads(self):
+        cache = PopulateCache()
+
+        content = ["<a{} string>".format(index % 10) for index in range(50)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda c: _ToComparable(cache.Populate({"content": lambda: c}, ParseFlag.AllFlags)), content))
+
+        self.assertEqual(results, [_ToComparable(_Invoke(c)) for c in content])
+
+    # ----------------------------------------------------------------------
+    def test_DeepCopy(self):
+        # The cache is passed to the code generator as metadata, which is deep copied
+        cache = PopulateCache()
+
+        self.assertIs(copy.deepcopy({"populate_cache": cache})["populate_cache"], cache)
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -1246,6 +1447,19 @@ def _Invoke(
     return Populate({"content": lambda: content}, parse_flags)
 
 
+# ----------------------------------------------------------------------
+def _ToComparable(item):
+    return (
+        item.name,
+        item.Source,
+        item.Line,
+        item.Column,
+        item.IsExternal,
+        item.references,
+        [_ToComparable(child) for child in item.items],
+    )
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -34,6 +34,7 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 with InitRelativeImports():
     from ..Item import *
     from ..Resolve import *
+    from ..Resolve import _IsSimple
 
     from ... import Exceptions
 
@@ -228,6 +229,85 @@ class ReferenceSuite(unittest.TestCase):
         self.assertRaises(Exceptions.ResolveInvalidReferenceException, lambda: Resolve(parent, _CreatePlugin()))
 
 
+# ----------------------------------------------------------------------
+class IsSimpleSuite(unittest.TestCase):
+    # ----------------------------------------------------------------------
+    def test_SelfReference(self):
+        item = _CreateItem()
+        item.references = [item]
+
+        self.assertFalse(_IsSimple({}, item))
+
+        item.references = [item, Attributes.FUNDAMENTAL_ATTRIBUTE_INFO_MAP["string"]]
+
+        self.assertTrue(_IsSimple({}, item))
+
+    # ----------------------------------------------------------------------
+    def test_MutualReference(self):
+        item1 = _CreateItem()
+        item2 = _CreateItem()
+
+        item1.references = [item2]
+        item2.references = [item1]
+
+        cache = {}
+
+        self.assertFalse(_IsSimple(cache, item1))
+        self.assertEqual(cache, {item1: False, item2: False})
+
+        item2.references.append(Attributes.FUNDAMENTAL_ATTRIBUTE_INFO_MAP["int"])
+
+        cache = {}
+
+        self.assertTrue(_IsSimple(cache, item1))
+        self.assertEqual(cache, {item1: True, item2: True})
+
+    # ----------------------------------------------------------------------
+    def test_ComponentResults(self):
+        # item1 -> item2 -> item3 -> item1 is a cycle; item4 references the cycle and
+        # item3 references item5, which references a fundamental type.
+        items = [_CreateItem() for _ in range(5)]
+
+        items[0].references = [items[1]]
+        items[1].references = [items[2]]
+        items[2].references = [items[0], items[4]]
+        items[3].references = [items[0]]
+        items[4].references = [Attributes.FUNDAMENTAL_ATTRIBUTE_INFO_MAP["bool"]]
+
+        # The results are the same regardless of which item is processed first
+        for item in items:
+            cache = {}
+
+            self.assertTrue(_IsSimple(cache, item))
+
+            for cached_item, result in six.iteritems(cache):
+                self.assertTrue(result, cached_item)
+
+            if item is not items[3] and item is not items[4]:
+                self.assertEqual(set(cache), set([items[0], items[1], items[2], items[4]]))
+
+    # ----------------------------------------------------------------------
+    def test_ComponentCache(self):
+        items = [_CreateItem() for _ in range(3)]
+
+        items[0].references = [items[1]]
+        items[1].references = [items[2]]
+        items[2].references = [items[0], Attributes.FUNDAMENTAL_ATTRIBUTE_INFO_MAP["string"]]
+
+        cache = {}
+
+        self.assertTrue(_IsSimple(cache, items[0]))
+
+        # The result for every item in the component was cached when the first item
+        # was processed, so the references aren't visited again.
+        items[2].references = [items[0]]
+
+        self.assertTrue(_IsSimple(cache, items[1]))
+        self.assertTrue(_IsSimple(cache, items[2]))
+
+        self.assertFalse(_IsSimple({}, items[1]))
+
+
 # ----------------------------------------------------------------------
 class MetadataSuite(unittest.TestCase):
     # ----------------------------------------------------------------------
@@ -16,6 +16,7 @@
 
 import os
 import sys
+import textwrap
 import unittest
 
 import CommonEnvironment
@@ -30,6 +31,104 @@ with InitRelativeImports():
     from ..Validate import *
 
     from ... import Exceptions
+    from ...Parse import ParseStrings
+
+    from ....Plugin import ParseFlag
+
+# ----------------------------------------------------------------------
+class ErrorOrderSuite(unittest.TestCase):
+    """\
+    All validations are performed in a single traversal, but errors are reported as if
+    each validation was performed in its own traversal: the first error reported by the
+    first validation (in the order that the validations are listed in `Validate`).
+    """
+
+    # ----------------------------------------------------------------------
+    def test_SupportedBeforeUniqueNamesAndMetadata(self):
+        self.assertRaises(
+            Exceptions.ValidateUnsupportedAnyElementsException,
+            lambda: _Parse(
+                textwrap.dedent(
+                    """\
+                    <a string foo="bar">
+                    <b string>
+                    <b int>
+                    <c any>
+                    """,
+                ),
+                flags=ParseFlag.AllFlags & ~ParseFlag.SupportAnyElements,
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def test_UniqueNamesBeforeMetadata(self):
+        self.assertRaises(
+            Exceptions.ValidateDuplicateNameException,
+            lambda: _Parse(
+                textwrap.dedent(
+                    """\
+                    <a string foo="bar">
+                    <b string>
+                    <b int>
+                    """,
+                ),
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def test_FirstItem(self):
+        with self.assertRaises(Exceptions.ValidateExtraneousAttributeException) as ctx:
+            _Parse(
+                textwrap.dedent(
+                    """\
+                    <a string>
+                    <b string foo="bar">
+                    <c string baz="biz">
+                    """,
+                ),
+            )
+
+        self.assertEqual(ctx.exception.Line, 2)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Parse(content, flags=ParseFlag.AllFlags):
+    # ----------------------------------------------------------------------
+    class Plugin(object):
+        Name                                = "Plugin"
+        Flags                               = flags
+
+        # ----------------------------------------------------------------------
+        @staticmethod
+        def VerifyFlags():
+            pass
+
+        # ----------------------------------------------------------------------
+        @staticmethod
+        def GetRequiredMetadataItems(item):
+            return []
+
+        # ----------------------------------------------------------------------
+        @staticmethod
+        def GetOptionalMetadataItems(item):
+            return []
+
+        # ----------------------------------------------------------------------
+        @staticmethod
+        def GetExtensions():
+            return []
+
+    # ----------------------------------------------------------------------
+
+    return ParseStrings(
+        {"filename": content},
+        Plugin,
+        False,
+        False,
+    )
+
 
 # -------------------------- --------------------------------------------
 # ----------------------------------------------------------------------
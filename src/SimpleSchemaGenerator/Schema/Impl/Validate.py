@@ -33,6 +33,7 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 
 with InitRelativeImports():
     from .Item import Item
+    from .PassManager import PassManager
 
     from .. import Attributes
     from .. import Elements
@@ -41,27 +42,30 @@ with InitRelativeImports():
     from ...Plugin import ParseFlag
 
 # ----------------------------------------------------------------------
-def Validate(root, plugin, filter_unsupported_extensions, filter_unsupported_metadata):
-    # ----------------------------------------------------------------------
-    def Impl(item, functor):
-        functor(item)
-
-        for child in item.items:
-            Impl(child, functor)
-
-    # ----------------------------------------------------------------------
-
+def Validate(
+    root,
+    plugin,
+    filter_unsupported_extensions,
+    filter_unsupported_metadata,
+    timings=None,                           # { "Validate.<pass name>" : <seconds>, ... }
+):
     extension_names = {ext.Name for ext in plugin.GetExtensions()}
     extensions_allowing_duplicate_names = {ext.Name for ext in plugin.GetExtensions() if ext.AllowDuplicates}
 
-    Impl(root, lambda item: _ValidateSupported(plugin.Flags, item))
-    Impl(root, lambda item: _ValidateUniqueNames(extensions_allowing_duplicate_names, item))
-    Impl(root, _ValidateAttributeArity)
-    Impl(root, _ValidateVariantArity)
-    Impl(root, lambda item: _ValidateMetadata(filter_unsupported_metadata, item))
-    Impl(root, _ValidateSimpleElements)
-    Impl(root, lambda item: _ValidateExtension(filter_unsupported_extensions, extension_names, item))
-    Impl(root, _ValidateReference)
+    # None of these validations rely upon the results of another validation on a
+    # different item, so they are all performed during a single traversal.
+    passes = PassManager("Validate")
+
+    passes.Add("Supported", lambda item: _ValidateSupported(plugin.Flags, item))
+    passes.Add("UniqueNames", lambda item: _ValidateUniqueNames(extensions_allowing_duplicate_names, item))
+    passes.Add("AttributeArity", _ValidateAttributeArity)
+    passes.Add("VariantArity", _ValidateVariantArity)
+    passes.Add("Metadata", lambda item: _ValidateMetadata(filter_unsupported_metadata, item))
+    passes.Add("SimpleElements", _ValidateSimpleElements)
+    passes.Add("Extension", lambda item: _ValidateExtension(filter_unsupported_extensions, extension_names, item))
+    passes.Add("Reference", _ValidateReference)
+
+    passes.Execute(root, timings)
 
     return root
 
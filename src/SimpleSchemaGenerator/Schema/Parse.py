@@ -33,33 +33,73 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
 # ----------------------------------------------------------------------
-def ParseFiles(filenames, plugin, filter_unsupported_extensions, filter_unsupported_attributes):
+def ParseFiles(filenames, plugin, filter_unsupported_extensions, filter_unsupported_attributes, cache=None, max_num_workers=None, populate_cache=None, timings=None, include_filenames=None):
     file_map = OrderedDict()
 
     for filename in filenames:
         file_map[filename] = lambda filename=filename: open(filename).read()
 
-    return ParseEx(file_map, plugin, filter_unsupported_extensions, filter_unsupported_attributes)
+    return ParseEx(file_map, plugin, filter_unsupported_extensions, filter_unsupported_attributes, cache=cache, max_num_workers=max_num_workers, populate_cache=populate_cache, timings=timings, include_filenames=include_filenames)
 
 
 # ----------------------------------------------------------------------
-def ParseStrings(named_strings, plugin, filter_unsupported_extensions, filter_unsupported_attributes): # { "<name>" : "<content>", ... }
+def ParseStrings(named_strings, plugin, filter_unsupported_extensions, filter_unsupported_attributes, cache=None, max_num_workers=None, populate_cache=None, timings=None, include_filenames=None): # { "<name>" : "<content>", ... }
     string_map = OrderedDict()
 
     for k, v in six.iteritems(named_strings):
         string_map[k] = lambda v=v: v
 
-    return ParseEx(string_map, plugin, filter_unsupported_extensions, filter_unsupported_attributes)
+    return ParseEx(string_map, plugin, filter_unsupported_extensions, filter_unsupported_attributes, cache=cache, max_num_workers=max_num_workers, populate_cache=populate_cache, timings=timings, include_filenames=include_filenames)
 
 
 # ----------------------------------------------------------------------
-def ParseEx(source_name_content_generators, plugin, filter_unsupported_extensions, filter_unsupported_attributes): # { "<name>" : def Func() -> content }
+def ParseEx(
+    source_name_content_generators,         # { "<name>" : def Func() -> content }
+    plugin,
+    filter_unsupported_extensions,
+    filter_unsupported_attributes,
+    cache=None,                             # ParseCache instance
+    max_num_workers=None,                   # Lex and parse files in a process pool when > 1
+    populate_cache=None,                    # PopulateCache instance shared across plugins
+    timings=None,                           # { "<stage>.<pass name>" : <seconds>, ... }; populated with the time spent in each Resolve and Validate pass
+    include_filenames=None,                 # [ "<filename>", ... ]; populated with the files included (directly or indirectly) by the sources
+):
     plugin.VerifyFlags()
 
-    root = Populate(source_name_content_generators, plugin.Flags)
-    root = Resolve(root, plugin)
+    if cache is not None:
+        # Read the content once, as it is needed to calculate the cache key
+        source_name_content_map = OrderedDict(
+            [(k, v()) for k, v in six.iteritems(source_name_content_generators)],
+        )
 
-    root = Validate(root, plugin, filter_unsupported_extensions, filter_unsupported_attributes)
+        cache_key = cache.CreateKey(source_name_content_map, plugin, filter_unsupported_extensions, filter_unsupported_attributes)
+
+        elements = cache.Load(
+            cache_key,
+            include_filenames=include_filenames,
+        )
+        if elements is not None:
+            return elements
+
+        source_name_content_generators = OrderedDict(
+            [(k, lambda v=v: v) for k, v in six.iteritems(source_name_content_map)],
+        )
+
+    if populate_cache is not None:
+        root = populate_cache.Populate(source_name_content_generators, plugin.Flags, max_num_workers=max_num_workers)
+    else:
+        root = Populate(source_name_content_generators, plugin.Flags, max_num_workers=max_num_workers)
+
+    populated_include_filenames = []
+
+    for filenames in six.itervalues(root.includes):
+        for include_filename in filenames:
+            if include_filename not in source_name_content_generators and include_filename not in populated_include_filenames:
+                populated_include_filenames.append(include_filename)
+
+    root = Resolve(root, plugin, timings=timings)
+
+    root = Validate(root, plugin, filter_unsupported_extensions, filter_unsupported_attributes, timings=timings)
 
     root = Transform(root, plugin)
 
@@ -67,4 +107,10 @@ def ParseEx(source_name_content_generators, plugin, filter_unsupported_extension
     for child in root.Children:
         child.Parent = None
 
+    if cache is not None:
+        cache.Save(cache_key, populated_include_filenames, root.Children)
+
+    if include_filenames is not None:
+        include_filenames += populated_include_filenames
+
     return root.Children
@@ -14,13 +14,18 @@
 # ----------------------------------------------------------------------
 """Process a SimpleSchema file using the specified generator."""
 
+import json
 import os
 import re
+import socket
 import sys
 import textwrap
+import threading
+import time
+
 
 import six
-from six.moves import cPickle as pickle
+from six.moves import socketserver
 
 import CommonEnvironment
 from CommonEnvironment.CallOnExit import CallOnExit
@@ -36,12 +41,19 @@ _script_dir, _script_name                   = os.path.split(_script_fullpath)
 
 with InitRelativeImports():
     from .Schema.Parse import ParseFiles
+    from .Schema.Impl.Fingerprint import CalculateFingerprint
+    from .Schema.Impl.ParseCache import ParseCache, MemoryParseCache
+    from .Schema.Impl.Populate import PopulateCache
+    from .SimpleSchemaGeneratorClient import GetSocketPath
 
 # ----------------------------------------------------------------------
 PLUGINS                                     = GeneratorFactory.CreatePluginMap("DEVELOPMENT_ENVIRONMENT_SIMPLE_SCHEMA_PLUGINS", os.path.join(_script_dir, "Plugins"), sys.stdout)
 
 _PluginTypeInfo                             = CommandLine.EnumTypeInfo(list(six.iterkeys(PLUGINS)))
 
+# Set when running as a server (see `Serve`)
+_memory_parse_cache                         = None
+
 # ----------------------------------------------------------------------
 def _GetOptionalMetadata(*args, **kwargs):
     return __GetOptionalMetadata(*args, **kwargs)
@@ -68,6 +80,9 @@ CodeGenerator                               = GeneratorFactory.CodeGeneratorFact
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint(
     plugin=CommandLine.EntryPoint.Parameter("Name of plugin used for generation"),
+    additional_plugin=CommandLine.EntryPoint.Parameter(
+        "Name of additional plugins used for generation; the input is parsed once and the plugins are invoked in order. The plugin name is appended to the output data filename prefix when multiple plugins are provided",
+    ),
     output_name=CommandLine.EntryPoint.Parameter("Output name used during generation; the way in which this value impacts generated output varies from plugin to plugin"),
     output_dir=CommandLine.EntryPoint.Parameter("Output directory used during generation; the way in which this value impacts generated output varies from plugin to plugin"),
     input=CommandLine.EntryPoint.Parameter("SimpleSchema input filename or a directory containing SimpleSchema files"),
@@ -79,11 +94,19 @@ CodeGenerator                               = GeneratorFactory.CodeGeneratorFact
     filter_unsupported_extensions=CommandLine.EntryPoint.Parameter("Ignore extensions that aren't supported; by default, unsupported extensions will generate an error"),
     filter_unsupported_attributes=CommandLine.EntryPoint.Parameter("Ignore element attributes that aren't supported; by default, unsupported attributes will generate an error"),
     plugin_arg=CommandLine.EntryPoint.Parameter("Argument passes directly to the plugin"),
+    parse_cache_dir=CommandLine.EntryPoint.Parameter(
+        "Directory used to cache parsed SimpleSchema content; inputs (and their includes) that haven't changed since the last invocation are loaded from the cache rather than parsed",
+    ),
+    max_parse_workers=CommandLine.EntryPoint.Parameter("Lex and parse input files in a pool of this many processes; by default, files are parsed serially"),
     force=CommandLine.EntryPoint.Parameter("Force generation"),
     verbose=CommandLine.EntryPoint.Parameter("Generate verbose output during generation"),
 )
 @CommandLine.Constraints(
     plugin=_PluginTypeInfo,
+    additional_plugin=CommandLine.EnumTypeInfo(
+        list(six.iterkeys(PLUGINS)),
+        arity="*",
+    ),
     output_name=CommandLine.StringTypeInfo(),
     output_dir=CommandLine.DirectoryTypeInfo(
         ensure_exists=False,
@@ -105,6 +128,14 @@ CodeGenerator                               = GeneratorFactory.CodeGeneratorFact
         require_exact_match=False,
         arity="*",
     ),
+    parse_cache_dir=CommandLine.DirectoryTypeInfo(
+        ensure_exists=False,
+        arity="?",
+    ),
+    max_parse_workers=CommandLine.IntTypeInfo(
+        min=1,
+        arity="?",
+    ),
     output_stream=None,
 )
 def Generate(
@@ -115,30 +146,35 @@ def Generate(
     include=None,
     exclude=None,
     output_data_filename_prefix=None,
+    additional_plugin=None,
     filter_unsupported_extensions=False,
     filter_unsupported_attributes=False,
     plugin_arg=None,
+    parse_cache_dir=None,
+    max_parse_workers=None,
     force=False,
     output_stream=sys.stdout,
     verbose=False,
 ):
-    """Generates content for the given SimpleSchema(s) using the named plugin"""
+    """Generates content for the given SimpleSchema(s) using the named plugin(s)"""
 
-    return GeneratorFactory.CommandLineGenerate(
-        CodeGenerator,
+    return __Generate(
+        plugin,
+        output_name,
+        output_dir,
         input,
-        output_stream,
-        verbose,
-        plugin_name=plugin,
-        output_name=output_name,
-        output_dir=output_dir,
-        plugin_settings=plugin_arg,
-        force=force,
-        includes=include,
-        excludes=exclude,
+        include=include,
+        exclude=exclude,
+        output_data_filename_prefix=output_data_filename_prefix,
+        additional_plugin=additional_plugin,
         filter_unsupported_extensions=filter_unsupported_extensions,
         filter_unsupported_attributes=filter_unsupported_attributes,
-        output_data_filename_prefix=output_data_filename_prefix,
+        plugin_arg=plugin_arg,
+        parse_cache_dir=parse_cache_dir,
+        max_parse_workers=max_parse_workers,
+        force=force,
+        output_stream=output_stream,
+        verbose=verbose,
     )
 
 
@@ -159,6 +195,248 @@ def Clean(
     return GeneratorFactory.CommandLineClean(output_dir, output_stream)
 
 
+# ----------------------------------------------------------------------
+@CommandLine.EntryPoint(
+    plugin=CommandLine.EntryPoint.Parameter("Name of plugin used for generation"),
+    output_dir=CommandLine.EntryPoint.Parameter("Output directory used during generation; the way in which this value impacts generated output varies from plugin to plugin"),
+    input=CommandLine.EntryPoint.Parameter("SimpleSchema input filename or a directory containing SimpleSchema files"),
+    include=CommandLine.EntryPoint.Parameter("Elements names to explicitly include; other elements are ignored"),
+    exclude=CommandLine.EntryPoint.Parameter("Element names to explicitly exclude; other elements are processed"),
+    output_data_filename_prefix=CommandLine.EntryPoint.Parameter(
+        "Prefix used by the code generation implementation; the name of each SimpleSchema file is appended to this value",
+    ),
+    filter_unsupported_extensions=CommandLine.EntryPoint.Parameter("Ignore extensions that aren't supported; by default, unsupported extensions will generate an error"),
+    filter_unsupported_attributes=CommandLine.EntryPoint.Parameter("Ignore element attributes that aren't supported; by default, unsupported attributes will generate an error"),
+    plugin_arg=CommandLine.EntryPoint.Parameter("Argument passes directly to the plugin"),
+    poll_interval=CommandLine.EntryPoint.Parameter("Number of seconds to wait between checks for modified files"),
+    force=CommandLine.EntryPoint.Parameter("Force generation during the initial invocation"),
+    verbose=CommandLine.EntryPoint.Parameter("Generate verbose output during generation"),
+)
+@CommandLine.Constraints(
+    plugin=_PluginTypeInfo,
+    output_dir=CommandLine.DirectoryTypeInfo(
+        ensure_exists=False,
+    ),
+    input=CommandLine.FilenameTypeInfo(
+        match_any=True,
+        arity="+",
+    ),
+    include=CommandLine.StringTypeInfo(
+        arity="*",
+    ),
+    exclude=CommandLine.StringTypeInfo(
+        arity="*",
+    ),
+    output_data_filename_prefix=CommandLine.StringTypeInfo(
+        arity="?",
+    ),
+    plugin_arg=CommandLine.DictTypeInfo(
+        require_exact_match=False,
+        arity="*",
+    ),
+    poll_interval=CommandLine.FloatTypeInfo(
+        min=0.0,
+        arity="?",
+    ),
+    output_stream=None,
+)
+def Watch(
+    plugin,
+    output_dir,
+    input,
+    include=None,
+    exclude=None,
+    output_data_filename_prefix=None,
+    filter_unsupported_extensions=False,
+    filter_unsupported_attributes=False,
+    plugin_arg=None,
+    poll_interval=1.0,
+    force=False,
+    output_stream=sys.stdout,
+    verbose=False,
+):
+    """\
+    Generates content for each SimpleSchema file and regenerates that content when the file
+    or any of the files that it includes change. Each SimpleSchema file is generated
+    independently, using the name of the file as the output name.
+    """
+
+    # { "<schema filename>" : [ "<filename>", ... ], ... }
+    dependencies = {}
+
+    # { "<filename>" : <mtime>, ... }
+    mtimes = {}
+
+    # ----------------------------------------------------------------------
+    def EnumerateSchemas():
+        schemas = []
+
+        for filename_or_dir in input:
+            if os.path.isfile(filename_or_dir):
+                schemas.append(os.path.realpath(filename_or_dir))
+                continue
+
+            for root, _, filenames in os.walk(filename_or_dir):
+                for filename in filenames:
+                    if filename.endswith(".SimpleSchema"):
+                        schemas.append(os.path.realpath(os.path.join(root, filename)))
+
+        return sorted(set(schemas))
+
+    # ----------------------------------------------------------------------
+    def GetMTime(filename):
+        try:
+            return os.path.getmtime(filename)
+        except (IOError, OSError):
+            return None
+
+    # ----------------------------------------------------------------------
+    def Regenerate(schema_filename, force):
+        output_name = os.path.splitext(os.path.basename(schema_filename))[0]
+
+        output_stream.write("Generating '{}'...\n".format(schema_filename))
+
+        # Collect the dependencies from the parse performed during generation
+        include_filenames = _IncludeFilenames()
+
+        result = __Generate(
+            plugin,
+            output_name,
+            output_dir,
+            [schema_filename],
+            include=include,
+            exclude=exclude,
+            output_data_filename_prefix="{}{}".format(output_data_filename_prefix or "", output_name),
+            filter_unsupported_extensions=filter_unsupported_extensions,
+            filter_unsupported_attributes=filter_unsupported_attributes,
+            plugin_arg=plugin_arg,
+            force=force,
+            output_stream=output_stream,
+            verbose=verbose,
+            parse_include_filenames=include_filenames,
+        )
+
+        # Update the dependencies; if the file can't be parsed, keep the previous dependencies
+        # so that changes to those files continue to be monitored.
+        if result != 0 and not include_filenames:
+            include_filenames = dependencies.get(schema_filename, [])[1:]
+
+        dependencies[schema_filename] = [schema_filename] + include_filenames
+
+        for filename in dependencies[schema_filename]:
+            if filename not in mtimes:
+                mtimes[filename] = GetMTime(filename)
+
+    # ----------------------------------------------------------------------
+
+    for schema_filename in EnumerateSchemas():
+        mtimes[schema_filename] = GetMTime(schema_filename)
+        Regenerate(schema_filename, force)
+
+    output_stream.write("\nWatching for changes (press Ctrl+C to exit)...\n")
+
+    try:
+        while True:
+            time.sleep(poll_interval)
+
+            schemas = EnumerateSchemas()
+
+            # Remove schemas that no longer exist
+            for schema_filename in list(six.iterkeys(dependencies)):
+                if schema_filename not in schemas:
+                    del dependencies[schema_filename]
+
+            # Detect changes
+            changed_filenames = set()
+
+            for filename, mtime in list(six.iteritems(mtimes)):
+                current_mtime = GetMTime(filename)
+
+                if current_mtime != mtime:
+                    mtimes[filename] = current_mtime
+                    changed_filenames.add(filename)
+
+            for schema_filename in schemas:
+                if schema_filename not in dependencies:
+                    mtimes[schema_filename] = GetMTime(schema_filename)
+                elif not changed_filenames.intersection(dependencies[schema_filename]):
+                    continue
+
+                Regenerate(schema_filename, False)
+
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+# ----------------------------------------------------------------------
+@CommandLine.EntryPoint(
+    socket_path=CommandLine.EntryPoint.Parameter("Unix domain socket used to receive requests; the default value can be overridden by the SIMPLE_SCHEMA_GENERATOR_SOCKET environment variable"),
+)
+@CommandLine.Constraints(
+    socket_path=CommandLine.StringTypeInfo(
+        arity="?",
+    ),
+    output_stream=None,
+)
+def Serve(
+    socket_path=None,
+    output_stream=sys.stdout,
+):
+    """\
+    Processes Generate and Clean requests sent by SimpleSchemaGeneratorClient.py until
+    shutdown. Plugins and parsed content are kept in memory across requests.
+    """
+
+    global _memory_parse_cache
+
+    if _Server is None:
+        raise Exception("Unix domain sockets are not supported on this platform")
+
+    socket_path = socket_path or GetSocketPath()
+
+    if os.path.exists(socket_path):
+        # Don't take the socket from a server that is still running
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        with CallOnExit(connection.close):
+            try:
+                connection.connect(socket_path)
+                is_running = True
+            except (IOError, OSError):
+                is_running = False
+
+        if is_running:
+            raise Exception("A SimpleSchemaGenerator server is already running at '{}'".format(socket_path))
+
+        os.remove(socket_path)
+
+    _memory_parse_cache = MemoryParseCache()
+
+    # Requests write to arbitrary locations on behalf of the client, so only the owner
+    # can connect to the socket.
+    original_umask = os.umask(0o177)
+    with CallOnExit(lambda: os.umask(original_umask)):
+        server = _Server(socket_path, _RequestHandler)
+
+    os.chmod(socket_path, 0o600)
+
+    server.output_stream = output_stream
+
+    output_stream.write("Listening on '{}'...\n".format(socket_path))
+
+    with CallOnExit(lambda: os.remove(socket_path) if os.path.exists(socket_path) else None):
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    return 0
+
+
 # ----------------------------------------------------------------------
 def CommandLineSuffix():
     return textwrap.dedent(
@@ -173,6 +451,190 @@ def CommandLineSuffix():
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if hasattr(socketserver, "UnixStreamServer"):
+    # ----------------------------------------------------------------------
+    class _Server(socketserver.UnixStreamServer):
+        # Requests are processed serially, as each request changes the working directory
+        # of the process.
+        pass
+
+else:
+    _Server                                 = None
+
+
+# ----------------------------------------------------------------------
+class _RequestHandler(socketserver.StreamRequestHandler):
+    # ----------------------------------------------------------------------
+    def handle(self):
+        request = json.loads(self.rfile.readline().decode("utf-8"))
+        command = request["command"]
+
+        self.server.output_stream.write("{} ({})\n".format(command, request["cwd"]))
+
+        if command == "Shutdown":
+            # shutdown blocks until serve_forever completes, so it must be called on
+            # a different thread.
+            threading.Thread(target=self.server.shutdown).start()
+
+            self._Send(result=0)
+            return
+
+        if command == "Generate":
+            func = Generate
+        elif command == "Clean":
+            func = Clean
+        else:
+            self._Send(error="'{}' is not a valid command".format(command))
+            return
+
+        # ----------------------------------------------------------------------
+        class OutputStream(object):
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def write(content):
+                self._Send(output=content)
+
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def flush():
+                pass
+
+            # ----------------------------------------------------------------------
+            @staticmethod
+            def isatty():
+                return False
+
+        # ----------------------------------------------------------------------
+
+        if not os.path.isdir(request["cwd"]):
+            self._Send(error="'{}' is not a valid directory".format(request["cwd"]))
+            return
+
+        original_dir = os.getcwd()
+
+        os.chdir(request["cwd"])
+        with CallOnExit(lambda: os.chdir(original_dir)):
+            # Validate the args in the same way as args provided on the command line (relative
+            # filenames are validated against the client's working directory).
+            parameters = {parameter.Name: parameter for parameter in CommandLine.EntryPointInformation.FromFunction(func).Parameters}
+
+            for k, v in six.iteritems(request["args"]):
+                parameter = parameters.get(k, None)
+                if parameter is None:
+                    self._Send(error="'{}' is not a valid argument".format(k))
+                    return
+
+                result = parameter.TypeInfo.ValidateNoThrow(v)
+                if result is not None:
+                    self._Send(error="Validation for the arg '{}' failed - {}".format(k, result))
+                    return
+
+            try:
+                result = func(
+                    output_stream=OutputStream(),
+                    **request["args"]
+                )
+            except Exception as ex:
+                self._Send(error=str(ex))
+                return
+
+        self._Send(result=result)
+
+    # ----------------------------------------------------------------------
+    def _Send(self, **kwargs):
+        self.wfile.write((json.dumps(kwargs) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+# ----------------------------------------------------------------------
+class _IncludeFilenames(list):
+    """\
+    Populated with the files included by the parsed inputs. The code generator deep copies
+    the metadata it receives, so copies return this object to ensure that the caller sees
+    the filenames.
+    """
+
+    # ----------------------------------------------------------------------
+    def __deepcopy__(self, memo):
+        return self
+
+
+# ----------------------------------------------------------------------
+def __Generate(
+    plugin,
+    output_name,
+    output_dir,
+    input,
+    include=None,
+    exclude=None,
+    output_data_filename_prefix=None,
+    additional_plugin=None,
+    filter_unsupported_extensions=False,
+    filter_unsupported_attributes=False,
+    plugin_arg=None,
+    parse_cache_dir=None,
+    max_parse_workers=None,
+    force=False,
+    output_stream=sys.stdout,
+    verbose=False,
+    parse_include_filenames=None,           # _IncludeFilenames
+):
+    plugins = [plugin] + (additional_plugin or [])
+
+    # ----------------------------------------------------------------------
+    def Impl(plugin, output_stream, output_data_filename_prefix, populate_cache):
+        return GeneratorFactory.CommandLineGenerate(
+            CodeGenerator,
+            input,
+            output_stream,
+            verbose,
+            plugin_name=plugin,
+            output_name=output_name,
+            output_dir=output_dir,
+            plugin_settings=plugin_arg,
+            force=force,
+            includes=include,
+            excludes=exclude,
+            filter_unsupported_extensions=filter_unsupported_extensions,
+            filter_unsupported_attributes=filter_unsupported_attributes,
+            output_data_filename_prefix=output_data_filename_prefix,
+            parse_cache_dir=parse_cache_dir,
+            max_parse_workers=max_parse_workers,
+            populate_cache=populate_cache,
+            parse_include_filenames=parse_include_filenames,
+        )
+
+    # ----------------------------------------------------------------------
+
+    if len(plugins) == 1:
+        return Impl(plugin, output_stream, output_data_filename_prefix, None)
+
+    # Populate is shared across plugins; the remaining stages depend on the plugin and are
+    # invoked for each. Plugins are invoked serially, as plugins and the code generator
+    # maintain class-level state during generation.
+    populate_cache = PopulateCache()
+
+    result = 0
+
+    for plugin in plugins:
+        output_stream.write("{}:\n".format(plugin))
+
+        plugin_result = Impl(
+            plugin,
+            output_stream,
+            "{}{}".format(output_data_filename_prefix or "", plugin),
+            populate_cache,
+        )
+
+        output_stream.write("\n")
+
+        if plugin_result != 0 and result == 0:
+            result = plugin_result
+
+    return result
+
+
 # ----------------------------------------------------------------------
 def __GetOptionalMetadata():
     return [
@@ -181,12 +643,37 @@ def __GetOptionalMetadata():
         ("filter_unsupported_extensions", False),
         ("filter_unsupported_attributes", False),
         ("output_data_filename_prefix", None),
+        ("parse_cache_dir", None),
+        ("max_parse_workers", None),
+        ("populate_cache", None),
+        ("parse_include_filenames", None),
     ]
 
 
 # ----------------------------------------------------------------------
 def __CreateContext(context, plugin):
-    elements = ParseFiles(context["inputs"], plugin, context["filter_unsupported_extensions"], context["filter_unsupported_attributes"])
+    # The caches, number of workers and list of included files don't impact the generated
+    # content, so they shouldn't be a part of the context used to detect changes.
+    parse_cache_dir = context["parse_cache_dir"]
+    max_parse_workers = context["max_parse_workers"]
+    populate_cache = context["populate_cache"]
+    parse_include_filenames = context["parse_include_filenames"]
+
+    del context["parse_cache_dir"]
+    del context["max_parse_workers"]
+    del context["populate_cache"]
+    del context["parse_include_filenames"]
+
+    elements = ParseFiles(
+        context["inputs"],
+        plugin,
+        context["filter_unsupported_extensions"],
+        context["filter_unsupported_attributes"],
+        cache=_memory_parse_cache or (ParseCache(parse_cache_dir) if parse_cache_dir else None),
+        max_num_workers=max_parse_workers,
+        populate_cache=populate_cache,
+        include_filenames=parse_include_filenames,
+    )
 
     # Calculate the include indexes
     includes = [re.compile("^{}$".format(include)) for include in context["includes"]]
@@ -205,16 +692,10 @@ def __CreateContext(context, plugin):
 
     # This is a bit strange, but to detect changes, we need to compare the data in the elements rather
     # than the elements themselves (as the elements will be different object instances during each invocation).
-    # Therefore, save the data (via pickling) and remove the elements. During the invocation below, we will
-    # deserialize the elements from the pickled data before invoking the plugin's Generate method.
-
-    # Note that pickling requires a fully qualified name, which is one level higher
-    # than the current dir. Add that path.
-    #
-    # Note that this doesn't feel right; there is probably a better way to do this.
-    sys.path.insert(0, os.path.join(_script_dir, ".."))
-    with CallOnExit(lambda: sys.path.pop(0)):
-        context["pickled_elements"] = pickle.dumps(elements)
+    # Therefore, save a fingerprint of the data in the context and make the elements themselves available
+    # to the plugin separately.
+    context["elements_fingerprint"] = CalculateFingerprint(elements)
+    plugin.SetContextElements(context, elements)
 
     context["include_indexes"] = include_indexes
 
@@ -223,7 +704,23 @@ def __CreateContext(context, plugin):
 
 # ----------------------------------------------------------------------
 def __Invoke(code_generator, invoke_reason, context, status_stream, verbose_stream, verbose, plugin):
-    elements = pickle.loads(context["pickled_elements"])
+    elements = plugin.GetContextElements(
+        context,
+        remove=True,
+    )
+    if elements is None:
+        # The elements are no longer available (this will happen if the context was
+        # created by a different process); parse them again.
+        elements = ParseFiles(
+            context["inputs"],
+            plugin,
+            context["filter_unsupported_extensions"],
+            context["filter_unsupported_attributes"],
+            cache=_memory_parse_cache,
+        )
+
+        if CalculateFingerprint(elements) != context["elements_fingerprint"]:
+            raise Exception("The input has changed since the context was created")
 
     return plugin.Generate(
         code_generator,
@@ -0,0 +1,269 @@
+# ----------------------------------------------------------------------
+# |
+# |  SimpleSchemaGeneratorClient.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2022-03-21 08:41:19
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2022
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Forwards commands to a SimpleSchemaGenerator server (started via `SimpleSchemaGenerator.py Serve`).
+
+This script intentionally avoids importing plugins and parsing functionality so that it
+starts quickly; all of the work is done by the server. Commands are processed locally
+when a server isn't running.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+
+import CommonEnvironment
+from CommonEnvironment.CallOnExit import CallOnExit
+from CommonEnvironment import CommandLine
+
+# ----------------------------------------------------------------------
+_script_fullpath                            = CommonEnvironment.ThisFullpath()
+_script_dir, _script_name                   = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+SOCKET_PATH_ENVIRONMENT_VARIABLE            = "SIMPLE_SCHEMA_GENERATOR_SOCKET"
+
+# ----------------------------------------------------------------------
+def GetSocketPath():
+    return os.getenv(SOCKET_PATH_ENVIRONMENT_VARIABLE) or os.path.join(tempfile.gettempdir(), "SimpleSchemaGenerator.socket")
+
+
+# ----------------------------------------------------------------------
+@CommandLine.EntryPoint(
+    plugin=CommandLine.EntryPoint.Parameter("Name of plugin used for generation"),
+    additional_plugin=CommandLine.EntryPoint.Parameter(
+        "Name of additional plugins used for generation; the input is parsed once and the plugins are invoked in order. The plugin name is appended to the output data filename prefix when multiple plugins are provided",
+    ),
+    output_name=CommandLine.EntryPoint.Parameter("Output name used during generation; the way in which this value impacts generated output varies from plugin to plugin"),
+    output_dir=CommandLine.EntryPoint.Parameter("Output directory used during generation; the way in which this value impacts generated output varies from plugin to plugin"),
+    input=CommandLine.EntryPoint.Parameter("SimpleSchema input filename or a directory containing SimpleSchema files"),
+    include=CommandLine.EntryPoint.Parameter("Elements names to explicitly include; other elements are ignored"),
+    exclude=CommandLine.EntryPoint.Parameter("Element names to explicitly exclude; other elements are processed"),
+    output_data_filename_prefix=CommandLine.EntryPoint.Parameter(
+        "Prefix used by the code generation implementation; provide this value to generated content from multiple plugins in the same output directory",
+    ),
+    filter_unsupported_extensions=CommandLine.EntryPoint.Parameter("Ignore extensions that aren't supported; by default, unsupported extensions will generate an error"),
+    filter_unsupported_attributes=CommandLine.EntryPoint.Parameter("Ignore element attributes that aren't supported; by default, unsupported attributes will generate an error"),
+    plugin_arg=CommandLine.EntryPoint.Parameter("Argument passes directly to the plugin"),
+    parse_cache_dir=CommandLine.EntryPoint.Parameter(
+        "Directory used to cache parsed SimpleSchema content; inputs (and their includes) that haven't changed since the last invocation are loaded from the cache rather than parsed",
+    ),
+    max_parse_workers=CommandLine.EntryPoint.Parameter("Lex and parse input files in a pool of this many processes; by default, files are parsed serially"),
+    force=CommandLine.EntryPoint.Parameter("Force generation"),
+    verbose=CommandLine.EntryPoint.Parameter("Generate verbose output during generation"),
+)
+@CommandLine.Constraints(
+    # The plugin name is validated by the server, as enumerating the available plugins
+    # requires importing them.
+    plugin=CommandLine.StringTypeInfo(),
+    additional_plugin=CommandLine.StringTypeInfo(
+        arity="*",
+    ),
+    output_name=CommandLine.StringTypeInfo(),
+    output_dir=CommandLine.DirectoryTypeInfo(
+        ensure_exists=False,
+    ),
+    input=CommandLine.FilenameTypeInfo(
+        match_any=True,
+        arity="+",
+    ),
+    include=CommandLine.StringTypeInfo(
+        arity="*",
+    ),
+    exclude=CommandLine.StringTypeInfo(
+        arity="*",
+    ),
+    output_data_filename_prefix=CommandLine.StringTypeInfo(
+        arity="?",
+    ),
+    plugin_arg=CommandLine.DictTypeInfo(
+        require_exact_match=False,
+        arity="*",
+    ),
+    parse_cache_dir=CommandLine.DirectoryTypeInfo(
+        ensure_exists=False,
+        arity="?",
+    ),
+    max_parse_workers=CommandLine.IntTypeInfo(
+        min=1,
+        arity="?",
+    ),
+    output_stream=None,
+)
+def Generate(
+    plugin,
+    output_name,
+    output_dir,
+    input,
+    include=None,
+    exclude=None,
+    output_data_filename_prefix=None,
+    additional_plugin=None,
+    filter_unsupported_extensions=False,
+    filter_unsupported_attributes=False,
+    plugin_arg=None,
+    parse_cache_dir=None,
+    max_parse_workers=None,
+    force=False,
+    output_stream=sys.stdout,
+    verbose=False,
+):
+    """Generates content for the given SimpleSchema(s) using the named plugin"""
+
+    return _Invoke(
+        "Generate",
+        {
+            "plugin": plugin,
+            "output_name": output_name,
+            "output_dir": os.path.abspath(output_dir),
+            "input": [os.path.abspath(filename) for filename in input],
+            "include": include,
+            "exclude": exclude,
+            "output_data_filename_prefix": output_data_filename_prefix,
+            "additional_plugin": additional_plugin,
+            "filter_unsupported_extensions": filter_unsupported_extensions,
+            "filter_unsupported_attributes": filter_unsupported_attributes,
+            "plugin_arg": plugin_arg,
+            "parse_cache_dir": os.path.abspath(parse_cache_dir) if parse_cache_dir else None,
+            "max_parse_workers": max_parse_workers,
+            "force": force,
+            "verbose": verbose,
+        },
+        output_stream,
+    )
+
+
+# ----------------------------------------------------------------------
+@CommandLine.EntryPoint(
+    output_dir=CommandLine.EntryPoint.Parameter("Output directory previously generated"),
+)
+@CommandLine.Constraints(
+    output_dir=CommandLine.DirectoryTypeInfo(),
+    output_stream=None,
+)
+def Clean(
+    output_dir,
+    output_stream=sys.stdout,
+):
+    """Cleans content previously generated"""
+
+    return _Invoke(
+        "Clean",
+        {
+            "output_dir": os.path.abspath(output_dir),
+        },
+        output_stream,
+    )
+
+
+# ----------------------------------------------------------------------
+@CommandLine.EntryPoint
+@CommandLine.Constraints(
+    output_stream=None,
+)
+def Shutdown(
+    output_stream=sys.stdout,
+):
+    """Shuts down a running server"""
+
+    return _Invoke(
+        "Shutdown",
+        {},
+        output_stream,
+        process_locally_if_necessary=False,
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Invoke(
+    command,
+    args,
+    output_stream,
+    process_locally_if_necessary=True,
+):
+    connection = None
+
+    try:
+        # AF_UNIX isn't available on all platforms
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(GetSocketPath())
+    except (AttributeError, IOError, OSError):
+        if connection is not None:
+            connection.close()
+
+        if not process_locally_if_necessary:
+            output_stream.write("A SimpleSchemaGenerator server is not running at '{}'.\n".format(GetSocketPath()))
+            return -1
+
+        return _InvokeLocally(command, args, output_stream)
+
+    with CallOnExit(connection.close):
+        with connection.makefile("rwb") as f:
+            f.write(
+                (
+                    json.dumps(
+                        {
+                            "command": command,
+                            "cwd": os.getcwd(),
+                            "args": args,
+                        },
+                    )
+                    + "\n"
+                ).encode("utf-8"),
+            )
+            f.flush()
+
+            for line in f:
+                message = json.loads(line.decode("utf-8"))
+
+                if "output" in message:
+                    output_stream.write(message["output"])
+                elif "error" in message:
+                    output_stream.write("ERROR: {}\n".format(message["error"]))
+                    return -1
+                elif "result" in message:
+                    return message["result"]
+                else:
+                    assert False, message
+
+    output_stream.write("ERROR: The connection was closed before a result was received.\n")
+    return -1
+
+
+# ----------------------------------------------------------------------
+def _InvokeLocally(command, args, output_stream):
+    sys.path.insert(0, _script_dir)
+    with CallOnExit(lambda: sys.path.pop(0)):
+        import SimpleSchemaGenerator                                        # <Unable to import> pylint: disable = E0401
+
+    return getattr(SimpleSchemaGenerator, command)(
+        output_stream=output_stream,
+        **args
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        sys.exit(CommandLine.Main())
+    except KeyboardInterrupt:
+        pass